@@ -0,0 +1,36 @@
+from utilities.model_generator import COLUMN_NAMES
+from utilities.model_generator import clean_df
+from synthetic import generate_raw_df
+import argparse
+import time
+
+
+def time_cleaning(rows, repeats):
+    df = generate_raw_df(rows).rename(columns=COLUMN_NAMES)
+
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        clean_df(df)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="time clean_df across row counts")
+    parser.add_argument("--rows", type=int, nargs="+", default=ROWS)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    print(f"{'rows':>12} {'seconds':>10} {'ns/row':>10}")
+    for rows in arguments.rows:
+        seconds = time_cleaning(rows, arguments.repeats)
+        print(f"{rows:>12,} {seconds:>10.4f} {seconds / rows * 1e9:>10.1f}")
+
+
+ROWS = [10_000, 100_000, 1_000_000]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import subprocess
+import statistics
+import argparse
+import sys
+
+
+def time_cold_import(statement, repeats):
+    program = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    timings = [
+        float(subprocess.run(
+            [sys.executable, "-c", program],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout)
+        for _ in range(repeats)
+    ]
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="time cold imports against a budget")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=BUDGET)
+    arguments = parser.parse_args()
+
+    print(f"{'seconds':>8}  statement")
+    timings = {}
+    for statement in STATEMENTS:
+        timings[statement] = time_cold_import(statement, arguments.repeats)
+        print(f"{timings[statement]:>8.3f}  {statement}")
+
+    seconds = timings[BUDGETED_STATEMENT]
+    if seconds > arguments.budget:
+        print(f"over budget: {seconds:.3f}s > {arguments.budget:.3f}s")
+        sys.exit(1)
+
+
+BUDGET = 0.75
+BUDGETED_STATEMENT = "from utilities.error_calculator import ErrorCalculator"
+
+
+STATEMENTS = [
+    BUDGETED_STATEMENT,
+    "from utilities.plotter import Plotter",
+    "from utilities.influence_calculator import InfluenceCalculator",
+    "from utilities.model_generator import create_model",
+]
+
+
+if __name__ == "__main__":
+    main()
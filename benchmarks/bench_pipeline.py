@@ -0,0 +1,174 @@
+from utilities.influence_calculator import InfluenceCalculator
+from utilities.error_calculator import ErrorCalculator
+from utilities import model_generator
+from synthetic import generate_raw_df
+import contextlib
+import tracemalloc
+import tempfile
+import platform
+import argparse
+import pandas as pd
+import numpy as np
+import json
+import time
+import sys
+import io
+import os
+
+
+def run_stages(path):
+    df = model_generator.read_in_df(path)
+    cleaned = model_generator.clean_df(df)
+    normalized = model_generator.normalize_data(cleaned)
+    model = model_generator.create_model(normalized, FEATURES)
+    y = normalized["salary"].to_numpy()
+    y_hat = model.fittedvalues.to_numpy()
+
+    return {
+        "read_in_df": (model_generator.read_in_df, (path,)),
+        "clean_df": (model_generator.clean_df, (df,)),
+        "normalize_data": (model_generator.normalize_data, (cleaned,)),
+        "create_model": (model_generator.create_model, (normalized, FEATURES)),
+        "error_summary": (_get_error_summary, (y, y_hat)),
+        "cooks_distance": (_get_cooks_distance, (model,)),
+    }
+
+
+def measure(function, arguments, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(*arguments)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    function(*arguments)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(timings), peak
+
+
+def benchmark(rows, repeats, seed):
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "salary_raw.csv")
+        generate_raw_df(rows, seed).to_csv(path, index=False)
+
+        for stage, (function, arguments) in run_stages(path).items():
+            seconds, peak = measure(function, arguments, repeats)
+            results.append({
+                "rows": rows,
+                "stage": stage,
+                "seconds": seconds,
+                "peak_bytes": peak,
+            })
+    return results
+
+
+def compare(results, baseline, threshold, memory_threshold):
+    expected = {(entry["rows"], entry["stage"]): entry for entry in baseline["results"]}
+
+    regressions = []
+    for entry in results:
+        reference = expected.get((entry["rows"], entry["stage"]))
+        if reference is None:
+            continue
+
+        slower = entry["seconds"] > reference["seconds"] * threshold + NOISE_FLOOR
+        larger = entry["peak_bytes"] > reference["peak_bytes"] * memory_threshold + MEMORY_NOISE_FLOOR
+        if slower or larger:
+            regressions.append((entry, reference))
+
+    return regressions
+
+
+def get_metadata(repeats, seed):
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "repeats": repeats,
+        "seed": seed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="time and profile each pipeline stage")
+    parser.add_argument("--rows", type=int, nargs="+", default=ROWS)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--memory-threshold", type=float, default=MEMORY_THRESHOLD)
+    arguments = parser.parse_args()
+
+    print(f"{'rows':>12} {'stage':>16} {'seconds':>10} {'ns/row':>10} {'peak MiB':>10}")
+    results = []
+    for rows in arguments.rows:
+        for entry in benchmark(rows, arguments.repeats, arguments.seed):
+            results.append(entry)
+            print(
+                f"{rows:>12,} {entry['stage']:>16} {entry['seconds']:>10.4f} "
+                f"{entry['seconds'] / rows * 1e9:>10.1f} {entry['peak_bytes'] / 2 ** 20:>10.1f}"
+            )
+
+    report = {"metadata": get_metadata(arguments.repeats, arguments.seed), "results": results}
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if arguments.baseline is None:
+        return
+
+    with open(arguments.baseline) as file:
+        baseline = json.load(file)
+
+    regressions = compare(results, baseline, arguments.threshold, arguments.memory_threshold)
+    for entry, reference in regressions:
+        print(
+            f"regression: {entry['stage']} at {entry['rows']:,} rows took "
+            f"{entry['seconds']:.4f}s (baseline {reference['seconds']:.4f}s) and peaked at "
+            f"{entry['peak_bytes'] / 2 ** 20:.1f} MiB (baseline {reference['peak_bytes'] / 2 ** 20:.1f} MiB)"
+        )
+    if regressions:
+        sys.exit(1)
+
+
+def _get_error_summary(y, y_hat):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ErrorCalculator(y, y_hat).error_summary()
+
+
+def _get_cooks_distance(model):
+    return InfluenceCalculator(model).cooks_distance()
+
+
+ROWS = [1_000, 10_000, 100_000]
+THRESHOLD = 1.25
+MEMORY_THRESHOLD = 1.10
+NOISE_FLOOR = 0.005
+MEMORY_NOISE_FLOOR = 1 << 20
+
+
+FEATURES = [
+    "prior_experience_original",
+    "years_in_field",
+    "years_at_rank",
+    "market_value",
+    "has_degree",
+    "has_other_qualification",
+    "employee_position",
+    "is_male",
+    "years_absent",
+    "engineering_department",
+    "finance_department",
+    "marketing_department",
+]
+
+
+if __name__ == "__main__":
+    main()
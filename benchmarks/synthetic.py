@@ -0,0 +1,27 @@
+import pandas as pd
+import numpy as np
+
+
+def generate_raw_df(rows, seed=0):
+    rng = np.random.default_rng(seed)
+
+    years_in_field = rng.integers(0, 42, size=rows)
+    df = pd.DataFrame({
+        "salary": rng.normal(50_000, 12_500, size=rows).round(),
+        "exprior": rng.poisson(3, size=rows),
+        "yearsworked": years_in_field,
+        "yearsrank": (years_in_field * rng.uniform(0, 0.7, size=rows)).astype(int),
+        "market": rng.normal(0.95, 0.15, size=rows).round(2),
+        "degree": rng.binomial(1, 0.96, size=rows),
+        "otherqual": rng.binomial(1, 0.05, size=rows),
+        "position": rng.integers(1, 4, size=rows),
+        "male": rng.binomial(1, 0.75, size=rows),
+        "Field": rng.integers(1, 5, size=rows),
+        "yearsabs": rng.geometric(0.15, size=rows) - 1,
+    })
+    df.loc[rng.random(rows) < MISSING_SALARY_RATE, "salary"] = np.nan
+
+    return df
+
+
+MISSING_SALARY_RATE = 0.002
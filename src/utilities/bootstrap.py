@@ -0,0 +1,97 @@
+from utilities.validator import check_for_design_matrix_validity
+from utilities.parallel import read_shared_arrays
+from utilities.parallel import map_with_executor
+from utilities.parallel import get_shard_sizes
+from utilities.parallel import share_arrays
+from utilities.parallel import get_names
+import pandas as pd
+import numpy as np
+
+
+class Bootstrapper:
+
+    def __init__(self, X, y, names=None):
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        check_for_design_matrix_validity(X, y)
+        self.X = X
+        self.y = y
+        self.names = get_names(names, X.shape[1])
+
+    @classmethod
+    def from_model(cls, model):
+        return cls(model.model.exog, model.model.endog, model.model.exog_names)
+
+    def resample(self, replicates=None, seed=None, executor=None, max_workers=None):
+        replicates = REPLICATES if replicates is None else replicates
+        shard_sizes = get_shard_sizes(replicates, self.y.size, SHARD_SIZE, SHARD_ELEMENTS)
+        seeds = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+
+        # process workers read X and y from shared memory, so each task
+        # carries only its handle, size and seed
+        with share_arrays({"X": self.X, "y": self.y}, executor) as arrays:
+            arguments = [(arrays, size, shard_seed) for size, shard_seed in zip(shard_sizes, seeds)]
+            shards = map_with_executor(_resample_shard, arguments, executor, max_workers)
+
+        params = np.concatenate([shard_params for shard_params, _ in shards])
+        mse = np.concatenate([shard_mse for _, shard_mse in shards])
+        return BootstrapResults(params, mse, self.names)
+
+
+class BootstrapResults:
+
+    def __init__(self, params, mse, names):
+        self.params = pd.DataFrame(params, columns=names)
+        self.mse = pd.Series(mse, name="mse")
+        self.rmse = pd.Series(np.sqrt(mse), name="rmse")
+
+    def get_standard_errors(self):
+        return self.get_replicates().std(ddof=1)
+
+    def get_confidence_intervals(self, alpha=None):
+        alpha = ALPHA if alpha is None else alpha
+        replicates = self.get_replicates()
+        intervals = replicates.quantile([alpha / 2, 1 - alpha / 2]).T
+        intervals.columns = ["lower", "upper"]
+        return intervals
+
+    def get_replicates(self):
+        return self.params.assign(mse=self.mse, rmse=self.rmse)
+
+
+def bootstrap_model(model, replicates=None, seed=None, executor=None, max_workers=None):
+    bootstrapper = Bootstrapper.from_model(model)
+    return bootstrapper.resample(replicates, seed, executor, max_workers)
+
+
+def _resample_shard(arrays, replicates, seed):
+    arrays = read_shared_arrays(arrays)
+    X, y = arrays["X"], arrays["y"]
+    observations = y.size
+    rng = np.random.default_rng(seed)
+
+    # each replicate is drawn directly as row counts, so the replicate fit
+    # is least squares weighted by how often a row was drawn
+    probabilities = np.full(observations, 1 / observations)
+    weights = rng.multinomial(observations, probabilities, size=replicates).astype(np.float64)
+
+    gram = np.einsum("ri,ij,ik->rjk", weights, X, X, optimize=True)
+    moments = weights @ (X * y[:, None])
+    params = _solve_stack(gram, moments)
+
+    residuals = y - params @ X.T
+    mse = np.einsum("ri,ri->r", weights, residuals ** 2) / observations
+    return params, mse
+
+
+def _solve_stack(gram, moments):
+    try:
+        return np.linalg.solve(gram, moments[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        return (np.linalg.pinv(gram, hermitian=True) @ moments[..., None])[..., 0]
+
+
+REPLICATES = 1000
+SHARD_SIZE = 250
+SHARD_ELEMENTS = 2 ** 20
+ALPHA = 0.05
@@ -0,0 +1,113 @@
+from utilities.model_generator import DISCRETE
+import pandas as pd
+import numpy as np
+
+
+class ColumnStore:
+
+    def __init__(self, columns, rows, index=None):
+        self.columns = dict(columns)
+        self.rows = rows
+        self.index = pd.RangeIndex(rows) if index is None else index
+
+    @classmethod
+    def from_df(cls, df):
+        columns = {name: _compress(name, df[name]) for name in df.columns}
+        return cls(columns, len(df), df.index)
+
+    def __len__(self):
+        return self.rows
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return pd.Series(self.get_column(key), index=self.index, name=key)
+        return self.get_frame(key)
+
+    def get_column(self, name, dtype=np.float64):
+        kind, values = self.columns[name]
+        if kind == "bits":
+            values = np.unpackbits(values, count=self.rows)
+        return values if dtype is None else values.astype(dtype)
+
+    def get_frame(self, names=None, dtype=np.float64):
+        names = list(self.columns) if names is None else list(names)
+        return pd.DataFrame(
+            {name: self.get_column(name, dtype) for name in names},
+            index=self.index,
+        )
+
+    def get_design_matrix(self, features, dtype=np.float64):
+        X = np.empty((self.rows, len(features) + 1), dtype=dtype)
+        X[:, 0] = 1
+        for position, name in enumerate(features, 1):
+            X[:, position] = self.get_column(name, dtype)
+        return X
+
+    def get_kinds(self):
+        return pd.Series({name: kind for name, (kind, _) in self.columns.items()})
+
+    def memory_usage(self):
+        return pd.Series(
+            {name: values.nbytes for name, (_, values) in self.columns.items()},
+            name="bytes",
+        )
+
+    @property
+    def nbytes(self):
+        return int(self.memory_usage().sum())
+
+
+def _compress(name, series):
+    values = series.to_numpy()
+
+    if not _is_numeric(values):
+        raise TypeError(f"expected a numeric column, got {values.dtype} for {name!r}")
+
+    if name in DISCRETE:
+        return "float32", values.astype(np.float32)
+
+    if not _is_integral(values):
+        return "float64", values.astype(np.float64)
+
+    if _is_binary(values):
+        return "bits", np.packbits(values.astype(bool))
+
+    if _fits(values, np.uint8):
+        return "codes", values.astype(np.uint8)
+
+    for dtype in INTEGER_DTYPES:
+        if _fits(values, dtype):
+            return np.dtype(dtype).name, values.astype(dtype)
+
+    return "float64", values.astype(np.float64)
+
+
+def _is_numeric(values):
+    return values.dtype == bool or np.issubdtype(values.dtype, np.number)
+
+
+def _is_integral(values):
+    if values.dtype == bool or np.issubdtype(values.dtype, np.integer):
+        return True
+    with np.errstate(invalid="ignore"):
+        return bool(np.all(np.isfinite(values) & (values == np.round(values))))
+
+
+def _is_binary(values):
+    return bool(np.all((values == 0) | (values == 1)))
+
+
+def _fits(values, dtype):
+    if values.dtype == bool:
+        return True
+    info = np.iinfo(dtype)
+    if np.issubdtype(values.dtype, np.integer):
+        return bool(np.all((values >= info.min) & (values <= info.max)))
+    # float bounds round info.max up, so the upper limit is exclusive
+    return bool(np.all((values >= info.min) & (values < float(info.max) + 1)))
+
+
+INTEGER_DTYPES = [np.int32, np.int64, np.uint64]
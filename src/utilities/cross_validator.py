@@ -0,0 +1,63 @@
+from utilities.influence_calculator import _get_pseudo_inverse_decomposition
+from utilities.validator import check_for_design_matrix_validity
+import numpy as np
+
+
+class CrossValidator:
+
+    def __init__(self, X, y):
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        check_for_design_matrix_validity(X, y)
+        self.X = X
+        self.y = y
+        # an orthonormal basis of the column space only, so rank-deficient
+        # designs such as a full set of dummies project as pinv would
+        self.q, _ = _get_pseudo_inverse_decomposition(X)
+        self.residuals = y - self.q @ (self.q.T @ y)
+        self.leverage = np.einsum("ij,ij->i", self.q, self.q)
+
+    def get_loo_residuals(self):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.residuals / (1 - self.leverage)
+
+    def get_loo_predictions(self):
+        return self.y - self.get_loo_residuals()
+
+    def get_press(self):
+        loo_residuals = self.get_loo_residuals()
+        return np.sum(loo_residuals ** 2)
+
+    def get_kfold_residuals(self, k, shuffle=False, seed=None):
+        kfold_residuals = np.empty_like(self.y)
+
+        for fold in self.get_folds(k, shuffle, seed):
+            kfold_residuals[fold] = self._get_held_out_residuals(fold)
+
+        return kfold_residuals
+
+    def get_kfold_predictions(self, k, shuffle=False, seed=None):
+        return self.y - self.get_kfold_residuals(k, shuffle, seed)
+
+    def get_kfold_mse(self, k, shuffle=False, seed=None):
+        kfold_residuals = self.get_kfold_residuals(k, shuffle, seed)
+        return np.mean(kfold_residuals ** 2)
+
+    def get_folds(self, k, shuffle=False, seed=None):
+        observations = self.y.size
+        if not 2 <= k <= observations:
+            raise ValueError(f"expected k between 2 and {observations}")
+
+        indices = np.arange(observations)
+        if shuffle:
+            np.random.default_rng(seed).shuffle(indices)
+
+        return np.array_split(indices, k)
+
+    def _get_held_out_residuals(self, fold):
+        # Removing the fold's rows is a rank-k downdate of X'X = R'R;
+        # by Woodbury the held-out residuals are (I - Q_f Q_f')^-1 e_f,
+        # so only a fold-sized system is solved, never a refit
+        q_fold = self.q[fold]
+        downdate = np.eye(fold.size) - q_fold @ q_fold.T
+        return np.linalg.solve(downdate, self.residuals[fold])
@@ -0,0 +1,161 @@
+from utilities.validator import check_for_design_matrix_validity
+import pandas as pd
+import numpy as np
+import warnings
+
+
+class ElasticNetPath:
+
+    def __init__(self, X, y, names=None, l1_ratio=1.0, standardize=True):
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        check_for_design_matrix_validity(X, y)
+
+        if not 0 <= l1_ratio <= 1:
+            raise ValueError("expected an l1_ratio between 0 and 1")
+
+        self.names = [f"x{index}" for index in range(X.shape[1])] if names is None else list(names)
+        self.l1_ratio = l1_ratio
+        self.observations = y.size
+
+        # the intercept is left unpenalised by centring, and each column is
+        # optionally put on unit variance so one lambda treats all alike
+        self.x_mean = X.mean(axis=0)
+        self.y_mean = y.mean()
+        centred = X - self.x_mean
+        self.x_scale = centred.std(axis=0) if standardize else np.ones(X.shape[1])
+        self.x_scale[self.x_scale == 0] = 1
+        centred /= self.x_scale
+
+        self.gram = centred.T @ centred / self.observations
+        self.covariance = centred.T @ (y - self.y_mean) / self.observations
+
+    @classmethod
+    def from_df(cls, df, features, target="salary", l1_ratio=1.0, standardize=True):
+        X = df[list(features)].to_numpy(dtype=np.float64)
+        return cls(X, df[target].to_numpy(dtype=np.float64), features, l1_ratio, standardize)
+
+    def get_lambda_max(self):
+        return np.max(np.abs(self.covariance)) / max(self.l1_ratio, RIDGE_L1_RATIO)
+
+    def get_lambdas(self, n_lambdas=None, eps=None):
+        n_lambdas = N_LAMBDAS if n_lambdas is None else n_lambdas
+        eps = EPS if eps is None else eps
+        lambda_max = self.get_lambda_max()
+        return np.geomspace(lambda_max, lambda_max * eps, n_lambdas)
+
+    def fit(self, lambdas=None, tol=None, max_iter=None):
+        if lambdas is None:
+            lambdas = self.get_lambdas()
+        lambdas = np.sort(np.asarray(lambdas, dtype=np.float64))[::-1]
+        tol = TOL if tol is None else tol
+        max_iter = MAX_ITER if max_iter is None else max_iter
+
+        features = self.covariance.size
+        coefs = np.zeros((lambdas.size, features))
+        iterations = np.zeros(lambdas.size, dtype=np.int64)
+
+        beta = np.zeros(features)
+        gram_beta = np.zeros(features)
+        previous_lambda = self.get_lambda_max()
+
+        for index, penalty in enumerate(lambdas):
+            l1_penalty = penalty * self.l1_ratio
+            l2_penalty = penalty * (1 - self.l1_ratio)
+
+            # sequential strong rule: predictors far from the l1 boundary at
+            # the previous solution are very unlikely to enter at this lambda
+            gradient = np.abs(self.covariance - gram_beta)
+            strong = (gradient >= self.l1_ratio * (2 * penalty - previous_lambda)) | (beta != 0)
+
+            while True:
+                iterations[index] += self._descend(
+                    np.flatnonzero(strong), beta, gram_beta, l1_penalty, l2_penalty, tol, max_iter
+                )
+
+                # any screened-out predictor breaking the KKT conditions joins
+                # the working set and the descent is repeated
+                violations = ~strong & (np.abs(self.covariance - gram_beta) > l1_penalty * (1 + KKT_SLACK))
+                if not violations.any():
+                    break
+                strong |= violations
+
+            coefs[index] = beta
+            previous_lambda = penalty
+
+        return ElasticNetResults(self, lambdas, coefs, iterations)
+
+    def _descend(self, working_set, beta, gram_beta, l1_penalty, l2_penalty, tol, max_iter):
+        diagonal = np.diag(self.gram)
+        for iteration in range(1, max_iter + 1):
+            largest_change = 0.0
+            for feature in working_set:
+                residual_covariance = self.covariance[feature] - gram_beta[feature]
+                partial = residual_covariance + diagonal[feature] * beta[feature]
+                updated = _soft_threshold(partial, l1_penalty) / (diagonal[feature] + l2_penalty)
+
+                change = updated - beta[feature]
+                if change != 0:
+                    gram_beta += self.gram[:, feature] * change
+                    beta[feature] = updated
+                    largest_change = max(largest_change, abs(change) * np.sqrt(diagonal[feature]))
+
+            if largest_change < tol:
+                return iteration
+
+        from statsmodels.tools.sm_exceptions import ConvergenceWarning
+
+        warnings.warn(
+            f"coordinate descent did not converge to tol={tol} in {max_iter} iterations",
+            ConvergenceWarning,
+        )
+        return max_iter
+
+
+class ElasticNetResults:
+
+    def __init__(self, path, lambdas, coefs, iterations):
+        self.lambdas = lambdas
+        self.names = path.names
+        self.iterations = iterations
+        self.coefs = coefs / path.x_scale
+        self.intercepts = path.y_mean - self.coefs @ path.x_mean
+
+    def get_coefficients(self):
+        df = pd.DataFrame(self.coefs, columns=self.names)
+        df.insert(0, "const", self.intercepts)
+        df.index = pd.Index(self.lambdas, name="lambda")
+        return df
+
+    def get_degrees_of_freedom(self):
+        return np.count_nonzero(self.coefs, axis=1)
+
+    def get_model_names(self):
+        return [f"lambda={penalty:.4g}" for penalty in self.lambdas]
+
+    def predict(self, X, index=None):
+        X = np.asarray(X, dtype=np.float64)
+        if index is None:
+            return self.coefs @ X.T + self.intercepts[:, None]
+        return X @ self.coefs[index] + self.intercepts[index]
+
+
+def fit_elastic_net_path(df, features, target="salary", l1_ratio=1.0, lambdas=None, standardize=True):
+    path = ElasticNetPath.from_df(df, features, target, l1_ratio, standardize)
+    return path.fit(lambdas)
+
+
+def _soft_threshold(value, threshold):
+    if value > threshold:
+        return value - threshold
+    if value < -threshold:
+        return value + threshold
+    return 0.0
+
+
+N_LAMBDAS = 100
+EPS = 1e-3
+TOL = 1e-7
+MAX_ITER = 1000
+KKT_SLACK = 1e-6
+RIDGE_L1_RATIO = 1e-3
@@ -1,3 +1,5 @@
+from utilities.instrumentation import instrument
+from utilities.validator import check_for_batch_array_validity
 from utilities.validator import check_for_array_validity
 from collections import OrderedDict
 import numpy as np
@@ -5,29 +7,70 @@ import json
 
 
 class ErrorCalculator:
-    def __init__(self, y, y_hat):
+    def __init__(self, y, y_hat, residuals_buffer=None):
         check_for_array_validity(y, y_hat)
-        self.y = y
-        self.y_hat = y_hat
+        self._y = y
+        self._y_hat = y_hat
+        self.residuals_buffer = residuals_buffer
+        self._cache = {}
 
-    def get_residuals(self):
-        return self.y - self.y_hat
+    @property
+    def y(self):
+        return self._y
 
-    def get_standardised_residuals(self):
-        residuals = self.get_residuals()
-        deviation = self._get_standard_residual_deviation()
-        if (residuals == 0).all():
-            return np.zeros(residuals.size)
-        return residuals / deviation
+    @y.setter
+    def y(self, y):
+        check_for_array_validity(y, self._y_hat)
+        self._y = y
+        self.invalidate()
+
+    @property
+    def y_hat(self):
+        return self._y_hat
+
+    @y_hat.setter
+    def y_hat(self, y_hat):
+        check_for_array_validity(self._y, y_hat)
+        self._y_hat = y_hat
+        self.invalidate()
+
+    def invalidate(self):
+        self._cache.clear()
+
+    def get_residuals(self, out=None):
+        residuals, _ = self._get_residual_statistics()
+        if out is None:
+            return residuals
+        np.copyto(out, residuals)
+        return out
+
+    def get_standardised_residuals(self, out=None):
+        cached = out is None
+        if cached and "standardised_residuals" in self._cache:
+            return self._cache["standardised_residuals"]
+
+        residuals, sum_of_squared_residuals = self._get_residual_statistics()
+        if cached:
+            out = np.empty(residuals.size)
+
+        if sum_of_squared_residuals == 0:
+            out.fill(0)
+        else:
+            np.divide(residuals, self._get_standard_residual_deviation(), out=out)
+
+        if cached:
+            out.flags.writeable = False
+            self._cache["standardised_residuals"] = out
+        return out
 
     def get_mse(self):
-        squared_residuals = self._get_squared_residuals()
-        sum_of_squared_residuals = squared_residuals.sum()
-        return sum_of_squared_residuals / squared_residuals.size
+        residuals, sum_of_squared_residuals = self._get_residual_statistics()
+        return sum_of_squared_residuals / residuals.size
 
     def get_rmse(self):
         return np.sqrt(self.get_mse())
 
+    @instrument
     def error_summary(self):
         standardised_residuals = self.get_standardised_residuals()
         summary = OrderedDict(
@@ -42,11 +85,80 @@ class ErrorCalculator:
         print(json.dumps(summary, indent=4), end="")
 
     def _get_standard_residual_deviation(self):
-        squared_residuals = self._get_squared_residuals()
-        numerator = squared_residuals.sum()
-        denominator = squared_residuals.size - 2
-        return np.sqrt(numerator / denominator)
+        residuals, sum_of_squared_residuals = self._get_residual_statistics()
+        denominator = residuals.size - 2
+        return np.sqrt(sum_of_squared_residuals / denominator)
+
+    def _get_residual_statistics(self):
+        if "residuals" not in self._cache:
+            residuals = np.subtract(self._y, self._y_hat, out=self.residuals_buffer)
+            if self.residuals_buffer is None:
+                residuals.flags.writeable = False
+            self._cache["residuals"] = residuals
+            self._cache["sum_of_squared_residuals"] = np.dot(residuals, residuals)
+        return self._cache["residuals"], self._cache["sum_of_squared_residuals"]
+
+
+class BatchErrorCalculator:
+    def __init__(self, y, y_hats, model_names=None):
+        check_for_batch_array_validity(y, y_hats, model_names)
+        self.y = y
+        self.y_hats = y_hats
+        self.model_names = _get_model_names(y_hats, model_names)
+        self._cache = {}
+
+    def get_residuals(self):
+        residuals, _ = self._get_residual_statistics()
+        return residuals
+
+    def get_standardised_residuals(self):
+        residuals, _ = self._get_residual_statistics()
+        deviation = self._get_standard_residual_deviation()
+        standardised_residuals = np.zeros(residuals.shape)
+        nonzero = deviation != 0
+        standardised_residuals[nonzero] = residuals[nonzero] / deviation[nonzero, None]
+        return standardised_residuals
+
+    def get_mse(self):
+        _, sum_of_squared_residuals = self._get_residual_statistics()
+        return sum_of_squared_residuals / self.y.size
+
+    def get_rmse(self):
+        return np.sqrt(self.get_mse())
+
+    @instrument
+    def error_summary(self):
+        import pandas as pd
+
+        standardised_residuals = self.get_standardised_residuals()
+        return pd.DataFrame(
+            OrderedDict(
+                {
+                    "Average Standardised Residuals": np.average(standardised_residuals, axis=1),
+                    "Minimum Standardised Residuals": standardised_residuals.min(axis=1),
+                    "Maximum Standardised Residuals": standardised_residuals.max(axis=1),
+                    "MSE": self.get_mse(),
+                    "RMSE": self.get_rmse(),
+                }
+            ),
+            index=self.model_names,
+        )
+
+    def _get_standard_residual_deviation(self):
+        _, sum_of_squared_residuals = self._get_residual_statistics()
+        denominator = self.y.size - 2
+        return np.sqrt(sum_of_squared_residuals / denominator)
+
+    def _get_residual_statistics(self):
+        if "residuals" not in self._cache:
+            residuals = self.y - self.y_hats
+            residuals.flags.writeable = False
+            self._cache["residuals"] = residuals
+            self._cache["sum_of_squared_residuals"] = np.einsum("ij,ij->i", residuals, residuals)
+        return self._cache["residuals"], self._cache["sum_of_squared_residuals"]
 
-    def _get_squared_residuals(self):
-        return self.get_residuals() ** 2
 
+def _get_model_names(y_hats, model_names):
+    if model_names is None:
+        return [f"Model {index}" for index in range(1, len(y_hats) + 1)]
+    return list(model_names)
@@ -0,0 +1,57 @@
+from scipy.linalg import solve_triangular
+import pandas as pd
+import numpy as np
+
+
+def get_variance_inflation_factors(df):
+    df = pd.DataFrame(df)
+    values = df.to_numpy(dtype=np.float64)
+
+    centered = values - values.mean(axis=0)
+    scale = np.sqrt(np.square(centered).sum(axis=0))
+    varying = scale > 0
+
+    vifs = np.full(values.shape[1], np.inf)
+    if varying.any():
+        standardized = centered[:, varying] / scale[varying]
+        correlation = standardized.T @ standardized
+        vifs[varying] = _get_inverse_diagonal(correlation)
+
+    return pd.Series(vifs, index=df.columns, name="VIF Values")
+
+
+def screen_collinear_features(df, features, threshold=None):
+    threshold = VIF_THRESHOLD if threshold is None else threshold
+    features = list(features)
+
+    while len(features) > 1:
+        vifs = get_variance_inflation_factors(df[features])
+        if vifs.max() <= threshold:
+            break
+        features.remove(vifs.idxmax())
+
+    return features
+
+
+def _get_inverse_diagonal(matrix):
+    lower = _get_stable_cholesky(matrix)
+    identity = np.eye(matrix.shape[0])
+    inverse_lower = solve_triangular(lower, identity, lower=True)
+    return np.square(inverse_lower).sum(axis=0)
+
+
+def _get_stable_cholesky(matrix):
+    jitter = 0.0
+    base_jitter = np.finfo(np.float64).eps * np.trace(matrix)
+
+    for _ in range(CHOLESKY_ATTEMPTS):
+        try:
+            return np.linalg.cholesky(matrix + jitter * np.eye(matrix.shape[0]))
+        except np.linalg.LinAlgError:
+            jitter = base_jitter if jitter == 0 else jitter * 10
+
+    raise np.linalg.LinAlgError("matrix is not positive definite")
+
+
+VIF_THRESHOLD = 10
+CHOLESKY_ATTEMPTS = 8
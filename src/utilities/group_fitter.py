@@ -0,0 +1,127 @@
+import pandas as pd
+import numpy as np
+
+
+def fit_groups(df, features, by, target="salary", chunk_size=None):
+    chunk_size = CHUNK_SIZE if chunk_size is None else chunk_size
+    features = list(features)
+    names = ["const"] + features
+    size = len(names)
+
+    codes, groups, kept = _factorize_groups(df, by)
+    # the narrowest code dtype lets the stable sort run as a radix sort
+    codes = codes.astype(np.min_scalar_type(max(len(groups) - 1, 0)))
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+
+    # rows of [1, X, y] in group order, so one augmented triangle per group
+    # carries R, Q'y and the residual norm together
+    block = np.empty((len(order), size + 1))
+    block[:, 0] = 1
+    block[:, 1:] = df[features + [target]].to_numpy(dtype=np.float64)[kept][order]
+
+    triangles = _accumulate_triangles(block, codes, len(groups), chunk_size)
+    observations = np.bincount(codes, minlength=len(groups)).astype(np.float64)
+
+    params, inverse_gram, rank = _solve_groups(triangles, observations)
+    upper = triangles[:, :size, :size]
+    unexplained = triangles[:, :size, size] - np.einsum("gij,gj->gi", upper, params)
+    ssr = triangles[:, size, size] ** 2 + np.square(unexplained).sum(axis=1)
+
+    target_values = block[:, size]
+    means = np.bincount(codes, weights=target_values, minlength=len(groups)) / observations
+    centered_tss = np.bincount(codes, weights=(target_values - means[codes]) ** 2, minlength=len(groups))
+    df_resid = observations - rank
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale = np.where(df_resid > 0, ssr / df_resid, np.nan)
+        rsquared = 1 - ssr / centered_tss
+        rsquared_adj = 1 - (observations - 1) / df_resid * (1 - rsquared)
+        bse = np.sqrt(np.diagonal(inverse_gram, axis1=1, axis2=2) * scale[:, None])
+
+    statistics = pd.DataFrame({
+        "nobs": observations.astype(np.int64),
+        "rank": rank,
+        "df_resid": df_resid.astype(np.int64),
+        "rsquared": rsquared,
+        "rsquared_adj": rsquared_adj,
+        "ssr": ssr,
+        "scale": scale,
+    }, index=groups)
+
+    return pd.concat({
+        "fit": statistics,
+        "params": pd.DataFrame(params, index=groups, columns=names),
+        "bse": pd.DataFrame(bse, index=groups, columns=names),
+    }, axis="columns")
+
+
+def _factorize_groups(df, by):
+    if isinstance(by, str) or not isinstance(by, (list, tuple)):
+        by = [by]
+
+    level_codes, levels = zip(*[
+        pd.factorize(df[key] if isinstance(key, str) else np.asarray(key), sort=True)
+        for key in by
+    ])
+
+    # missing keys are coded -1; like groupby, those rows join no group
+    kept = np.logical_and.reduce([code >= 0 for code in level_codes])
+
+    # a sorted mixed-radix code orders groups lexicographically by key
+    shape = [max(len(level), 1) for level in levels]
+    combined = np.ravel_multi_index([code[kept] for code in level_codes], shape)
+    used, codes = np.unique(combined, return_inverse=True)
+
+    key_names = [key if isinstance(key, str) else None for key in by]
+    groups = pd.MultiIndex(
+        levels=levels,
+        codes=np.unravel_index(used, shape),
+        names=key_names,
+    )
+    if len(by) == 1:
+        groups = groups.get_level_values(0)
+    return codes, groups, kept
+
+
+def _accumulate_triangles(block, codes, group_count, chunk_size):
+    size = block.shape[1]
+    triangles = np.zeros((group_count, size, size))
+
+    # rows are sorted by group, so each chunk holds contiguous runs and
+    # every run is folded into its group's triangle with one small QR
+    for start in range(0, len(block), chunk_size):
+        stop = min(start + chunk_size, len(block))
+        chunk_codes = codes[start:stop]
+        runs = np.flatnonzero(np.r_[True, chunk_codes[1:] != chunk_codes[:-1]])
+
+        for run_start, run_stop in zip(runs + start, np.r_[runs[1:] + start, stop]):
+            group = codes[run_start]
+            stacked = np.vstack([triangles[group], block[run_start:run_stop]])
+            triangles[group] = np.linalg.qr(stacked, mode="r")
+
+    return triangles
+
+
+def _solve_groups(triangles, observations):
+    size = triangles.shape[1] - 1
+    left, singular_values, right = np.linalg.svd(triangles[:, :size, :size])
+    largest = singular_values[:, :1]
+
+    # the singular values of R are those of X, so the cut-offs match
+    # statsmodels: pinv's rcond for the solve and matrix_rank for the rank
+    kept = singular_values > PINV_RCOND * largest
+    tolerance = largest * np.maximum(observations, size)[:, None] * np.finfo(np.float64).eps
+    rank = (singular_values > tolerance).sum(axis=1)
+
+    with np.errstate(divide="ignore"):
+        inverse_values = np.where(kept, 1 / singular_values, 0)
+
+    rotated = np.einsum("gji,gj->gi", left, triangles[:, :size, size]) * inverse_values
+    params = np.einsum("gji,gj->gi", right, rotated)
+    inverse_gram = np.einsum("gji,gj,gjk->gik", right, inverse_values ** 2, right)
+    return params, inverse_gram, rank
+
+
+CHUNK_SIZE = 4096
+PINV_RCOND = 1e-15
@@ -1,7 +1,7 @@
-from statsmodels.regression.linear_model import RegressionResultsWrapper
-from statsmodels.graphics.regressionplots import influence_plot
+from utilities.instrumentation import instrument
 from utilities.validator import check_model_validity
-import matplotlib.pyplot as plt
+from scipy.linalg import solve_triangular
+import numpy as np
 
 
 class InfluenceCalculator:
@@ -9,15 +9,98 @@ class InfluenceCalculator:
     def __init__(self, model):
         check_model_validity(model)
         self.model = model
+        self._cache = {}
 
+    @instrument
     def cooks_distance(self):
-        return self.model.get_influence().cooks_distance
+        from scipy import stats
 
+        if "cooks_distance" not in self._cache:
+            leverage = self.leverage()
+            parameters = self._get_exog().shape[1]
+            distance = self.internally_studentized_residuals() ** 2 / parameters
+            distance *= leverage / (1 - leverage)
+            p_values = stats.f.sf(distance, parameters, self.model.df_resid)
+            self._cache["cooks_distance"] = (distance, p_values)
+        return self._cache["cooks_distance"]
+
+    @instrument
     def leverage(self):
-        return self.model.get_influence().hat_matrix_diag
+        if "leverage" not in self._cache:
+            basis, _ = self._get_decomposition()
+            self._cache["leverage"] = np.einsum("ij,ij->i", basis, basis)
+        return self._cache["leverage"]
+
+    def internally_studentized_residuals(self):
+        residuals = self._get_residuals()
+        return residuals / np.sqrt(self.model.scale * (1 - self.leverage()))
+
+    @instrument
+    def studentized_residuals(self):
+        if "studentized_residuals" not in self._cache:
+            deviation = np.sqrt(self._get_loo_residual_variance() * (1 - self.leverage()))
+            self._cache["studentized_residuals"] = self._get_residuals() / deviation
+        return self._cache["studentized_residuals"]
+
+    @instrument
+    def dffits(self):
+        leverage = self.leverage()
+        observations, parameters = self._get_exog().shape
+        dffits = self.studentized_residuals() * np.sqrt(leverage / (1 - leverage))
+        return dffits, 2 * np.sqrt(parameters / observations)
+
+    @instrument
+    def dfbetas(self):
+        if "dfbetas" not in self._cache:
+            _, projection = self._get_decomposition()
+            loo_residuals = self._get_residuals() / (1 - self.leverage())
+            dfbetas = projection * loo_residuals[:, None]
+            dfbetas /= np.sqrt(self._get_loo_residual_variance())[:, None]
+            dfbetas /= np.sqrt(np.diag(self.model.normalized_cov_params))
+            self._cache["dfbetas"] = dfbetas
+        return self._cache["dfbetas"]
 
     def show(self, model_name):
+        from statsmodels.graphics.regressionplots import influence_plot
+        from utilities.model_generator import set_graph_globals
+        import matplotlib.pyplot as plt
+
+        set_graph_globals()
         influence_plot(self.model, size=18, plot_alpha=0.625)
         leverage = "Leverage Graph"
         plt.title(f"{model_name}\n{leverage}", fontweight="bold", fontsize=36)
         plt.show()
+
+    def _get_decomposition(self):
+        # basis spans the column space of X, so leverage is its row norms;
+        # projection = X (X'X)^+ holds each row's effect on the parameters
+        if "decomposition" not in self._cache:
+            exog = self._get_exog()
+            if self.model.model.rank == exog.shape[1]:
+                basis, upper = np.linalg.qr(exog)
+                projection = solve_triangular(upper, basis.T, lower=False).T
+            else:
+                basis, projection = _get_pseudo_inverse_decomposition(exog)
+            self._cache["decomposition"] = (basis, projection)
+        return self._cache["decomposition"]
+
+    def _get_loo_residual_variance(self):
+        residuals = self._get_residuals()
+        deleted = residuals ** 2 / (1 - self.leverage())
+        return (self.model.ssr - deleted) / (self.model.df_resid - 1)
+
+    def _get_exog(self):
+        return np.asarray(self.model.model.wexog, dtype=np.float64)
+
+    def _get_residuals(self):
+        return np.asarray(self.model.wresid, dtype=np.float64)
+
+
+def _get_pseudo_inverse_decomposition(exog):
+    left, singular_values, right = np.linalg.svd(exog, full_matrices=False)
+    tolerance = singular_values.max() * max(exog.shape) * np.finfo(np.float64).eps
+    kept = singular_values > tolerance
+
+    basis = left[:, kept]
+    projection = (basis / singular_values[kept]) @ right[kept]
+    return basis, projection
@@ -0,0 +1,222 @@
+from contextlib import contextmanager
+from collections import deque
+import tracemalloc
+import threading
+import functools
+import atexit
+import json
+import time
+import os
+
+
+def instrument(function=None, stage=None):
+    def decorate(function):
+        name = function.__qualname__ if stage is None else stage
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            recorder = _RECORDER
+            if recorder is None:
+                return function(*args, **kwargs)
+            return recorder.record(name, function, args, kwargs)
+
+        return wrapper
+
+    if function is None:
+        return decorate
+    return decorate(function)
+
+
+class Recorder:
+
+    def __init__(self, trace_memory=False, max_records=None):
+        self.trace_memory = trace_memory
+        # recent calls are kept for JSON lines, while the per-stage totals
+        # cover every call however long the process runs
+        self.records = deque(maxlen=MAX_RECORDS if max_records is None else max_records)
+        self.summary = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._frames = {}
+        self._started_tracing = False
+
+    def record(self, stage, function, args, kwargs):
+        if self.trace_memory:
+            self._enter_memory_frame()
+        start = time.perf_counter()
+
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            seconds = time.perf_counter() - start
+            peak = self._exit_memory_frame() if self.trace_memory else None
+
+        record = {
+            "stage": stage,
+            "timestamp": time.time(),
+            "seconds": seconds,
+            "peak_bytes": peak,
+            "rows": _count_rows(result, args),
+        }
+        with self._lock:
+            self.records.append(record)
+            self._summarize(record)
+        return result
+
+    def get_summary(self):
+        with self._lock:
+            return {stage: dict(values) for stage, values in self.summary.items()}
+
+    def write_json_lines(self, path):
+        with open(path, "a") as file:
+            for record in self.records:
+                file.write(json.dumps(record) + "\n")
+
+    def write_prometheus(self, path):
+        lines = []
+        summary = self.get_summary()
+        for metric, key, kind, description in PROMETHEUS_METRICS:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for stage, values in summary.items():
+                if values[key] is not None:
+                    lines.append(f'{metric}{{stage="{stage}"}} {values[key]}')
+
+        with open(path, "w") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def write(self, path):
+        if path.endswith(".prom"):
+            self.write_prometheus(path)
+        else:
+            self.write_json_lines(path)
+
+    def _summarize(self, record):
+        stage = self.summary.setdefault(record["stage"], {
+            "calls": 0,
+            "seconds": 0.0,
+            "rows": 0,
+            "peak_bytes": None,
+        })
+        stage["calls"] += 1
+        stage["seconds"] += record["seconds"]
+        stage["rows"] += record["rows"] or 0
+        if record["peak_bytes"] is not None:
+            stage["peak_bytes"] = max(stage["peak_bytes"] or 0, record["peak_bytes"])
+
+    def _enter_memory_frame(self):
+        thread = threading.get_ident()
+
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+
+            # tracemalloc's peak is process-wide, so a stage that overlaps a
+            # traced stage on another thread cannot tell its own allocations
+            # apart and records no peak rather than a shared one
+            overlapping = any(other[2] != thread for other in self._frames.values())
+
+            # fold the peak so far into every open frame before it is reset,
+            # so nested stages never hide an outer high-water mark
+            current, peak = tracemalloc.get_traced_memory()
+            for other in self._frames.values():
+                other[1] = max(other[1], peak)
+                other[3] = other[3] or overlapping
+            tracemalloc.reset_peak()
+
+            frame = [current, current, thread, overlapping]
+            self._frames[id(frame)] = frame
+
+        self._get_stack().append(frame)
+
+    def _exit_memory_frame(self):
+        frame = self._get_stack().pop()
+
+        with self._lock:
+            baseline, peak, _, overlapping = self._frames.pop(id(frame))
+            current_peak = tracemalloc.get_traced_memory()[1]
+            for other in self._frames.values():
+                other[1] = max(other[1], current_peak)
+            if not self._frames and self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+        return None if overlapping else max(peak, current_peak) - baseline
+
+    def _get_stack(self):
+        if not hasattr(self._local, "frames"):
+            self._local.frames = []
+        return self._local.frames
+
+
+def enable(trace_memory=False, max_records=None):
+    global _RECORDER
+    _RECORDER = Recorder(trace_memory, max_records)
+    return _RECORDER
+
+
+def disable():
+    global _RECORDER
+    recorder, _RECORDER = _RECORDER, None
+    return recorder
+
+
+def get_recorder():
+    return _RECORDER
+
+
+@contextmanager
+def instrumented(trace_memory=False, max_records=None):
+    global _RECORDER
+    previous = _RECORDER
+    try:
+        yield enable(trace_memory, max_records)
+    finally:
+        _RECORDER = previous
+
+
+def _count_rows(result, args):
+    candidates = [result, *args]
+    candidates += [getattr(value, name, None) for value in args for name in ROW_ATTRIBUTES]
+    for value in candidates:
+        rows = _get_row_count(value)
+        if rows is not None:
+            return rows
+    return None
+
+
+def _get_row_count(value):
+    nobs = getattr(value, "nobs", None)
+    if nobs is not None:
+        return int(nobs)
+    shape = getattr(value, "shape", None)
+    if shape:
+        return int(shape[0])
+    return None
+
+
+def _enable_from_environment():
+    path = os.environ.get(OUTPUT_VARIABLE)
+    if not path:
+        return
+    recorder = enable(os.environ.get(TRACE_MEMORY_VARIABLE) == "1")
+    atexit.register(recorder.write, path)
+
+
+OUTPUT_VARIABLE = "UTILITIES_INSTRUMENTATION"
+TRACE_MEMORY_VARIABLE = "UTILITIES_TRACE_MEMORY"
+ROW_ATTRIBUTES = ["y", "model"]
+MAX_RECORDS = 10_000
+
+
+PROMETHEUS_METRICS = [
+    ("utilities_stage_calls_total", "calls", "counter", "Calls to each instrumented stage."),
+    ("utilities_stage_seconds_total", "seconds", "counter", "Seconds spent in each stage."),
+    ("utilities_stage_rows_total", "rows", "counter", "Rows handled by each stage."),
+    ("utilities_stage_peak_bytes", "peak_bytes", "gauge", "Largest traced allocation peak."),
+]
+
+
+_RECORDER = None
+_enable_from_environment()
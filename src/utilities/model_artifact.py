@@ -0,0 +1,133 @@
+from utilities.model_generator import EMPLOYEE_POSITIONS
+from utilities.model_generator import FIELDS_OF_WORK
+from utilities.model_generator import LOG_SHIFT
+from utilities.model_generator import DISCRETE
+import numpy as np
+import os
+
+
+def export_model(model, path, statistics):
+    os.makedirs(path, exist_ok=True)
+
+    arrays = {
+        "format_version": np.array(FORMAT_VERSION),
+        "parameter_names": np.array(model.params.index, dtype=str),
+        "coefficients": np.asarray(model.params, dtype=np.float64),
+        "log_shift": np.array(LOG_SHIFT),
+        "discrete_features": np.array(DISCRETE, dtype=str),
+        "salary_median": np.array(statistics["salary_median"], dtype=np.float64),
+        "lower_bound": _get_discrete_values(statistics["lower_bound"]),
+        "upper_bound": _get_discrete_values(statistics["upper_bound"]),
+        "medians": _get_discrete_values(statistics["medians"]),
+        "field_of_work_codes": np.array(list(FIELDS_OF_WORK), dtype=np.int64),
+        "field_of_work_names": np.array(list(FIELDS_OF_WORK.values()), dtype=str),
+        "employee_position_codes": np.array(list(EMPLOYEE_POSITIONS), dtype=np.int64),
+        "employee_position_names": np.array(list(EMPLOYEE_POSITIONS.values()), dtype=str),
+    }
+
+    for name, array in arrays.items():
+        np.save(os.path.join(path, f"{name}.npy"), array, allow_pickle=False)
+
+
+def export_models(models, directory, statistics):
+    for name, model in models.items():
+        export_model(model, os.path.join(directory, _get_slug(name)), statistics)
+
+
+def load_model(path, mmap_mode="r"):
+    return ModelArtifact(path, mmap_mode)
+
+
+def load_models(directory, names, mmap_mode="r"):
+    return {
+        name: load_model(os.path.join(directory, _get_slug(name)), mmap_mode)
+        for name in names
+    }
+
+
+class ModelArtifact:
+
+    def __init__(self, path, mmap_mode="r"):
+        self.path = path
+        self.arrays = {
+            name: np.load(
+                os.path.join(path, f"{name}.npy"),
+                mmap_mode=mmap_mode,
+                allow_pickle=False,
+            )
+            for name in ARRAYS
+        }
+
+        version = int(self.arrays["format_version"])
+        if version != FORMAT_VERSION:
+            raise ValueError(f"expected artifact format {FORMAT_VERSION}, got {version}")
+
+        names = [str(name) for name in self.arrays["parameter_names"]]
+        coefficients = self.arrays["coefficients"]
+        if names and names[0] == "const":
+            self.intercept = float(coefficients[0])
+            self.features = names[1:]
+            self.coefficients = coefficients[1:]
+        else:
+            self.intercept = 0.0
+            self.features = names
+            self.coefficients = coefficients
+
+    @property
+    def log_shift(self):
+        return float(self.arrays["log_shift"])
+
+    @property
+    def statistics(self):
+        import pandas as pd
+
+        discrete = [str(name) for name in self.arrays["discrete_features"]]
+        return {
+            "salary_median": float(self.arrays["salary_median"]),
+            "lower_bound": pd.Series(self.arrays["lower_bound"], index=discrete),
+            "upper_bound": pd.Series(self.arrays["upper_bound"], index=discrete),
+            "medians": pd.Series(self.arrays["medians"], index=discrete),
+        }
+
+    @property
+    def categories(self):
+        return {
+            "field_of_work": self._get_category_map("field_of_work"),
+            "employee_position": self._get_category_map("employee_position"),
+        }
+
+    def predict(self, X):
+        return np.asarray(X, dtype=np.float64) @ self.coefficients + self.intercept
+
+    def _get_category_map(self, name):
+        codes = self.arrays[f"{name}_codes"]
+        names = self.arrays[f"{name}_names"]
+        return {int(code): str(label) for code, label in zip(codes, names)}
+
+
+def _get_slug(name):
+    return name.lower().replace(" ", "_")
+
+
+def _get_discrete_values(series):
+    return np.asarray(series[DISCRETE], dtype=np.float64)
+
+
+FORMAT_VERSION = 1
+
+
+ARRAYS = [
+    "format_version",
+    "parameter_names",
+    "coefficients",
+    "log_shift",
+    "discrete_features",
+    "salary_median",
+    "lower_bound",
+    "upper_bound",
+    "medians",
+    "field_of_work_codes",
+    "field_of_work_names",
+    "employee_position_codes",
+    "employee_position_names",
+]
@@ -1,22 +1,41 @@
-import statsmodels.api as sm
-import seaborn as sns
+from utilities.instrumentation import instrument
+from utilities.feature_selector import screen_collinear_features
+from utilities.parallel import map_with_executor
+from utilities.parallel import read_shared_frame
+from utilities.parallel import uses_processes
+from utilities.parallel import SharedFrame
 import pandas as pd
 import numpy as np
+import hashlib
+import os
 
 
-def generate_models():
+@instrument
+def generate_models(executor=None, max_workers=None):
     df = _generate_df()
-    models = _get_models(df)
+    feature_sets = generate_feature_sets()
+    return fit_models(df, feature_sets, executor, max_workers)
 
-    return {
-        "Model 1": models[0],
-        "Model 2": models[1],
-        "Model 3": models[2],
-    }
 
+@instrument
+def fit_models(df, feature_sets, executor=None, max_workers=None):
+    names = list(feature_sets)
+    features = [list(feature_sets[name]) for name in names]
+
+    if not uses_processes(executor):
+        arguments = [(df, feature_set) for feature_set in features]
+        models = map_with_executor(create_model, arguments, executor, max_workers)
+        return dict(zip(names, models))
+
+    with SharedFrame(df) as handle:
+        arguments = [(handle, feature_set) for feature_set in features]
+        models = map_with_executor(_create_shared_model, arguments, executor, max_workers)
+
+    return dict(zip(names, models))
 
-def generate_feature_sets():
-    df = _generate_df()
+
+def generate_feature_sets(vif_threshold=None, df=None):
+    df = _generate_df() if df is None else df
 
     base_features = df.columns
     non_base_features = [
@@ -46,113 +65,168 @@ def generate_feature_sets():
         "engineering_department"
     ]
 
-    return {
+    feature_sets = {
         "Model 1": model_1_features,
         "Model 2": model_2_features,
         "Model 3": model_3_features,
     }
 
+    if vif_threshold is None:
+        return feature_sets
 
-def _generate_df():
-    df = read_in_df()
-    df = clean_df(df)
-    df = normalize_data(df)
-    return df
+    return {
+        name: screen_collinear_features(df, features, vif_threshold)
+        for name, features in feature_sets.items()
+    }
 
 
-def _get_models(df):
-    model_features = generate_feature_sets()
-    model_1 = create_model(df, model_features["Model 1"])
-    model_2 = create_model(df, model_features["Model 2"])
-    model_3 = create_model(df, model_features["Model 3"])
+def _generate_df():
+    return PIPELINE.normalized()
+
 
-    return model_1, model_2, model_3
+def _create_shared_model(handle, features):
+    df = read_shared_frame(handle, features + ["salary"])
+    return create_model(df, features)
 
 
+@instrument
 def create_model(df, features):
+    import statsmodels.api as sm
+
+    X, y = create_design_matrix(df, features)
+    return sm.OLS(y, X).fit()
+
+
+@instrument
+def create_multi_target_model(df, features, targets):
+    from utilities.multi_target import fit_multi_target
+
+    return fit_multi_target(df, features, targets)
+
+
+def create_design_matrix(df, features):
+    import statsmodels.api as sm
+
     X = df[features]
     y = df["salary"]
 
     X = sm.add_constant(X)
 
-    return sm.OLS(y, X).fit()
+    return X, y
 
 
-def read_in_df():
-    df = pd.read_csv(r"../data/salary_raw.csv")
-    return df.rename(columns={
-        "exprior": "prior_experience",
-        "yearsworked": "years_in_field",
-        "yearsrank": "years_at_rank",
-        "market": "market_value",
-        "degree": "has_degree",
-        "otherqual": "has_other_qualification",
-        "position": "employee_position",
-        "male": "is_male",
-        "Field": "field_of_work",
-        "yearsabs": "years_absent",
-    })
+@instrument
+def read_in_df(path=None):
+    df = pd.read_csv(RAW_DATA_PATH if path is None else path)
+    return df.rename(columns=COLUMN_NAMES)
 
 
-def clean_df(df):
-    df = df.copy()
-    df["salary"] = df["salary"].fillna(df["salary"].median())
-    df = remove_outliers(df)
-    df = append_original_prior_experience(df)
+def read_in_chunks(path=None, chunksize=None):
+    path = RAW_DATA_PATH if path is None else path
+    chunksize = CHUNK_SIZE if chunksize is None else chunksize
+    for df in pd.read_csv(path, chunksize=chunksize):
+        yield df.rename(columns=COLUMN_NAMES)
+
+
+@instrument
+def clean_df(df, statistics=None):
+    if statistics is None:
+        statistics = get_cleaning_statistics(df)
+
+    prior_experience = df["prior_experience"]
+    df = df.assign(salary=df["salary"].fillna(statistics["salary_median"]))
+    df = remove_outliers(df, statistics)
+    df = append_original_prior_experience(df, prior_experience)
     return df
 
 
+@instrument
+def get_cleaning_statistics(df):
+    block = df[DISCRETE].to_numpy(dtype=np.float64, copy=True)
+
+    salary = block[:, DISCRETE.index("salary")]
+    salary_median = np.nanmedian(salary)
+    salary[np.isnan(salary)] = salary_median
+
+    lower_bound, upper_bound = _get_block_bounds(block)
+    medians = np.nanmedian(_mask_block(block, lower_bound, upper_bound), axis=0)
+
+    return {
+        "salary_median": salary_median,
+        "lower_bound": pd.Series(lower_bound, index=DISCRETE),
+        "upper_bound": pd.Series(upper_bound, index=DISCRETE),
+        "medians": pd.Series(medians, index=DISCRETE),
+    }
+
+
+@instrument
 def normalize_data(df):
     discrete_features = DISCRETE.copy()
     discrete_features.append("prior_experience_original")
-    df.copy()
-    df[discrete_features] = df[discrete_features].add(0.001).apply(np.log)
+    df = df.copy()
+    df[discrete_features] = df[discrete_features].add(LOG_SHIFT).apply(np.log)
     return df
 
 
 def get_outlier_bounds(df):
-    q1 = df[DISCRETE].quantile(0.25)
-    q3 = df[DISCRETE].quantile(0.75)
+    block = df[DISCRETE].to_numpy(dtype=np.float64, copy=True)
+    lower_bound, upper_bound = _get_block_bounds(block)
+    return (
+        pd.Series(lower_bound, index=DISCRETE),
+        pd.Series(upper_bound, index=DISCRETE),
+    )
+
+
+def fill_corrupt_values(df, medians=None):
+    df = df.copy()
+    block = df[DISCRETE].to_numpy(dtype=np.float64, copy=True)
+    df[DISCRETE] = _fill_block(block, medians)
+    return df
+
+
+def _get_block_bounds(block):
+    q1, q3 = np.nanquantile(block, [0.25, 0.75], axis=0)
 
     iqr = q3 - q1
     iqr_range = iqr * 1.5
 
-    lower_bound = q1 - iqr_range
-    upper_bound = q3 + iqr_range
+    return q1 - iqr_range, q3 + iqr_range
 
-    return lower_bound, upper_bound
 
+def _mask_block(block, lower_bound, upper_bound):
+    with np.errstate(invalid="ignore"):
+        outliers = ~((block > lower_bound) & (block < upper_bound))
+    block[outliers] = np.nan
+    return block
 
-def fill_corrupt_values(df):
-    df = df.copy()
-    for feat in DISCRETE:
-        df[feat] = df[feat].apply(
-            lambda x: df[feat].median() if np.isnan(x) else x
-        )
-    return df
+
+def _fill_block(block, medians=None):
+    if medians is None:
+        medians = np.nanmedian(block, axis=0)
+    else:
+        medians = np.asarray(medians[DISCRETE], dtype=np.float64)
+
+    rows, columns = np.nonzero(np.isnan(block))
+    block[rows, columns] = medians[columns]
+    return block
 
 
 def get_fields_of_work(df):
-    fields_of_work = pd.get_dummies(df["field_of_work"])
-    fields_of_work.rename(columns={
-        1: "engineering_department",
-        2: "finance_department",
-        3: "human_resources_department",
-        4: "marketing_department",
-    }, inplace=True)
+    fields_of_work = _get_dummies(df["field_of_work"], FIELDS_OF_WORK)
     return fields_of_work.drop(columns=["human_resources_department"])
 
 
 def get_employee_positions(df):
-    employee_positions = pd.get_dummies(df["employee_position"])
-    employee_positions.rename(columns={
-        1: "junior_position",
-        2: "manager_position",
-        3: "executive_position",
-    }, inplace=True)
+    employee_positions = _get_dummies(df["employee_position"], EMPLOYEE_POSITIONS)
     return employee_positions.drop(columns=["junior_position"])
 
 
+def _get_dummies(series, categories):
+    categorical = series.astype(pd.CategoricalDtype(list(categories)))
+    return pd.get_dummies(categorical).rename(columns=categories)
+
+
+@instrument
 def hot_encode(df):
     fields = get_fields_of_work(df)
     positions = get_employee_positions(df)
@@ -160,28 +234,185 @@ def hot_encode(df):
     return pd.concat([df_no_fields, fields, positions], axis="columns")
 
 
-def remove_outliers(df):
+@instrument
+def remove_outliers(df, statistics=None):
     df = df.copy()
-    lower_bound, upper_bound = get_outlier_bounds(df)
-
-    min_greater_than = df[DISCRETE] > lower_bound
-    max_less_than = df[DISCRETE] < upper_bound
-
-    df[DISCRETE] = df[DISCRETE][min_greater_than & max_less_than]
-
-    df = fill_corrupt_values(df)
+    block = df[DISCRETE].to_numpy(dtype=np.float64, copy=True)
+
+    if statistics is None:
+        lower_bound, upper_bound = _get_block_bounds(block)
+        medians = None
+    else:
+        lower_bound = statistics["lower_bound"][DISCRETE].to_numpy()
+        upper_bound = statistics["upper_bound"][DISCRETE].to_numpy()
+        medians = statistics["medians"]
+
+    block = _mask_block(block, lower_bound, upper_bound)
+    df[DISCRETE] = _fill_block(block, medians)
     df = hot_encode(df)
 
     return df
 
 
-def append_original_prior_experience(df):
-    prior_experience = pd.read_csv("../data/salary_raw.csv")[["exprior"]]
+def append_original_prior_experience(df, prior_experience):
     df = df.copy()
     df["prior_experience_original"] = prior_experience
     return df
 
 
+class DataPipeline:
+
+    def __init__(self, path=None, cache_dir=None):
+        self.path = RAW_DATA_PATH if path is None else path
+        self.cache_dir = cache_dir
+        self._stages = {}
+        self._hashes = {}
+        self._statistics = {}
+
+    def raw(self):
+        return self.get_stage("raw")
+
+    def cleaned(self):
+        return self.get_stage("cleaned")
+
+    def normalized(self):
+        return self.get_stage("normalized")
+
+    def statistics(self):
+        content_hash = self.get_content_hash()
+        if content_hash not in self._statistics:
+            self._statistics[content_hash] = get_cleaning_statistics(self.raw())
+        return self._statistics[content_hash]
+
+    def column_store(self, stage="normalized"):
+        from utilities.column_store import ColumnStore
+
+        return ColumnStore.from_df(self.get_stage(stage))
+
+    def get_stage(self, stage):
+        if stage not in STAGES:
+            raise ValueError(f"expected a stage from {list(STAGES)}")
+
+        key = (self.get_content_hash(), stage)
+        if key not in self._stages:
+            self._stages[key] = self._load_stage(*key)
+
+        return self._stages[key].copy()
+
+    def get_content_hash(self):
+        status = os.stat(self.path)
+        signature = (os.path.abspath(self.path), status.st_mtime_ns, status.st_size)
+
+        if signature not in self._hashes:
+            digest = hashlib.sha256()
+            with open(self.path, "rb") as file:
+                for block in iter(lambda: file.read(HASH_BLOCK_SIZE), b""):
+                    digest.update(block)
+            content_hash = digest.hexdigest()
+
+            # only the file's current content is ever read again, so entries
+            # for earlier signatures and hashes are dropped rather than kept
+            self._hashes = {signature: content_hash}
+            self._stages = {key: df for key, df in self._stages.items() if key[0] == content_hash}
+            self._statistics = {
+                key: statistics for key, statistics in self._statistics.items() if key == content_hash
+            }
+
+        return self._hashes[signature]
+
+    def clear(self):
+        self._stages.clear()
+        self._hashes.clear()
+        self._statistics.clear()
+
+    def _load_stage(self, content_hash, stage):
+        cache_path = self._get_cache_path(content_hash, stage)
+        if cache_path is not None and os.path.exists(cache_path):
+            return _load_df(cache_path)
+
+        df = self._build_stage(stage)
+
+        if cache_path is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            _save_df(df, cache_path)
+
+        return df
+
+    def _build_stage(self, stage):
+        if stage == "raw":
+            return read_in_df(self.path)
+
+        previous_stage, build = STAGES[stage]
+        return build(self.get_stage(previous_stage))
+
+    def _get_cache_path(self, content_hash, stage):
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"{content_hash}_{stage}.npz")
+
+
+def _save_df(df, path):
+    columns = {
+        f"column_{index}": df[column].to_numpy()
+        for index, column in enumerate(df.columns)
+    }
+    np.savez(path, columns=np.array(df.columns, dtype=str), **columns)
+
+
+def _load_df(path):
+    with np.load(path, allow_pickle=False) as arrays:
+        columns = arrays["columns"]
+        return pd.DataFrame({
+            column: arrays[f"column_{index}"]
+            for index, column in enumerate(columns)
+        })
+
+
+RAW_DATA_PATH = r"../data/salary_raw.csv"
+HASH_BLOCK_SIZE = 1 << 20
+CHUNK_SIZE = 1_000_000
+LOG_SHIFT = 0.001
+
+
+COLUMN_NAMES = {
+    "exprior": "prior_experience",
+    "yearsworked": "years_in_field",
+    "yearsrank": "years_at_rank",
+    "market": "market_value",
+    "degree": "has_degree",
+    "otherqual": "has_other_qualification",
+    "position": "employee_position",
+    "male": "is_male",
+    "Field": "field_of_work",
+    "yearsabs": "years_absent",
+}
+
+
+FIELDS_OF_WORK = {
+    1: "engineering_department",
+    2: "finance_department",
+    3: "human_resources_department",
+    4: "marketing_department",
+}
+
+
+EMPLOYEE_POSITIONS = {
+    1: "junior_position",
+    2: "manager_position",
+    3: "executive_position",
+}
+
+
+STAGES = {
+    "raw": None,
+    "cleaned": ("raw", clean_df),
+    "normalized": ("cleaned", normalize_data),
+}
+
+
+PIPELINE = DataPipeline()
+
+
 SMALL = 10
 MEDIUM = 15
 LARGE = 20
@@ -213,7 +444,13 @@ DISCRETE = [
 ]
 
 
-sns.set(rc={
+def set_graph_globals():
+    import seaborn as sns
+
+    sns.set(rc=GRAPH_GLOBALS)
+
+
+GRAPH_GLOBALS = {
     "figure.figsize": (LARGE, SMALL),
     "figure.titlesize": COLLOSAL,
     "figure.titleweight": BOLD,
@@ -226,5 +463,5 @@ sns.set(rc={
     "xtick.labelsize": LARGE,
     "ytick.labelsize": LARGE,
     "legend.fontsize": LARGE,
-})
+}
 
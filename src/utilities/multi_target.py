@@ -0,0 +1,94 @@
+from utilities.ols_accumulator import LeastSquaresResults
+from utilities.error_calculator import ErrorCalculator
+from scipy.linalg import solve_triangular
+import pandas as pd
+import numpy as np
+
+
+class MultiTargetResults:
+
+    def __init__(self, X, Y, names, targets, index=None):
+        X = np.asarray(X, dtype=np.float64)
+        Y = np.asarray(Y, dtype=np.float64)
+        self.names = list(names)
+        self.targets = list(targets)
+        self.index = pd.RangeIndex(len(X)) if index is None else index
+
+        # one R-only QR of [X Y] holds R for X and Q'Y for every target, so
+        # Q is never formed and all targets share one back substitution
+        size = X.shape[1]
+        triangle = np.linalg.qr(np.column_stack([X, Y]), mode="r")
+        upper = triangle[:size, :size]
+        diagonal = np.abs(np.diag(upper))
+        if diagonal.min() <= diagonal.max() * max(X.shape) * np.finfo(np.float64).eps:
+            raise ValueError("expected a full-rank design matrix")
+
+        projected = triangle[:size, size:]
+        params = solve_triangular(upper, projected, lower=False)
+        fitted = X @ params
+        residuals = Y - fitted
+
+        self.upper = upper
+        self.projected = projected
+        self.params = pd.DataFrame(params, index=self.names, columns=self.targets)
+        self.fittedvalues = pd.DataFrame(fitted, index=self.index, columns=self.targets)
+        self.resid = pd.DataFrame(residuals, index=self.index, columns=self.targets)
+        self.endog = pd.DataFrame(Y, index=self.index, columns=self.targets)
+        self.observations = len(X)
+        self._results = {}
+
+    def get_results(self, target):
+        if target not in self._results:
+            position = self.targets.index(target)
+            size = len(self.names)
+
+            triangle = np.zeros((size + 1, size + 1))
+            triangle[:size, :size] = self.upper
+            triangle[:size, size] = self.projected[:, position]
+            triangle[size, size] = np.linalg.norm(self.resid.iloc[:, position])
+
+            self._results[target] = LeastSquaresResults(
+                triangle,
+                triangle.T @ triangle,
+                self.observations,
+                self.names,
+            )
+        return self._results[target]
+
+    def get_error_calculator(self, target):
+        return ErrorCalculator(
+            self.endog[target].to_numpy(),
+            self.fittedvalues[target].to_numpy(),
+        )
+
+    def summary(self):
+        return pd.DataFrame({
+            target: {
+                attribute: getattr(self.get_results(target), attribute)
+                for attribute in SUMMARY_ATTRIBUTES
+            }
+            for target in self.targets
+        }).T
+
+    def get_standard_errors(self):
+        return pd.DataFrame({target: self.get_results(target).bse for target in self.targets})
+
+
+def fit_multi_target(df, features, targets):
+    X = np.column_stack([np.ones(len(df)), df[list(features)].to_numpy(dtype=np.float64)])
+    Y = df[list(targets)].to_numpy(dtype=np.float64)
+    return MultiTargetResults(X, Y, ["const"] + list(features), targets, df.index)
+
+
+SUMMARY_ATTRIBUTES = [
+    "nobs",
+    "df_resid",
+    "rsquared",
+    "rsquared_adj",
+    "ssr",
+    "scale",
+    "fvalue",
+    "f_pvalue",
+    "aic",
+    "bic",
+]
@@ -0,0 +1,161 @@
+from scipy.linalg import solve_triangular
+from scipy import stats
+import pandas as pd
+import numpy as np
+
+
+class OLSAccumulator:
+
+    def __init__(self, features, target="salary", method="gram"):
+        if method not in METHODS:
+            raise ValueError(f"expected a method from {METHODS}")
+
+        self.features = list(features)
+        self.target = target
+        self.method = method
+        self.observations = 0
+
+        size = len(self.features) + 2
+        self.factor = np.zeros((0 if method == "qr" else size, size))
+
+    def update(self, df):
+        self._accumulate(self._get_block(df), len(df))
+        return self
+
+    def remove(self, df):
+        block = self._get_block(df)
+        if self.method == "gram":
+            self.factor = self.factor - block.T @ block
+        else:
+            self.factor = _downdate_triangle(self.factor, block)
+        self.observations -= len(df)
+        return self
+
+    def merge(self, other):
+        if other.method == "gram":
+            self._accumulate_gram(other.factor)
+        else:
+            self._accumulate_triangle(other.factor)
+        self.observations += other.observations
+        return self
+
+    def get_gram(self):
+        if self.method == "gram":
+            return self.factor.copy()
+        return self.factor.T @ self.factor
+
+    def fit(self):
+        if self.method == "gram":
+            triangle = np.linalg.cholesky(self.factor).T
+        else:
+            triangle = self.factor
+
+        return LeastSquaresResults(
+            triangle,
+            self.get_gram(),
+            self.observations,
+            ["const"] + self.features,
+        )
+
+    def _get_block(self, df):
+        return np.column_stack([
+            np.ones(len(df)),
+            df[self.features].to_numpy(dtype=np.float64),
+            df[self.target].to_numpy(dtype=np.float64),
+        ])
+
+    def _accumulate(self, block, observations):
+        if self.method == "gram":
+            self._accumulate_gram(block.T @ block)
+        else:
+            self._accumulate_triangle(np.linalg.qr(block, mode="r"))
+        self.observations += observations
+
+    def _accumulate_gram(self, gram):
+        if self.method == "gram":
+            self.factor = self.factor + gram
+        else:
+            self._accumulate_triangle(np.linalg.cholesky(gram).T)
+
+    def _accumulate_triangle(self, triangle):
+        if self.method == "gram":
+            self.factor = self.factor + triangle.T @ triangle
+        else:
+            stacked = np.vstack([self.factor, triangle])
+            self.factor = np.linalg.qr(stacked, mode="r")
+
+
+class LeastSquaresResults:
+
+    def __init__(self, triangle, gram, observations, names):
+        size = len(names)
+        upper = triangle[:size, :size]
+        projected_target = triangle[:size, size]
+
+        self.nobs = observations
+        self.df_model = size - 1
+        self.df_resid = observations - size
+        self.ssr = triangle[size, size] ** 2
+
+        target_sum = gram[0, size]
+        self.centered_tss = gram[size, size] - target_sum ** 2 / observations
+        self.rsquared = 1 - self.ssr / self.centered_tss
+        self.rsquared_adj = 1 - (observations - 1) / self.df_resid * (1 - self.rsquared)
+        self.scale = self.ssr / self.df_resid
+
+        inverse_upper = solve_triangular(upper, np.eye(size), lower=False)
+        self.normalized_cov_params = pd.DataFrame(
+            inverse_upper @ inverse_upper.T,
+            index=names,
+            columns=names,
+        )
+
+        params = solve_triangular(upper, projected_target, lower=False)
+        self.params = pd.Series(params, index=names)
+        variances = np.diag(self.normalized_cov_params) * self.scale
+        self.bse = pd.Series(np.sqrt(variances), index=names)
+        self.tvalues = self.params / self.bse
+        self.pvalues = pd.Series(
+            stats.t.sf(np.abs(self.tvalues), self.df_resid) * 2,
+            index=names,
+        )
+
+        self.llf = -observations / 2 * (
+            np.log(2 * np.pi) + np.log(self.ssr / observations) + 1
+        )
+        self.aic = -2 * self.llf + 2 * size
+        self.bic = -2 * self.llf + np.log(observations) * size
+
+        explained = (self.centered_tss - self.ssr) / self.df_model if self.df_model else np.nan
+        self.fvalue = explained / self.scale
+        self.f_pvalue = stats.f.sf(self.fvalue, self.df_model, self.df_resid)
+
+    def predict(self, df):
+        features = self.params.index[1:]
+        values = np.asarray(df[features], dtype=np.float64)
+        return values @ self.params.to_numpy()[1:] + self.params.iloc[0]
+
+
+def _downdate_triangle(upper, rows):
+    # upper' upper - rows' rows = upper' (I - V V') upper with V = upper^-T rows',
+    # so the downdated factor is the Cholesky factor of I - V V' times upper
+    try:
+        projected = solve_triangular(upper, rows.T, trans="T", lower=False)
+        reduction = np.eye(upper.shape[0]) - projected @ projected.T
+        factor = np.linalg.cholesky(reduction).T
+    except np.linalg.LinAlgError:
+        raise ValueError(
+            "expected a positive-definite downdate, but removing the rows loses "
+            "rank or they were never accumulated"
+        )
+    return factor @ upper
+
+
+def fit_out_of_core(chunks, features, target="salary", method="qr"):
+    accumulator = OLSAccumulator(features, target, method)
+    for df in chunks:
+        accumulator.update(df)
+    return accumulator.fit()
+
+
+METHODS = ["gram", "qr"]
@@ -0,0 +1,117 @@
+from utilities.stream_cleaner import get_sketched_cleaning_statistics
+from utilities.quantile_sketch import TurnstileSketch
+from utilities.ols_accumulator import OLSAccumulator
+from utilities.model_generator import normalize_data
+from utilities.model_generator import DISCRETE
+from utilities.model_generator import clean_df
+import pandas as pd
+import numpy as np
+
+
+class OnlineModel:
+
+    def __init__(self, features, capacity=None, seed=None, method="qr"):
+        self.features = list(features)
+        self.accumulator = OLSAccumulator(self.features, method=method)
+
+        seeds = np.random.SeedSequence(seed).spawn(len(DISCRETE) + 1)
+        self.salaries = TurnstileSketch(capacity, seeds[0])
+        self.sketches = {
+            feat: TurnstileSketch(capacity, feat_seed)
+            for feat, feat_seed in zip(DISCRETE, seeds[1:])
+        }
+
+        # retained rows live in growable column buffers rather than one
+        # Python object per row, with their labels held in a pandas index
+        self.labels = pd.RangeIndex(0)
+        self.processed = np.empty((0, len(self.features) + 1))
+        self.raw_salaries = np.empty(0)
+        self.sketched = np.empty((0, len(DISCRETE)))
+
+    @classmethod
+    def from_df(cls, df, features, capacity=None, seed=None, method="qr"):
+        return cls(features, capacity, seed, method).add(df)
+
+    def add(self, df):
+        if not df.index.is_unique or df.index.isin(self.labels).any():
+            raise ValueError("expected row labels that are unique and not yet added")
+
+        salaries = df["salary"].to_numpy(dtype=np.float64)
+        self.salaries.insert(salaries)
+        salary_median = self.salaries.median()
+
+        filled = df[DISCRETE].to_numpy(dtype=np.float64, copy=True)
+        salary = filled[:, DISCRETE.index("salary")]
+        salary[np.isnan(salary)] = salary_median
+        for position, feat in enumerate(DISCRETE):
+            self.sketches[feat].insert(filled[:, position])
+
+        statistics = self.statistics(salary_median)
+        processed = normalize_data(clean_df(df, statistics))[self.features + ["salary"]]
+        self.accumulator.update(processed)
+
+        # rows keep the cleaning they arrived with, so removal can replay it
+        self._append(processed.to_numpy(dtype=np.float64), salaries, filled)
+        self.labels = self.labels.append(df.index)
+
+        return self
+
+    def remove(self, labels):
+        labels = labels.index if isinstance(labels, pd.DataFrame) else pd.Index(labels)
+        if labels.empty:
+            return self
+
+        positions = self.labels.get_indexer(labels)
+        if (positions < 0).any() or not labels.is_unique:
+            missing = list(labels[positions < 0])
+            raise ValueError(f"expected unique labels that were added, got {missing}")
+
+        size = len(self.labels)
+        processed = pd.DataFrame(self.processed[positions], columns=self.features + ["salary"])
+        self.accumulator.remove(processed)
+
+        self.salaries.delete(self.raw_salaries[positions])
+        for position, feat in enumerate(DISCRETE):
+            self.sketches[feat].delete(self.sketched[positions, position])
+
+        keep = np.ones(size, dtype=bool)
+        keep[positions] = False
+        kept = size - len(positions)
+        for buffer in [self.processed, self.raw_salaries, self.sketched]:
+            buffer[:kept] = buffer[:size][keep]
+        self.labels = self.labels[keep]
+
+        return self
+
+    def correct(self, df):
+        return self.remove(df.index).add(df)
+
+    def statistics(self, salary_median=None):
+        if salary_median is None:
+            salary_median = self.salaries.median()
+        return get_sketched_cleaning_statistics(self.sketches, salary_median)
+
+    def fit(self):
+        return self.accumulator.fit()
+
+    def __len__(self):
+        return len(self.labels)
+
+    def _append(self, processed, salaries, sketched):
+        size = len(self.labels)
+        required = size + len(salaries)
+        if required > len(self.raw_salaries):
+            capacity = max(required, 2 * len(self.raw_salaries))
+            self.processed = _grow(self.processed, size, capacity)
+            self.raw_salaries = _grow(self.raw_salaries, size, capacity)
+            self.sketched = _grow(self.sketched, size, capacity)
+
+        self.processed[size:required] = processed
+        self.raw_salaries[size:required] = salaries
+        self.sketched[size:required] = sketched
+
+
+def _grow(buffer, size, capacity):
+    grown = np.empty((capacity, *buffer.shape[1:]))
+    grown[:size] = buffer[:size]
+    return grown
@@ -0,0 +1,154 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from concurrent.futures import Executor
+from contextlib import contextmanager
+import pandas as pd
+import numpy as np
+
+
+@contextmanager
+def get_executor(executor, max_workers=None):
+    if executor is None or isinstance(executor, Executor):
+        yield executor
+        return
+
+    if executor not in EXECUTORS:
+        raise ValueError(f"expected an executor from {list(EXECUTORS)}")
+
+    with EXECUTORS[executor](max_workers=max_workers) as pool:
+        yield pool
+
+
+def map_with_executor(function, arguments, executor=None, max_workers=None):
+    with get_executor(executor, max_workers) as pool:
+        if pool is None:
+            return [function(*argument) for argument in arguments]
+        futures = [pool.submit(function, *argument) for argument in arguments]
+        return [future.result() for future in futures]
+
+
+def uses_processes(executor):
+    return executor == "process" or isinstance(executor, ProcessPoolExecutor)
+
+
+class SharedFrame:
+
+    def __init__(self, df):
+        values = df.to_numpy(dtype=np.float64)
+        self.memory = SharedMemory(create=True, size=max(values.nbytes, 1))
+        shared = np.ndarray(values.shape, dtype=np.float64, buffer=self.memory.buf)
+        shared[:] = values
+        # the index and dtypes travel with the handle, so workers rebuild the
+        # caller's frame rather than a float64 copy with a fresh RangeIndex
+        self.handle = (self.memory.name, values.shape, list(df.columns), df.index, df.dtypes)
+
+    def __enter__(self):
+        return self.handle
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def close(self):
+        self.memory.close()
+        self.memory.unlink()
+
+
+def read_shared_frame(handle, columns):
+    name, shape, all_columns, index, dtypes = handle
+    positions = [all_columns.index(column) for column in columns]
+
+    memory = SharedMemory(name=name)
+    shared = np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+    values = shared[:, positions]
+    del shared
+    memory.close()
+
+    df = pd.DataFrame(values, index=index, columns=list(columns))
+    return df.astype(dtypes[list(columns)].to_dict())
+
+
+class SharedArrays:
+
+    def __init__(self, arrays):
+        self.memories = []
+        self.handle = {}
+        for name, values in arrays.items():
+            values = np.ascontiguousarray(values)
+            memory = SharedMemory(create=True, size=max(values.nbytes, 1))
+            np.ndarray(values.shape, dtype=values.dtype, buffer=memory.buf)[...] = values
+            self.memories.append(memory)
+            self.handle[name] = (memory.name, values.shape, values.dtype.str)
+
+    def __enter__(self):
+        return self.handle
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def close(self):
+        for memory in self.memories:
+            memory.close()
+            memory.unlink()
+
+
+@contextmanager
+def share_arrays(arrays, executor):
+    if not uses_processes(executor):
+        yield arrays
+        return
+
+    with SharedArrays(arrays) as handle:
+        yield handle
+
+
+def read_shared_arrays(handle):
+    if all(isinstance(values, np.ndarray) for values in handle.values()):
+        return handle
+
+    # a worker attaches once per handle and reuses the views for every
+    # later task, so only the handle is pickled with each task
+    global _ATTACHED
+    if _ATTACHED is None or _ATTACHED[0] != handle:
+        _release_attached()
+        memories = {name: SharedMemory(name=block) for name, (block, _, _) in handle.items()}
+        arrays = {
+            name: np.ndarray(shape, dtype=dtype, buffer=memories[name].buf)
+            for name, (_, shape, dtype) in handle.items()
+        }
+        _ATTACHED = (handle, memories, arrays)
+    return _ATTACHED[2]
+
+
+def _release_attached():
+    global _ATTACHED
+    if _ATTACHED is None:
+        return
+    _, memories, arrays = _ATTACHED
+    _ATTACHED = None
+    arrays.clear()
+    for memory in memories.values():
+        memory.close()
+
+
+def get_shard_sizes(count, observations, shard_size, shard_elements):
+    # a shard holds a (count, observations) block, so larger frames get
+    # fewer draws per shard
+    shard_size = max(1, min(shard_size, shard_elements // observations))
+    full, remainder = divmod(count, shard_size)
+    return [shard_size] * full + ([remainder] if remainder else [])
+
+
+def get_names(names, features):
+    if names is None:
+        return [f"x{index}" for index in range(features)]
+    return list(names)
+
+
+EXECUTORS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+_ATTACHED = None
@@ -0,0 +1,170 @@
+from utilities.validator import check_for_design_matrix_validity
+from utilities.parallel import read_shared_arrays
+from utilities.parallel import map_with_executor
+from utilities.parallel import get_shard_sizes
+from utilities.parallel import share_arrays
+from utilities.parallel import get_names
+import pandas as pd
+import numpy as np
+
+
+class PermutationTester:
+
+    def __init__(self, X, y, names=None):
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        check_for_design_matrix_validity(X, y)
+        self.X = X
+        self.y = y
+        self.names = get_names(names, X.shape[1])
+
+        self.params = np.linalg.lstsq(X, y, rcond=None)[0]
+        self.residuals = y - X @ self.params
+        self.mse = self.residuals @ self.residuals / y.size
+
+    @classmethod
+    def from_model(cls, model):
+        return cls(model.model.exog, model.model.endog, model.model.exog_names)
+
+    def get_importances(self, features=None, permutations=None, seed=None, executor=None, max_workers=None):
+        positions = self._get_positions(features)
+        arrays = {
+            "values": self.X[:, positions].T,
+            "residuals": self.residuals,
+            "coefficients": self.params[positions],
+        }
+        scores = self._run(_importance_shard, arrays, permutations, seed, executor, max_workers)
+        return PermutationImportances(scores, self.mse, [self.names[position] for position in positions])
+
+    def test_coefficients(self, features=None, permutations=None, seed=None, executor=None, max_workers=None):
+        positions = self._get_positions(features)
+        dof = self.y.size - self.X.shape[1]
+
+        bases, residuals, projected = [], [], []
+        for position in positions:
+            # Freedman-Lane: permute the residuals of the model without the
+            # feature, and test against the feature with that model projected out
+            reduced = np.delete(self.X, position, axis=1)
+            basis = np.linalg.qr(reduced)[0]
+            bases.append(basis)
+            residuals.append(self.y - basis @ (basis.T @ self.y))
+            projected.append(self.X[:, position] - basis @ (basis.T @ self.X[:, position]))
+
+        arrays = {"bases": np.stack(bases), "residuals": np.stack(residuals), "projected": np.stack(projected)}
+        observed = np.array([
+            _get_t_values(feature_residuals[None], basis, feature_residuals, feature_projected, dof)[0]
+            for basis, feature_residuals, feature_projected in zip(bases, residuals, projected)
+        ])
+        statistics = self._run(_coefficient_shard, arrays, permutations, seed, executor, max_workers)
+        return PermutationTest(observed, statistics, [self.names[position] for position in positions])
+
+    def _get_positions(self, features):
+        if features is None:
+            constant = np.all(self.X == self.X[0], axis=0)
+            return [position for position in range(self.X.shape[1]) if not constant[position]]
+        return [self.names.index(feature) for feature in features]
+
+    def _run(self, function, arrays, permutations, seed, executor, max_workers):
+        permutations = PERMUTATIONS if permutations is None else permutations
+        shard_sizes = get_shard_sizes(permutations, self.y.size, SHARD_SIZE, SHARD_ELEMENTS)
+        seeds = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+
+        # every feature in a shard shares its permutations, so drawing them,
+        # the dominant cost on small frames, is paid once per shard; process
+        # workers read the arrays from shared memory rather than each task
+        with share_arrays(arrays, executor) as arrays:
+            tasks = [(arrays, size, shard_seed) for size, shard_seed in zip(shard_sizes, seeds)]
+            return np.concatenate(map_with_executor(function, tasks, executor, max_workers))
+
+
+class PermutationImportances:
+
+    def __init__(self, scores, mse, names):
+        self.mse = mse
+        self.scores = pd.DataFrame(scores, columns=names)
+
+    def get_summary(self):
+        return pd.DataFrame({
+            "importance": self.scores.mean(),
+            "std": self.scores.std(ddof=1),
+            "relative": self.scores.mean() / self.mse,
+        }).sort_values("importance", ascending=False)
+
+
+class PermutationTest:
+
+    def __init__(self, observed, statistics, names):
+        self.observed = pd.Series(observed, index=names, name="tvalue")
+        self.statistics = pd.DataFrame(statistics, columns=names)
+
+    def get_p_values(self):
+        exceeding = (self.statistics.abs() >= self.observed.abs()).sum()
+        return ((exceeding + 1) / (len(self.statistics) + 1)).rename("p_value")
+
+    def get_summary(self):
+        return pd.concat([self.observed, self.get_p_values()], axis="columns")
+
+
+def permutation_importance(model, features=None, permutations=None, seed=None, executor=None, max_workers=None):
+    tester = PermutationTester.from_model(model)
+    return tester.get_importances(features, permutations, seed, executor, max_workers)
+
+
+def permutation_test(model, features=None, permutations=None, seed=None, executor=None, max_workers=None):
+    tester = PermutationTester.from_model(model)
+    return tester.test_coefficients(features, permutations, seed, executor, max_workers)
+
+
+def _importance_shard(arrays, permutations, seed):
+    arrays = read_shared_arrays(arrays)
+    residuals = arrays["residuals"]
+    rows = _draw_permutations(residuals.size, permutations, seed)
+    return np.column_stack([
+        _get_importances(values[rows], values, residuals, coefficient)
+        for values, coefficient in zip(arrays["values"], arrays["coefficients"])
+    ])
+
+
+def _coefficient_shard(arrays, permutations, seed):
+    arrays = read_shared_arrays(arrays)
+    bases = arrays["bases"]
+    observations = bases.shape[1]
+    rows = _draw_permutations(observations, permutations, seed)
+
+    # each reduced basis drops one of the design's columns
+    dof = observations - bases.shape[2] - 1
+    return np.column_stack([
+        _get_t_values(residuals[rows], basis, residuals, projected, dof)
+        for basis, residuals, projected in zip(bases, arrays["residuals"], arrays["projected"])
+    ])
+
+
+def _get_importances(permuted, values, residuals, coefficient):
+    # permuting one column moves the predictions by coefficient * (x[p] - x),
+    # so the new squared error expands into two products with the permuted rows
+    cross = permuted @ residuals - values @ residuals
+    spread = 2 * (values @ values - permuted @ values)
+    return (coefficient ** 2 * spread - 2 * coefficient * cross) / values.size
+
+
+def _get_t_values(permuted, basis, residuals, projected, dof):
+    projected_norm = projected @ projected
+    covariance = permuted @ projected
+    coefficients = covariance / projected_norm
+
+    # the full-model residual sum of squares of each permuted response, from
+    # its norm less what the reduced basis and the projected feature explain
+    explained = np.square(permuted @ basis).sum(axis=1)
+    ssr = residuals @ residuals - explained - covariance ** 2 / projected_norm
+    return coefficients / np.sqrt(ssr / dof / projected_norm)
+
+
+def _draw_permutations(observations, permutations, seed):
+    rng = np.random.default_rng(seed)
+    indices = np.tile(np.arange(observations), (permutations, 1))
+    return rng.permuted(indices, axis=1, out=indices)
+
+
+PERMUTATIONS = 10_000
+SHARD_SIZE = 2500
+SHARD_ELEMENTS = 2 ** 22
@@ -1,18 +1,23 @@
+from utilities.instrumentation import instrument
 from utilities.validator import check_for_array_validity
 from utilities.error_calculator import ErrorCalculator
 from collections import OrderedDict
-import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
 
 
 class Plotter:
 
-    def __init__(self, y, y_hat):
+    def __init__(self, y, y_hat, large_data_threshold=None):
         check_for_array_validity(y, y_hat)
         self.y = y
         self.y_hat = y_hat
         self.calculations = self.run_calculations()
 
+        if large_data_threshold is None:
+            large_data_threshold = LARGE_DATA_THRESHOLD
+        self.large_data = y.size > large_data_threshold
+
+    @instrument
     def run_calculations(self):
         calc = ErrorCalculator(self.y, self.y_hat)
         return OrderedDict(
@@ -22,7 +27,10 @@ class Plotter:
             }
         )
 
+    @instrument
     def plot(self, model_name=""):
+        import matplotlib.pyplot as plt
+
         title="Residuals Histogram"
         ylabel = "Count"
 
@@ -33,17 +41,17 @@ class Plotter:
 
         fig.suptitle(f"{model_name}\n{title}")
 
-        sns.histplot(
-            data=self.calculations[residuals],
-            ax=ax[0]
+        self._histplot(
+            self.calculations[residuals],
+            ax[0]
         ).set(
             ylabel=ylabel,
             xlabel=residuals,
         )
 
-        sns.histplot(
-            data=self.calculations[std_residuals],
-            ax=ax[1]
+        self._histplot(
+            self.calculations[std_residuals],
+            ax[1]
         ).set(
             ylabel=ylabel,
             xlabel=std_residuals,
@@ -52,7 +60,18 @@ class Plotter:
         plt.tight_layout()
         plt.show()
 
+    def _histplot(self, values, ax):
+        import seaborn as sns
+
+        if not self.large_data:
+            return sns.histplot(data=values, ax=ax)
+
+        counts, edges = get_histogram(values)
+        return sns.histplot(x=edges[:-1], weights=counts, bins=edges.tolist(), ax=ax)
+
     def _set_graph_globals(self):
+        import seaborn as sns
+
         sns.set(rc={
         'axes.labelsize': 18,
         'axes.labelweight': 'bold',
@@ -69,7 +88,17 @@ class HistogramPlotter(Plotter):
 
 class ScatterPlotter(Plotter):
 
+    def __init__(self, y, y_hat, large_data_threshold=None, large_data_mode="sample"):
+        super().__init__(y, y_hat, large_data_threshold)
+        if large_data_mode not in LARGE_DATA_MODES:
+            raise ValueError(f"expected a large data mode from {LARGE_DATA_MODES}")
+        self.large_data_mode = large_data_mode
+        self.sample_indices = None
+
+    @instrument
     def plot(self, model_name=""):
+        import matplotlib.pyplot as plt
+
         xlabel="Predictions"
         title_a="Predictions vs. Residuals"
         title_b = "Scatter Plot"
@@ -81,19 +110,17 @@ class ScatterPlotter(Plotter):
 
         fig.suptitle(f"{model_name}\n{title_a}\n{title_b}")
 
-        sns.scatterplot(
-            x=self.y_hat,
-            y=self.calculations[residuals],
-            ax=ax[0]
+        self._scatterplot(
+            self.calculations[residuals],
+            ax[0]
         ).set(
             ylabel=residuals,
             xlabel=xlabel,
         )
 
-        sns.scatterplot(
-            x=self.y_hat,
-            y=self.calculations[std_residuals],
-            ax=ax[1]
+        self._scatterplot(
+            self.calculations[std_residuals],
+            ax[1]
         ).set(
             ylabel=std_residuals,
             xlabel=xlabel,
@@ -101,3 +128,57 @@ class ScatterPlotter(Plotter):
 
         plt.tight_layout()
         plt.show()
+
+    def _scatterplot(self, values, ax):
+        import seaborn as sns
+
+        if not self.large_data:
+            return sns.scatterplot(x=self.y_hat, y=values, ax=ax)
+
+        if self.large_data_mode == "hexbin":
+            ax.hexbin(self.y_hat, values, gridsize=HEXBIN_GRIDSIZE, bins="log", mincnt=1)
+            return ax
+
+        indices = self._get_sample_indices()
+        return sns.scatterplot(x=self.y_hat[indices], y=values[indices], ax=ax)
+
+    def _get_sample_indices(self):
+        if self.sample_indices is None:
+            _, std_residuals = self.calculations.values()
+            self.sample_indices = get_sample_indices(self.y_hat, std_residuals)
+        return self.sample_indices
+
+
+def get_histogram(values, bins=None):
+    return np.histogram(values, bins=HISTOGRAM_BINS if bins is None else bins)
+
+
+def get_sample_indices(y_hat, std_residuals, sample_size=None, extremes=None, seed=None):
+    sample_size = SAMPLE_SIZE if sample_size is None else sample_size
+    extremes = EXTREMES if extremes is None else extremes
+
+    if y_hat.size <= sample_size:
+        return np.arange(y_hat.size)
+
+    extremes = min(extremes, sample_size)
+    magnitudes = np.abs(std_residuals)
+    largest = np.argpartition(magnitudes, -extremes)[-extremes:] if extremes else []
+
+    rng = np.random.default_rng(seed)
+    strata = np.array_split(np.argsort(y_hat, kind="stable"), STRATA)
+    per_stratum = (sample_size - extremes) // STRATA
+    sampled = [
+        rng.choice(stratum, size=min(per_stratum, stratum.size), replace=False)
+        for stratum in strata
+    ]
+
+    return np.unique(np.concatenate([largest, *sampled]).astype(np.intp))
+
+
+LARGE_DATA_THRESHOLD = 100_000
+LARGE_DATA_MODES = ["sample", "hexbin"]
+HISTOGRAM_BINS = 100
+HEXBIN_GRIDSIZE = 60
+SAMPLE_SIZE = 20_000
+EXTREMES = 500
+STRATA = 20
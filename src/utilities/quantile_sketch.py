@@ -0,0 +1,119 @@
+import numpy as np
+
+
+class QuantileSketch:
+
+    def __init__(self, capacity=None, seed=None):
+        self.capacity = CAPACITY if capacity is None else capacity
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        self.count += values.size
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compact()
+
+    def merge(self, other):
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compact()
+
+    def quantile(self, q, lower=None, upper=None):
+        items, weights = self._get_weighted_items()
+        return _interpolate_quantile(items, weights, q, lower, upper)
+
+    def median(self, lower=None, upper=None):
+        return self.quantile(0.5, lower, upper)
+
+    def _get_weighted_items(self):
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([
+            np.full(level.size, 2.0 ** height)
+            for height, level in enumerate(self.levels)
+        ])
+        return items, weights
+
+    def _compact(self):
+        height = 0
+        while height < len(self.levels):
+            items = self.levels[height]
+            if items.size > self.capacity:
+                if height + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+
+                items = np.sort(items)
+                leftover = items[items.size - items.size % 2:]
+                offset = self._rng.integers(2)
+                promoted = items[offset:items.size - items.size % 2:2]
+
+                self.levels[height] = leftover
+                self.levels[height + 1] = np.concatenate([self.levels[height + 1], promoted])
+            height += 1
+
+
+class TurnstileSketch:
+
+    def __init__(self, capacity=None, seed=None):
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        seeds = seed.spawn(2)
+        self.inserted = QuantileSketch(capacity, seeds[0])
+        self.deleted = QuantileSketch(capacity, seeds[1])
+
+    @property
+    def count(self):
+        return self.inserted.count - self.deleted.count
+
+    def insert(self, values):
+        self.inserted.update(values)
+
+    def delete(self, values):
+        self.deleted.update(values)
+
+    def quantile(self, q, lower=None, upper=None):
+        inserted, inserted_weights = self.inserted._get_weighted_items()
+        deleted, deleted_weights = self.deleted._get_weighted_items()
+
+        # deletions cancel insertions of the same value; while neither
+        # sketch has compacted this leaves exactly the live values
+        items, inverse = np.unique(np.concatenate([inserted, deleted]), return_inverse=True)
+        weights = np.bincount(
+            inverse,
+            weights=np.concatenate([inserted_weights, -deleted_weights]),
+            minlength=items.size,
+        )
+        live = weights > 0
+        return _interpolate_quantile(items[live], weights[live], q, lower, upper)
+
+    def median(self, lower=None, upper=None):
+        return self.quantile(0.5, lower, upper)
+
+
+def _interpolate_quantile(items, weights, q, lower=None, upper=None):
+    inside = np.ones(items.size, dtype=bool)
+    if lower is not None:
+        inside &= items > lower
+    if upper is not None:
+        inside &= items < upper
+    items, weights = items[inside], weights[inside]
+
+    if items.size == 0:
+        return np.nan
+
+    order = np.argsort(items, kind="stable")
+    items, weights = items[order], weights[order]
+
+    # an item of weight w covers ranks cumulative - w through cumulative - 1,
+    # which reduces to pandas' linear interpolation for integer weights
+    cumulative = np.cumsum(weights)
+    ranks = np.column_stack([cumulative - weights, cumulative - 1]).ravel()
+    return np.interp(np.asarray(q) * (cumulative[-1] - 1), ranks, np.repeat(items, 2))
+
+
+CAPACITY = 4096
@@ -0,0 +1,136 @@
+from utilities.model_generator import COLUMN_NAMES
+from utilities.model_generator import LOG_SHIFT
+from utilities.model_generator import DISCRETE
+import numpy as np
+
+
+class Scorer:
+
+    def __init__(self, artifact):
+        self.features = list(artifact.features)
+        self.coefficients = np.asarray(artifact.coefficients, dtype=np.float64)
+        self.intercept = artifact.intercept
+        self.log_shift = artifact.log_shift
+
+        statistics = artifact.statistics
+        compiled = [
+            self._compile(feature, statistics, artifact.categories)
+            for feature in self.features
+        ]
+        self.columns = list(dict.fromkeys(source for source, _ in compiled))
+        self.transforms = [transform for _, transform in compiled]
+
+    @classmethod
+    def from_model(cls, model, statistics):
+        return cls(_FittedModel(model, statistics))
+
+    def predict(self, columns, block_size=None):
+        block_size = BLOCK_SIZE if block_size is None else block_size
+        columns = _get_renamed_columns(columns)
+        observations = _get_observation_count(columns)
+
+        predictions = np.empty(observations)
+        design = np.empty((min(block_size, observations), len(self.features)))
+
+        for start in range(0, observations, block_size):
+            stop = min(start + block_size, observations)
+            block = design[:stop - start]
+            for index, transform in enumerate(self.transforms):
+                transform(columns, start, stop, block[:, index])
+            np.matmul(block, self.coefficients, out=predictions[start:stop])
+
+        predictions += self.intercept
+        return predictions
+
+    def predict_salary(self, columns, block_size=None):
+        return np.exp(self.predict(columns, block_size)) - self.log_shift
+
+    def _compile(self, feature, statistics, categories):
+        if feature in DISCRETE:
+            return feature, _compile_discrete(
+                feature,
+                statistics["lower_bound"][feature],
+                statistics["upper_bound"][feature],
+                statistics["medians"][feature],
+                self.log_shift,
+            )
+
+        if feature == "prior_experience_original":
+            return "prior_experience", _compile_logged("prior_experience", self.log_shift)
+
+        for source, category_map in categories.items():
+            codes = [code for code, name in category_map.items() if name == feature]
+            if codes:
+                return source, _compile_indicator(source, codes[0])
+
+        return feature, _compile_passthrough(feature)
+
+
+class _FittedModel:
+
+    def __init__(self, model, statistics):
+        from utilities.model_generator import EMPLOYEE_POSITIONS
+        from utilities.model_generator import FIELDS_OF_WORK
+
+        names = list(model.params.index)
+        coefficients = np.asarray(model.params, dtype=np.float64)
+        has_constant = bool(names) and names[0] == "const"
+
+        self.features = names[1:] if has_constant else names
+        self.coefficients = coefficients[1:] if has_constant else coefficients
+        self.intercept = float(coefficients[0]) if has_constant else 0.0
+        self.log_shift = LOG_SHIFT
+        self.statistics = statistics
+        self.categories = {
+            "field_of_work": FIELDS_OF_WORK,
+            "employee_position": EMPLOYEE_POSITIONS,
+        }
+
+
+def _compile_discrete(feature, lower_bound, upper_bound, median, log_shift):
+    def transform(columns, start, stop, out):
+        out[:] = columns[feature][start:stop]
+        with np.errstate(invalid="ignore"):
+            outliers = ~((out > lower_bound) & (out < upper_bound))
+        out[outliers] = median
+        out += log_shift
+        np.log(out, out=out)
+    return transform
+
+
+def _compile_logged(feature, log_shift):
+    def transform(columns, start, stop, out):
+        out[:] = columns[feature][start:stop]
+        out += log_shift
+        np.log(out, out=out)
+    return transform
+
+
+def _compile_indicator(feature, code):
+    def transform(columns, start, stop, out):
+        np.equal(columns[feature][start:stop], code, out=out, casting="unsafe")
+    return transform
+
+
+def _compile_passthrough(feature):
+    def transform(columns, start, stop, out):
+        out[:] = columns[feature][start:stop]
+    return transform
+
+
+def _get_renamed_columns(columns):
+    renamed = {}
+    for name in columns.keys():
+        values = np.asarray(columns[name])
+        renamed[COLUMN_NAMES.get(name, name)] = values
+    return renamed
+
+
+def _get_observation_count(columns):
+    sizes = {values.shape[0] for values in columns.values()}
+    if len(sizes) != 1:
+        raise ValueError("expected columns of equal length")
+    return sizes.pop()
+
+
+BLOCK_SIZE = 65_536
@@ -0,0 +1,340 @@
+from utilities.quantile_sketch import QuantileSketch
+from utilities.model_generator import COLUMN_NAMES
+from utilities.scorer import Scorer
+import numpy as np
+import argparse
+import asyncio
+import json
+import time
+
+
+class MicroBatcher:
+
+    def __init__(self, scorers, max_batch_size=None, max_wait=None):
+        self.scorers = scorers
+        self.max_batch_size = MAX_BATCH_SIZE if max_batch_size is None else max_batch_size
+        self.max_wait = MAX_WAIT if max_wait is None else max_wait
+        self.metrics = ServerMetrics()
+        self._queue = None
+        self._worker = None
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+
+    async def predict(self, model_name, columns):
+        if model_name not in self.scorers:
+            raise ValueError(f"expected a model from {list(self.scorers)}")
+
+        columns = _get_request_columns(self.scorers[model_name], columns)
+        rows = len(next(iter(columns.values())))
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((model_name, columns, rows, future, time.perf_counter()))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            rows = batch[0][2]
+            deadline = loop.time() + self.max_wait
+
+            while rows < self.max_batch_size:
+                if self._queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    item = self._queue.get_nowait()
+                batch.append(item)
+                rows += item[2]
+
+            self._score(batch)
+
+    def _score(self, batch):
+        groups = {}
+        for item in batch:
+            groups.setdefault(item[0], []).append(item)
+
+        for model_name, items in groups.items():
+            scorer = self.scorers[model_name]
+            try:
+                columns = {
+                    name: np.concatenate([item[1][name] for item in items])
+                    for name in scorer.columns
+                }
+                predictions = scorer.predict(columns)
+            except Exception as error:
+                for item in items:
+                    _set_future(item[3], exception=error)
+                continue
+
+            offsets = np.cumsum([item[2] for item in items])[:-1]
+            finished = time.perf_counter()
+            for item, values in zip(items, np.split(predictions, offsets)):
+                self.metrics.record_latency(finished - item[4])
+                _set_future(item[3], result=values)
+
+            self.metrics.record_batch(len(items), len(predictions))
+
+
+class ServerMetrics:
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.rows = 0
+        self.batches = 0
+        self.errors = 0
+        self.latency_max = 0.0
+        self.latencies = QuantileSketch()
+        self._pending_latencies = []
+
+    def record_batch(self, requests, rows):
+        self.requests += requests
+        self.rows += rows
+        self.batches += 1
+
+    def record_error(self):
+        self.errors += 1
+
+    def record_latency(self, seconds):
+        self.latency_max = max(self.latency_max, seconds)
+        self._pending_latencies.append(seconds)
+        if len(self._pending_latencies) >= LATENCY_BUFFER_SIZE:
+            self._flush_latencies()
+
+    def snapshot(self):
+        self._flush_latencies()
+        uptime = time.perf_counter() - self.started
+        p50, p99 = (
+            self.latencies.quantile([0.5, 0.99]) if self.latencies.count
+            else (0.0, 0.0)
+        )
+        return {
+            "uptime_seconds": uptime,
+            "requests": self.requests,
+            "rows": self.rows,
+            "batches": self.batches,
+            "errors": self.errors,
+            "mean_batch_rows": self.rows / self.batches if self.batches else 0.0,
+            "requests_per_second": self.requests / uptime,
+            "rows_per_second": self.rows / uptime,
+            "latency_p50_seconds": float(p50),
+            "latency_p99_seconds": float(p99),
+            "latency_max_seconds": self.latency_max,
+        }
+
+    def _flush_latencies(self):
+        if self._pending_latencies:
+            self.latencies.update(self._pending_latencies)
+            self._pending_latencies = []
+
+
+def load_scorers(path=None):
+    from utilities.model_generator import generate_feature_sets
+    from utilities.model_generator import DataPipeline
+    from utilities.model_generator import fit_models
+    from utilities.model_generator import PIPELINE
+
+    pipeline = PIPELINE if path is None else DataPipeline(path)
+    df = pipeline.normalized()
+    models = fit_models(df, generate_feature_sets(df=df))
+    statistics = pipeline.statistics()
+    return {
+        name: Scorer.from_model(model, statistics)
+        for name, model in models.items()
+    }
+
+
+async def handle_connection(reader, writer, batcher):
+    try:
+        while True:
+            try:
+                request = await _read_request(reader)
+            except ValueError as error:
+                batcher.metrics.record_error()
+                _write_response(writer, 400, {"error": f"malformed request: {error}"}, False)
+                await writer.drain()
+                break
+            if request is None:
+                break
+
+            method, path, body, keep_alive = request
+            status, payload = await _route(batcher, method, path, body)
+            _write_response(writer, status, payload, keep_alive)
+            await writer.drain()
+
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(scorers, host=None, port=None, max_batch_size=None, max_wait=None):
+    host = HOST if host is None else host
+    port = PORT if port is None else port
+
+    batcher = MicroBatcher(scorers, max_batch_size, max_wait)
+    await batcher.start()
+
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(reader, writer, batcher),
+        host,
+        port,
+    )
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
+
+
+async def _route(batcher, method, path, body):
+    if (method, path) == ("GET", "/metrics"):
+        return 200, batcher.metrics.snapshot()
+
+    if (method, path) != ("POST", "/predict"):
+        return 404, {"error": f"no route for {method} {path}"}
+
+    try:
+        return 200, await _predict(batcher, body)
+    except (ValueError, KeyError, TypeError) as error:
+        status, message = 400, str(error)
+    except Exception as error:
+        status, message = 500, f"{type(error).__name__}: {error}"
+
+    batcher.metrics.record_error()
+    return status, {"error": message}
+
+
+async def _predict(batcher, body):
+    request = json.loads(body)
+    model_name = request["model"]
+    columns = request["columns"] if "columns" in request else _get_columns(request["rows"])
+    predictions = await batcher.predict(model_name, columns)
+
+    log_shift = batcher.scorers[model_name].log_shift
+    return {
+        "model": model_name,
+        "predictions": predictions.tolist(),
+        "salaries": (np.exp(predictions) - log_shift).tolist(),
+    }
+
+
+async def _read_request(reader):
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+
+    method, path, version = request_line.decode("latin-1").split()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+    return method, path, body, keep_alive
+
+
+def _write_response(writer, status, payload, keep_alive):
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {STATUS_REASONS[status]}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        f"\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+
+
+def _get_columns(rows):
+    if not rows:
+        raise ValueError("expected at least one row")
+    return {name: [row[name] for row in rows] for name in rows[0]}
+
+
+def _get_request_columns(scorer, columns):
+    renamed = {
+        COLUMN_NAMES.get(name, name): np.asarray(values, dtype=np.float64)
+        for name, values in columns.items()
+    }
+
+    missing = [name for name in scorer.columns if name not in renamed]
+    if missing:
+        raise ValueError(f"expected columns {missing}")
+
+    sizes = {renamed[name].shape for name in scorer.columns}
+    if len(sizes) != 1 or len(sizes.pop()) != 1:
+        raise ValueError("expected one-dimensional columns of equal length")
+
+    return {name: renamed[name] for name in scorer.columns}
+
+
+def _set_future(future, result=None, exception=None):
+    if future.done():
+        return
+    if exception is None:
+        future.set_result(result)
+    else:
+        future.set_exception(exception)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="serve salary predictions over HTTP")
+    parser.add_argument("--data", default=None)
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--max-batch-size", type=int, default=MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait", type=float, default=MAX_WAIT)
+    arguments = parser.parse_args()
+
+    scorers = load_scorers(arguments.data)
+    print(f"serving {list(scorers)} on http://{arguments.host}:{arguments.port}")
+    asyncio.run(serve(
+        scorers,
+        arguments.host,
+        arguments.port,
+        arguments.max_batch_size,
+        arguments.max_wait,
+    ))
+
+
+HOST = "127.0.0.1"
+PORT = 8000
+MAX_BATCH_SIZE = 4096
+MAX_WAIT = 0.002
+LATENCY_BUFFER_SIZE = 1024
+
+
+STATUS_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    500: "Internal Server Error",
+}
+
+
+if __name__ == "__main__":
+    main()
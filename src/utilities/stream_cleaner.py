@@ -0,0 +1,55 @@
+from utilities.model_generator import read_in_chunks
+from utilities.model_generator import normalize_data
+from utilities.quantile_sketch import QuantileSketch
+from utilities.model_generator import CHUNK_SIZE
+from utilities.model_generator import DISCRETE
+from utilities.model_generator import clean_df
+import pandas as pd
+import numpy as np
+
+
+def stream_clean_df(path=None, chunksize=None, statistics=None):
+    if statistics is None:
+        statistics = get_streaming_cleaning_statistics(path, chunksize)
+
+    for df in read_in_chunks(path, chunksize):
+        yield normalize_data(clean_df(df, statistics))
+
+
+def get_streaming_cleaning_statistics(path=None, chunksize=None, capacity=None, seed=None):
+    chunksize = CHUNK_SIZE if chunksize is None else chunksize
+    sketches = {feat: QuantileSketch(capacity, seed) for feat in DISCRETE}
+    missing_salaries = 0
+
+    for df in read_in_chunks(path, chunksize):
+        for feat in DISCRETE:
+            sketches[feat].update(df[feat].to_numpy(dtype=np.float64))
+        missing_salaries += int(df["salary"].isna().sum())
+
+    salary_median = sketches["salary"].median()
+    for start in range(0, missing_salaries, chunksize):
+        filled = min(chunksize, missing_salaries - start)
+        sketches["salary"].update(np.full(filled, salary_median))
+
+    return get_sketched_cleaning_statistics(sketches, salary_median)
+
+
+def get_sketched_cleaning_statistics(sketches, salary_median):
+    q1 = pd.Series({feat: sketches[feat].quantile(0.25) for feat in DISCRETE})
+    q3 = pd.Series({feat: sketches[feat].quantile(0.75) for feat in DISCRETE})
+
+    iqr_range = (q3 - q1) * 1.5
+    lower_bound = q1 - iqr_range
+    upper_bound = q3 + iqr_range
+
+    medians = pd.Series({
+        feat: sketches[feat].median(lower_bound[feat], upper_bound[feat])
+        for feat in DISCRETE
+    })
+
+    return {
+        "salary_median": salary_median,
+        "lower_bound": lower_bound,
+        "upper_bound": upper_bound,
+        "medians": medians,
+    }
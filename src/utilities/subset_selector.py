@@ -0,0 +1,257 @@
+from scipy.linalg import solve_triangular
+import numpy as np
+
+
+class SubsetSelector:
+
+    def __init__(self, df, features, criterion="bic", target="salary"):
+        self.features = list(features)
+        self.criterion = criterion
+        self.score_function, self.monotone = _get_criterion(criterion)
+
+        X = df[self.features].to_numpy(dtype=np.float64)
+        y = df[target].to_numpy(dtype=np.float64)
+
+        self.design = np.column_stack([np.ones(y.size), X, y])
+        self.gram = self.design.T @ self.design
+        self.observations = y.size
+        self.target_index = len(self.features) + 1
+        self.total_sum_of_squares = np.square(y - y.mean()).sum()
+
+    def score(self, features):
+        columns = self._get_columns(features)
+        factor = self._factorize(columns)
+        return self._score(columns, factor)
+
+    def forward(self):
+        columns = [0]
+        factor = self._factorize(columns)
+        best_score = self._score(columns, factor)
+        remaining = list(range(1, self.target_index))
+
+        while remaining:
+            candidates = []
+            for column in remaining:
+                appended = self._append(factor, columns, column)
+                if appended is None:
+                    continue
+                score = self._score(columns + [column], appended)
+                candidates.append((score, column, appended))
+
+            if not candidates:
+                break
+
+            score, column, appended = min(candidates, key=lambda x: x[0])
+            if score >= best_score:
+                break
+
+            best_score = score
+            factor = appended
+            columns.append(column)
+            remaining.remove(column)
+
+        return self._get_features(columns)
+
+    def backward(self):
+        columns = list(range(self.target_index))
+        factor = self._factorize(columns)
+        best_score = self._score(columns, factor)
+
+        while len(columns) > 1:
+            candidates = []
+            for position in range(1, len(columns)):
+                reduced = _delete_from_cholesky(factor, position)
+                reduced_columns = columns[:position] + columns[position + 1:]
+                score = self._score(reduced_columns, reduced)
+                candidates.append((score, position, reduced))
+
+            score, position, reduced = min(candidates, key=lambda x: x[0])
+            if score >= best_score:
+                break
+
+            best_score = score
+            factor = reduced
+            del columns[position]
+
+        return self._get_features(columns)
+
+    def best_subset(self):
+        columns = [0] + self._order_by_importance()
+        factor = self._factorize(columns)
+        best = [np.inf, [0]]
+
+        self._branch(columns, factor, 1, best)
+
+        return self._get_features(best[1])
+
+    def _branch(self, columns, factor, forced, best):
+        score = self._score(columns, factor)
+        if score < best[0]:
+            best[0], best[1] = score, list(columns)
+
+        # every subset of this node keeps the first `forced` columns, so
+        # none can have fewer parameters or a smaller RSS than this node
+        for position in range(forced, len(columns)):
+            reduced = _delete_from_cholesky(factor, position)
+            if self._bound(reduced, position) >= best[0]:
+                continue
+            reduced_columns = columns[:position] + columns[position + 1:]
+            self._branch(reduced_columns, reduced, position, best)
+
+    def _bound(self, factor, parameters):
+        rss = factor[-1, -1] ** 2
+        if self.monotone:
+            return self.score_function(
+                rss,
+                parameters,
+                self.observations,
+                self.total_sum_of_squares,
+            )
+        if self.criterion in DESIGN_CRITERIA:
+            return rss
+        return -np.inf
+
+    def _order_by_importance(self):
+        columns = list(range(self.target_index))
+        factor = self._factorize(columns)
+        rss_increases = [
+            _delete_from_cholesky(factor, position)[-1, -1] ** 2
+            for position in range(1, len(columns))
+        ]
+        order = np.argsort(rss_increases)[::-1]
+        return [columns[position + 1] for position in order]
+
+    def _score(self, columns, factor):
+        if self.criterion in DESIGN_CRITERIA:
+            return self._get_press(columns, factor)
+        return self.score_function(
+            factor[-1, -1] ** 2,
+            len(columns),
+            self.observations,
+            self.total_sum_of_squares,
+        )
+
+    def _get_press(self, columns, factor):
+        lower = factor[:-1, :-1]
+        coefficients = solve_triangular(lower.T, factor[-1, :-1], lower=False)
+
+        X = self.design[:, columns]
+        residuals = self.design[:, self.target_index] - X @ coefficients
+        projection = solve_triangular(lower, X.T, lower=True)
+        leverage = np.square(projection).sum(axis=0)
+
+        return np.square(residuals / (1 - leverage)).sum()
+
+    def _factorize(self, columns):
+        augmented = columns + [self.target_index]
+        try:
+            return np.linalg.cholesky(self.gram[np.ix_(augmented, augmented)])
+        except np.linalg.LinAlgError:
+            raise ValueError("expected features that are not perfectly collinear")
+
+    def _append(self, factor, columns, column):
+        size = len(columns)
+        lower = factor[:-1, :-1]
+        target_row = factor[-1, :-1]
+
+        projection = solve_triangular(lower, self.gram[columns, column], lower=True)
+        squared_pivot = self.gram[column, column] - projection @ projection
+        if squared_pivot <= COLLINEARITY_TOLERANCE * self.gram[column, column]:
+            return None
+
+        pivot = np.sqrt(squared_pivot)
+        target_entry = (self.gram[column, self.target_index] - projection @ target_row) / pivot
+        rss = max(factor[-1, -1] ** 2 - target_entry ** 2, 0.0)
+
+        appended = np.zeros((size + 2, size + 2))
+        appended[:size, :size] = lower
+        appended[size, :size] = projection
+        appended[size, size] = pivot
+        appended[size + 1, :size] = target_row
+        appended[size + 1, size] = target_entry
+        appended[size + 1, size + 1] = np.sqrt(rss)
+
+        return appended
+
+    def _get_columns(self, features):
+        return [0] + [self.features.index(feature) + 1 for feature in features]
+
+    def _get_features(self, columns):
+        return [self.features[column - 1] for column in sorted(columns) if column]
+
+
+def _delete_from_cholesky(factor, position):
+    trailing = factor[position + 1:, position]
+    reduced = np.delete(np.delete(factor, position, axis=0), position, axis=1)
+    reduced[position:, position:] = _update_cholesky(
+        reduced[position:, position:],
+        trailing,
+    )
+    return reduced
+
+
+def _update_cholesky(lower, vector):
+    lower = lower.copy()
+    vector = vector.copy()
+    size = vector.size
+
+    for index in range(size):
+        diagonal = lower[index, index]
+        radius = np.hypot(diagonal, vector[index])
+        if index == size - 1:
+            lower[index, index] = radius
+            continue
+        if diagonal == 0:
+            raise ValueError("expected features that are not perfectly collinear")
+
+        cosine = radius / diagonal
+        sine = vector[index] / diagonal
+        lower[index, index] = radius
+        lower[index + 1:, index] = (lower[index + 1:, index] + sine * vector[index + 1:]) / cosine
+        vector[index + 1:] = cosine * vector[index + 1:] - sine * lower[index + 1:, index]
+
+    return lower
+
+
+def _get_criterion(criterion):
+    if callable(criterion):
+        return criterion, False
+    # press needs the design matrix rather than the RSS, so _score
+    # dispatches it to _get_press and no score function is returned
+    if criterion in DESIGN_CRITERIA:
+        return None, False
+    if criterion not in CRITERIA:
+        raise ValueError(f"expected a criterion from {list(CRITERIA) + DESIGN_CRITERIA}")
+    return CRITERIA[criterion]
+
+
+def _log_likelihood(rss, observations):
+    return -observations / 2 * (np.log(2 * np.pi) + np.log(rss / observations) + 1)
+
+
+def _aic(rss, parameters, observations, total_sum_of_squares):
+    return -2 * _log_likelihood(rss, observations) + 2 * parameters
+
+
+def _bic(rss, parameters, observations, total_sum_of_squares):
+    penalty = np.log(observations) * parameters
+    return -2 * _log_likelihood(rss, observations) + penalty
+
+
+def _negative_adjusted_r2(rss, parameters, observations, total_sum_of_squares):
+    residual_variance = rss / (observations - parameters)
+    total_variance = total_sum_of_squares / (observations - 1)
+    return residual_variance / total_variance - 1
+
+
+COLLINEARITY_TOLERANCE = 1e-10
+
+
+CRITERIA = {
+    "aic": (_aic, True),
+    "bic": (_bic, True),
+    "adjusted_r2": (_negative_adjusted_r2, True),
+}
+
+
+DESIGN_CRITERIA = ["press"]
@@ -1,8 +1,9 @@
-from statsmodels.regression.linear_model import RegressionResultsWrapper
 import numpy as np
 
 
 def check_model_validity(model):
+    from statsmodels.regression.linear_model import RegressionResultsWrapper
+
     if type(model) != RegressionResultsWrapper:
         raise TypeError("expected a fitted model rendered from 'statsmodels'")
 
@@ -16,6 +17,16 @@ def check_for_array_validity(y, y_hat):
     _check_for_more_than_two_entries(y, y_hat)
 
 
+def check_for_batch_array_validity(y, y_hats, model_names=None):
+    _check_array_type(y, "y")
+    _check_array_type(y_hats, "y_hats")
+    _check_dimensions(y, "y")
+    _check_two_dimensions(y_hats, "y_hats")
+    _check_for_equal_observation_count_in_batch(y, y_hats)
+    _check_for_more_than_two_entries_in_batch(y, y_hats)
+    _check_for_model_name_count(y_hats, model_names)
+
+
 def _check_array_type(parameter, name):
     if type(parameter) != np.ndarray:
         expected_type = "numpy array"
@@ -30,6 +41,36 @@ def _check_dimensions(parameter, name):
         raise TypeError(message)
 
 
+def _check_two_dimensions(parameter, name):
+    if parameter.ndim != 2:
+        dimensions = "2 dimensions"
+        message = _parameter_type_error_message(dimensions, name)
+        raise TypeError(message)
+
+
+def _check_for_equal_observation_count_in_batch(y, y_hats):
+    if y.size != y_hats.shape[1]:
+        observations = "equal observations"
+        variables = "y & y_hats"
+        message = _parameter_type_error_message(observations, variables)
+        raise TypeError(message)
+
+
+def _check_for_more_than_two_entries_in_batch(y, y_hats):
+    if y.size < 2 or y_hats.shape[0] < 1:
+        expectation = "more than 2 values"
+        variables = "y & y_hats"
+        message = _parameter_type_error_message(expectation, variables)
+        raise TypeError(message)
+
+
+def _check_for_model_name_count(y_hats, model_names):
+    if model_names is not None and len(model_names) != len(y_hats):
+        expectation = "a name per model"
+        message = _parameter_type_error_message(expectation, "model_names")
+        raise TypeError(message)
+
+
 def _check_for_equal_observation_count(y, y_hat):
     if y.size != y_hat.size:
         observations = "equal observations"
@@ -46,6 +87,34 @@ def _check_for_more_than_two_entries(y, y_hat):
         raise TypeError(message)
 
 
+def check_for_design_matrix_validity(X, y):
+    _check_array_type(X, "X")
+    _check_array_type(y, "y")
+    _check_design_matrix_dimensions(X, y)
+    _check_for_equal_observation_count_in_design(X, y)
+    _check_for_more_observations_than_features(X)
+
+
+def _check_design_matrix_dimensions(X, y):
+    _check_two_dimensions(X, "X")
+    _check_dimensions(y, "y")
+
+
+def _check_for_equal_observation_count_in_design(X, y):
+    if X.shape[0] != y.size:
+        observations = "equal observations"
+        variables = "X & y"
+        message = _parameter_type_error_message(observations, variables)
+        raise TypeError(message)
+
+
+def _check_for_more_observations_than_features(X):
+    if X.shape[0] <= X.shape[1]:
+        expectation = "more observations than features"
+        message = _parameter_type_error_message(expectation, "X")
+        raise TypeError(message)
+
+
 def _parameter_type_error_message(expected, parameter):
     return f"expected {expected} for the parameter {parameter}"
 
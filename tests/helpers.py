@@ -0,0 +1,31 @@
+import statsmodels.api as sm
+import numpy as np
+import pathlib
+
+
+def generate_data(observations, features, seed, targets=None, coefficients=None, degrees_of_freedom=None):
+    rng = np.random.default_rng(seed)
+    X = sm.add_constant(rng.normal(size=(observations, features)))
+    shape = (observations,) if targets is None else (observations, targets)
+
+    if coefficients is None:
+        coefficients = rng.normal(size=(features + 1, *shape[1:]))
+
+    if degrees_of_freedom is None:
+        noise = rng.normal(size=shape)
+    else:
+        noise = rng.standard_t(degrees_of_freedom, size=shape)
+
+    return X, X @ coefficients + noise
+
+
+def generate_correlated_data(observations, features, seed):
+    rng = np.random.default_rng(seed)
+    shared = rng.normal(size=(observations, 1))
+    X = rng.normal(size=(observations, features)) + shared
+    beta = rng.normal(size=features) * (rng.random(features) < 0.5)
+    y = X @ beta + rng.normal(size=observations) + 2
+    return X, y
+
+
+RAW_DATA_PATH = pathlib.Path(__file__).parents[1] / "src" / "data" / "salary_raw.csv"
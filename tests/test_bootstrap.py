@@ -0,0 +1,64 @@
+from utilities.error_calculator import ErrorCalculator
+from utilities.bootstrap import _resample_shard
+from utilities.bootstrap import bootstrap_model
+from utilities.bootstrap import Bootstrapper
+from helpers import generate_data
+import statsmodels.api as sm
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize(
+    ["observations", "features", "seed"],
+    [(20, 1, 0), (50, 3, 1), (120, 6, 2)],
+)
+def test_replicates_match_refitting_resampled_rows(observations, features, seed):
+    X, y = generate_data(observations, features, seed)
+
+    params, mse = _resample_shard({"X": X, "y": y}, 5, seed)
+
+    probabilities = np.full(observations, 1 / observations)
+    counts = np.random.default_rng(seed).multinomial(observations, probabilities, size=5)
+    for replicate, row_counts in enumerate(counts):
+        rows = np.repeat(np.arange(observations), row_counts)
+        model = sm.OLS(y[rows], X[rows]).fit()
+        calculator = ErrorCalculator(y[rows], model.predict(X[rows]))
+        assert np.allclose(model.params, params[replicate])
+        assert np.isclose(calculator.get_mse(), mse[replicate])
+
+
+@pytest.mark.parametrize(["executor"], [["thread"], ["process"]])
+def test_resampling_is_deterministic_across_executors(executor):
+    X, y = generate_data(60, 2, 0)
+    bootstrapper = Bootstrapper(X, y)
+
+    expected = bootstrapper.resample(600, seed=7)
+    results = bootstrapper.resample(600, seed=7, executor=executor, max_workers=2)
+
+    assert np.array_equal(expected.params, results.params)
+    assert np.array_equal(expected.mse, results.mse)
+
+
+def test_confidence_intervals_cover_the_fitted_model():
+    X, y = generate_data(200, 3, 3)
+    model = sm.OLS(y, X).fit()
+
+    results = bootstrap_model(model, 2000, seed=0)
+    intervals = results.get_confidence_intervals()
+    names = ["const", "x1", "x2", "x3"]
+
+    assert names + ["mse", "rmse"] == list(intervals.index)
+    assert (intervals.loc[names, "lower"] < model.params).all()
+    assert (intervals.loc[names, "upper"] > model.params).all()
+    assert np.allclose(model.bse, results.get_standard_errors()[names], rtol=0.2)
+    assert 2000 == len(results.params)
+
+
+def test_singular_replicates_fall_back_to_pseudo_inverse():
+    X, y = generate_data(30, 1, 4)
+    X = np.column_stack([X, np.zeros(30)])
+    X[0, 2] = 1
+
+    results = Bootstrapper(X, y).resample(300, seed=0)
+
+    assert np.isfinite(results.params.to_numpy()).all()
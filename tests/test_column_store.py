@@ -0,0 +1,93 @@
+from utilities.column_store import ColumnStore
+from utilities import model_generator
+from helpers import RAW_DATA_PATH
+import statsmodels.api as sm
+import pandas as pd
+import numpy as np
+import pytest
+
+
+FEATURES = ["years_in_field", "executive_position", "market_value", "engineering_department"]
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    return model_generator.DataPipeline(RAW_DATA_PATH)
+
+
+def test_columns_use_compact_kinds(pipeline):
+    kinds = pipeline.column_store().get_kinds()
+
+    assert (kinds[model_generator.DISCRETE] == "float32").all()
+    assert (kinds[model_generator.BINARY] == "bits").all()
+    assert (kinds[["engineering_department", "executive_position"]] == "bits").all()
+    assert "codes" == kinds["employee_position"]
+
+
+def test_columns_round_trip(pipeline):
+    df = pipeline.normalized()
+    store = ColumnStore.from_df(df)
+
+    frame = store.get_frame()
+
+    assert list(df.columns) == list(frame.columns)
+    assert (frame.dtypes == np.float64).all()
+    assert np.allclose(df.astype(float), frame, rtol=1e-6)
+    exact = df.columns.drop(model_generator.DISCRETE + ["prior_experience_original"])
+    assert np.array_equal(df[exact].astype(float), frame[exact])
+
+
+def test_models_fit_from_the_store(pipeline):
+    df = pipeline.normalized()
+    store = pipeline.column_store()
+
+    expected = model_generator.create_model(df, FEATURES)
+    model = model_generator.create_model(store, FEATURES)
+
+    assert np.allclose(expected.params, model.params, rtol=1e-4)
+    assert np.allclose(
+        sm.add_constant(df[FEATURES].astype(float)),
+        store.get_design_matrix(FEATURES),
+        rtol=1e-6,
+    )
+
+
+def test_store_uses_a_fraction_of_the_frame_memory():
+    raw = model_generator.read_in_df(RAW_DATA_PATH)
+    df = model_generator.clean_df(pd.concat([raw] * 400, ignore_index=True))
+
+    store = ColumnStore.from_df(df)
+
+    assert store.nbytes < df.memory_usage(deep=True).sum() / 3
+    assert store.nbytes == store.memory_usage().sum()
+
+
+@pytest.mark.parametrize(["values", "kind"], [
+    ([0, 1, 1, 0, 1], "bits"),
+    ([1, 2, 3, 2, 1], "codes"),
+    ([1, 2, 300, 2, 1], "int32"),
+    ([1.0, 2.0, 300.0, 2.0, 1.0], "int32"),
+    ([1, 2, 2 ** 40, 2, 1], "int64"),
+    ([1, 2, 2 ** 63, 2, 1], "uint64"),
+    ([0, 1, np.nan, 0, 1], "float64"),
+    ([0.5, 1, 1, 0, 1], "float64"),
+])
+def test_columns_fall_back_when_values_do_not_fit(values, kind):
+    store = ColumnStore.from_df(pd.DataFrame({"column": values}))
+
+    assert kind == store.get_kinds()["column"]
+    assert np.allclose(values, store["column"], equal_nan=True)
+
+
+@pytest.mark.parametrize(["dtype"], [[np.int64], [np.float64]])
+def test_large_integers_round_trip_exactly(dtype):
+    ids = np.arange(16_777_215, 16_777_225).astype(dtype)
+    store = ColumnStore.from_df(pd.DataFrame({"id": ids, "big": ids * 2 ** 30}))
+
+    assert np.array_equal(ids, store["id"])
+    assert np.array_equal(ids.astype(np.int64) * 2 ** 30, store.get_column("big", dtype=None))
+
+
+def test_that_error_is_raised_for_non_numeric_columns():
+    with pytest.raises(TypeError):
+        ColumnStore.from_df(pd.DataFrame({"column": ["a", "b"]}))
@@ -0,0 +1,87 @@
+from utilities.cross_validator import CrossValidator
+from helpers import generate_data
+import statsmodels.api as sm
+import numpy as np
+import pytest
+
+
+def _refit_residuals(X, y, folds):
+    residuals = np.empty_like(y)
+    for fold in folds:
+        train = np.setdiff1d(np.arange(y.size), fold)
+        model = sm.OLS(y[train], X[train]).fit()
+        residuals[fold] = y[fold] - model.predict(X[fold])
+    return residuals
+
+
+@pytest.mark.parametrize(
+    ["observations", "features", "seed"],
+    [(10, 1, 0), (25, 3, 1), (60, 5, 2)],
+)
+def test_loo_residuals_match_refitting(observations, features, seed):
+    X, y = generate_data(observations, features, seed)
+    folds = np.array_split(np.arange(observations), observations)
+
+    validator = CrossValidator(X, y)
+    expected = _refit_residuals(X, y, folds)
+
+    assert np.allclose(expected, validator.get_loo_residuals())
+    assert np.isclose(np.sum(expected ** 2), validator.get_press())
+
+
+@pytest.mark.parametrize(
+    ["observations", "features", "k", "shuffle"],
+    [(20, 2, 2, False), (33, 3, 5, False), (47, 4, 7, True)],
+)
+def test_kfold_residuals_match_refitting(observations, features, k, shuffle):
+    X, y = generate_data(observations, features, k)
+
+    validator = CrossValidator(X, y)
+    folds = validator.get_folds(k, shuffle=shuffle, seed=k)
+    expected = _refit_residuals(X, y, folds)
+
+    assert np.allclose(expected, validator.get_kfold_residuals(k, shuffle, k))
+    assert np.isclose(np.mean(expected ** 2), validator.get_kfold_mse(k, shuffle, k))
+
+
+def test_kfold_with_one_observation_per_fold_is_loo():
+    X, y = generate_data(15, 2, 3)
+    validator = CrossValidator(X, y)
+    assert np.allclose(validator.get_loo_residuals(), validator.get_kfold_residuals(15))
+
+
+@pytest.mark.parametrize(["k"], [[1], [16]])
+def test_that_error_is_raised_for_invalid_fold_count(k):
+    X, y = generate_data(15, 2, 4)
+    with pytest.raises(ValueError, match="^expected k between 2 and 15$"):
+        CrossValidator(X, y).get_folds(k)
+
+
+@pytest.mark.parametrize(
+    ["X", "y", "match"],
+    [
+        (np.ones(4), np.ones(4), "^.* 2 dimensions .* parameter X$"),
+        (np.ones((4, 2)), np.ones((4, 1)), "^.* 1 dimension .* parameter y$"),
+        (np.ones((4, 2)), np.ones(3), "^.* equal observations .* parameter X & y$"),
+        (np.ones((2, 2)), np.ones(2), "^.* more observations than features .* parameter X$"),
+    ],
+)
+def test_that_error_is_raised_for_invalid_design_matrix(X, y, match):
+    with pytest.raises(TypeError, match=match):
+        CrossValidator(X, y)
+
+
+def test_rank_deficient_designs_match_refitting():
+    X, y = generate_data(30, 2, 5)
+    X = np.column_stack([X, X[:, 1]])
+    folds = np.array_split(np.arange(30), 6)
+
+    validator = CrossValidator(X, y)
+    leverage = sm.OLS(y, X).fit().get_influence().hat_matrix_diag
+
+    assert np.allclose(leverage, validator.leverage)
+    assert np.allclose(_refit_residuals(X, y, folds), validator.get_kfold_residuals(6))
+    assert np.allclose(
+        _refit_residuals(X, y, np.array_split(np.arange(30), 30)),
+        validator.get_loo_residuals(),
+    )
@@ -0,0 +1,128 @@
+from statsmodels.tools.sm_exceptions import ConvergenceWarning
+from utilities.error_calculator import BatchErrorCalculator
+from utilities.elastic_net import fit_elastic_net_path
+from utilities.error_calculator import ErrorCalculator
+from utilities.elastic_net import ElasticNetPath
+from utilities import model_generator
+from helpers import generate_correlated_data
+from helpers import RAW_DATA_PATH
+import statsmodels.api as sm
+import numpy as np
+import pytest
+
+
+FEATURES = [
+    "prior_experience",
+    "years_in_field",
+    "years_at_rank",
+    "market_value",
+    "engineering_department",
+    "finance_department",
+    "marketing_department",
+    "manager_position",
+    "executive_position",
+]
+
+
+@pytest.mark.parametrize(["observations", "features", "seed"], [(50, 3, 0), (200, 8, 1)])
+def test_ridge_path_matches_closed_form(observations, features, seed):
+    X, y = generate_correlated_data(observations, features, seed)
+    path = ElasticNetPath(X, y, l1_ratio=0.0, standardize=False)
+
+    results = path.fit([10.0, 1.0, 0.1], tol=1e-12)
+
+    centred = X - X.mean(axis=0)
+    for penalty, coefs in zip(results.lambdas, results.coefs):
+        system = centred.T @ centred / observations + penalty * np.eye(features)
+        expected = np.linalg.solve(system, centred.T @ (y - y.mean()) / observations)
+        assert np.allclose(expected, coefs)
+
+
+@pytest.mark.parametrize(["l1_ratio"], [[1.0], [0.5]])
+def test_path_matches_statsmodels_elastic_net(l1_ratio):
+    X, y = generate_correlated_data(150, 6, 2)
+    path = ElasticNetPath(X, y, l1_ratio=l1_ratio, standardize=False)
+
+    results = path.fit(path.get_lambdas(20, 1e-2), tol=1e-10)
+
+    design = sm.add_constant(X)
+
+    def objective(params, penalty):
+        squared_error = 0.5 * np.mean((y - design @ params) ** 2)
+        l1 = l1_ratio * np.abs(params[1:]).sum()
+        l2 = (1 - l1_ratio) * np.sum(params[1:] ** 2) / 2
+        return squared_error + penalty * (l1 + l2)
+
+    for index in range(20):
+        penalty = results.lambdas[index]
+        coefs = results.get_coefficients().iloc[index].to_numpy()
+
+        def fit_statsmodels(start_params=None):
+            return sm.OLS(y, design).fit_regularized(
+                method="elastic_net",
+                alpha=np.r_[0, np.full(6, penalty)],
+                L1_wt=l1_ratio,
+                start_params=start_params,
+                cnvrg_tol=1e-12,
+                maxiter=1000,
+            ).params
+
+        # statsmodels never revisits a coefficient once a sweep zeroes it,
+        # so from a cold start it can stop short of the optimum; from ours
+        # its descent must stay put, and a cold start must do no better
+        assert np.allclose(fit_statsmodels(coefs), coefs, rtol=0, atol=1e-9)
+        assert objective(coefs, penalty) <= objective(fit_statsmodels(), penalty) + 1e-12
+
+
+def test_lasso_solutions_satisfy_kkt_conditions():
+    X, y = generate_correlated_data(300, 10, 3)
+    path = ElasticNetPath(X, y)
+
+    results = path.fit(tol=1e-10)
+
+    standardized = results.coefs * path.x_scale
+    for penalty, beta in zip(results.lambdas, standardized):
+        gradient = path.covariance - path.gram @ beta
+        active = beta != 0
+        assert np.allclose(gradient[active], penalty * np.sign(beta[active]), atol=1e-6)
+        assert (np.abs(gradient[~active]) <= penalty * (1 + 1e-6)).all()
+    assert 0 == results.get_degrees_of_freedom()[0]
+
+
+def test_small_penalties_recover_ols():
+    X, y = generate_correlated_data(100, 4, 4)
+    expected = sm.OLS(y, sm.add_constant(X)).fit()
+
+    results = ElasticNetPath(X, y, l1_ratio=0.5).fit([1e-10], tol=1e-12)
+
+    assert np.allclose(expected.params, results.get_coefficients().iloc[0], atol=1e-6)
+
+
+def test_path_predictions_feed_error_calculators():
+    df = model_generator.DataPipeline(RAW_DATA_PATH).normalized()
+    y = df["salary"].to_numpy()
+
+    results = fit_elastic_net_path(df, FEATURES, l1_ratio=0.5)
+    y_hats = results.predict(df[FEATURES])
+
+    batch = BatchErrorCalculator(y, y_hats, results.get_model_names())
+    single = ErrorCalculator(y, results.predict(df[FEATURES], -1))
+
+    assert y_hats.shape == (len(results.lambdas), y.size)
+    assert np.isclose(single.get_mse(), batch.get_mse()[-1])
+    assert np.all(np.diff(batch.get_mse()) <= 1e-12)
+
+
+def test_that_warning_is_raised_without_convergence():
+    X, y = generate_correlated_data(100, 6, 6)
+    path = ElasticNetPath(X, y, l1_ratio=0.5)
+
+    with pytest.warns(ConvergenceWarning, match="did not converge"):
+        path.fit([path.get_lambda_max() / 100], tol=1e-14, max_iter=1)
+
+
+def test_that_error_is_raised_for_invalid_l1_ratio():
+    X, y = generate_correlated_data(20, 2, 5)
+
+    with pytest.raises(ValueError):
+        ElasticNetPath(X, y, l1_ratio=1.5)
@@ -1,5 +1,7 @@
+from utilities.error_calculator import BatchErrorCalculator
 from utilities.error_calculator import ErrorCalculator
 from collections import OrderedDict
+import pandas as pd
 import numpy as np
 import pytest
 import json
@@ -110,3 +112,105 @@ def test_error_summary(capsys):
     stdout, _ = capsys.readouterr()
     assert expected == stdout
 
+
+@pytest.mark.parametrize(
+    ["y", "y_hats"],
+    [
+        (np.array([1, 2, 3, 4]), np.array([[-1, 2, 3, 4], [1, 2, 3, 4]])),
+        (np.array([42, 43, 44, 45]), np.array([[132, 233, 634, 235], [40, 41, 42, 43]])),
+        (
+            np.random.default_rng(0).normal(size=50),
+            np.random.default_rng(1).normal(size=(7, 50)),
+        ),
+    ],
+)
+def test_batch_matches_individual_calculators(y, y_hats):
+    calc = BatchErrorCalculator(y, y_hats)
+    calcs = [ErrorCalculator(y, y_hat) for y_hat in y_hats]
+
+    residuals = np.array([c.get_residuals() for c in calcs])
+    standardised = np.array([c.get_standardised_residuals() for c in calcs])
+
+    assert np.allclose(residuals, calc.get_residuals())
+    assert np.allclose(standardised, calc.get_standardised_residuals())
+    assert np.allclose([c.get_mse() for c in calcs], calc.get_mse())
+    assert np.allclose([c.get_rmse() for c in calcs], calc.get_rmse())
+
+
+def test_batch_error_summary():
+    y = np.array([1, 2, 3, 4])
+    y_hats = np.array([[-1, 2, 3, 4], [1, 2, 3, 4]])
+
+    summary = BatchErrorCalculator(y, y_hats, ["a", "b"]).error_summary()
+
+    expected = pd.DataFrame(
+        OrderedDict(
+            {
+                "Average Standardised Residuals": [0.35355339059327373, 0.0],
+                "Minimum Standardised Residuals": [0.0, 0.0],
+                "Maximum Standardised Residuals": [1.414213562373095, 0.0],
+                "MSE": [1.0, 0.0],
+                "RMSE": [1.0, 0.0],
+            }
+        ),
+        index=["a", "b"],
+    )
+    pd.testing.assert_frame_equal(expected, summary)
+
+
+def test_residual_pass_runs_once_per_prediction(monkeypatch):
+    calls = []
+    subtract = np.subtract
+
+    def counting_subtract(*args, **kwargs):
+        calls.append(args)
+        return subtract(*args, **kwargs)
+
+    monkeypatch.setattr(np, "subtract", counting_subtract)
+    calc = ErrorCalculator(np.array([1.0, 2.0, 3.0]), np.array([1.5, 2.0, 2.0]))
+
+    calc.get_mse()
+    calc.get_rmse()
+    calc.get_standardised_residuals()
+    calc.error_summary()
+
+    assert 1 == len(calls)
+
+
+def test_cache_is_invalidated_when_predictions_change():
+    calc = ErrorCalculator(np.array([1, 2, 3]), np.array([1, 2, 3]))
+    assert 0 == calc.get_mse()
+
+    calc.y_hat = np.array([2, 3, 4])
+
+    assert 1 == calc.get_mse()
+    assert all(np.array([-1, -1, -1]) == calc.get_residuals())
+
+
+def test_invalid_replacement_predictions_are_rejected():
+    calc = ErrorCalculator(np.array([1, 2, 3]), np.array([1, 2, 3]))
+    with pytest.raises(TypeError, match="^.* equal observations .*$"):
+        calc.y_hat = np.array([1, 2])
+
+
+def test_cached_arrays_are_read_only():
+    calc = ErrorCalculator(np.array([1.0, 2.0, 3.0]), np.array([0.0, 2.0, 3.0]))
+    with pytest.raises(ValueError):
+        calc.get_residuals()[0] = 0
+    with pytest.raises(ValueError):
+        calc.get_standardised_residuals()[0] = 0
+
+
+def test_results_are_written_into_preallocated_buffers():
+    y = np.array([42.0, 43.0, 44.0, 45.0])
+    y_hat = np.array([132.0, 233.0, 634.0, 235.0])
+    residuals_buffer = np.empty(4)
+    standardised_buffer = np.empty(4)
+
+    calc = ErrorCalculator(y, y_hat, residuals_buffer=residuals_buffer)
+    standardised = calc.get_standardised_residuals(out=standardised_buffer)
+
+    assert calc.get_residuals() is residuals_buffer
+    assert standardised is standardised_buffer
+    assert all(y - y_hat == residuals_buffer)
+    assert all(np.array([-0.19446, -0.41053, -1.27480, -0.41053]) == standardised.round(5))
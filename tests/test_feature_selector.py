@@ -0,0 +1,58 @@
+from statsmodels.stats.outliers_influence import variance_inflation_factor
+from utilities.feature_selector import get_variance_inflation_factors
+from utilities.feature_selector import screen_collinear_features
+import statsmodels.api as sm
+import pandas as pd
+import numpy as np
+import pytest
+
+
+def _generate_df(observations, features, seed):
+    rng = np.random.default_rng(seed)
+    values = rng.normal(size=(observations, features))
+    values[:, -1] = values[:, 0] + 0.1 * values[:, -1]
+    columns = [f"feature_{index}" for index in range(features)]
+    return pd.DataFrame(values, columns=columns)
+
+
+@pytest.mark.parametrize(
+    ["observations", "features", "seed"],
+    [(30, 2, 0), (50, 4, 1), (200, 12, 2)],
+)
+def test_vifs_match_auxiliary_regressions(observations, features, seed):
+    df = _generate_df(observations, features, seed)
+    design = sm.add_constant(df).to_numpy()
+    expected = [
+        variance_inflation_factor(design, index)
+        for index in range(1, features + 1)
+    ]
+
+    vifs = get_variance_inflation_factors(df)
+
+    assert list(df.columns) == list(vifs.index)
+    assert np.allclose(expected, vifs.to_numpy())
+
+
+def test_constant_and_perfectly_collinear_columns_are_flagged():
+    df = _generate_df(40, 3, 3)
+    df["constant"] = 1.0
+    df["duplicate"] = df["feature_1"] * 2
+
+    vifs = get_variance_inflation_factors(df)
+
+    assert np.isinf(vifs["constant"])
+    assert vifs["duplicate"] > 1e6
+    assert np.isfinite(vifs).sum() == 4
+
+
+@pytest.mark.parametrize(
+    ["threshold", "expected"],
+    [
+        (1_000, ["feature_0", "feature_1", "feature_2", "feature_3"]),
+        (10, ["feature_0", "feature_1", "feature_2"]),
+    ],
+)
+def test_screening_removes_the_most_collinear_feature(threshold, expected):
+    df = _generate_df(100, 4, 4)
+    features = screen_collinear_features(df, df.columns, threshold)
+    assert expected == features
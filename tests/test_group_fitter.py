@@ -0,0 +1,85 @@
+from utilities.group_fitter import fit_groups
+from utilities import model_generator
+from helpers import RAW_DATA_PATH
+import statsmodels.api as sm
+import pandas as pd
+import numpy as np
+import pytest
+
+
+FEATURES = ["years_in_field", "market_value", "years_at_rank", "is_male", "has_degree"]
+
+
+def _generate_df(observations, groups, seed):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(observations, 3)), columns=list("abc"))
+    df["region"] = rng.integers(0, groups, size=observations)
+    df["level"] = rng.choice(["low", "high"], size=observations)
+    slopes = rng.normal(size=(groups, 3))
+    df["salary"] = np.einsum("ij,ij->i", df[list("abc")], slopes[df["region"]])
+    df["salary"] += rng.normal(size=observations)
+    return df
+
+
+def _fit_each_group(df, features, by):
+    return {
+        key: sm.OLS(group["salary"], sm.add_constant(group[features], has_constant="add")).fit()
+        for key, group in df.groupby(by)
+    }
+
+
+@pytest.mark.parametrize(
+    ["observations", "groups", "chunk_size"],
+    [(200, 3, 7), (1000, 10, 64), (5000, 40, 100_000)],
+)
+def test_grouped_fits_match_fitting_each_group(observations, groups, chunk_size):
+    df = _generate_df(observations, groups, groups)
+
+    table = fit_groups(df, list("abc"), ["region", "level"], chunk_size=chunk_size)
+
+    for key, model in _fit_each_group(df, list("abc"), ["region", "level"]).items():
+        assert np.allclose(model.params, table.loc[key, "params"])
+        assert np.allclose(model.bse, table.loc[key, "bse"])
+        assert np.isclose(model.rsquared, table.loc[key, ("fit", "rsquared")])
+        assert np.isclose(model.rsquared_adj, table.loc[key, ("fit", "rsquared_adj")])
+        assert model.nobs == table.loc[key, ("fit", "nobs")]
+
+
+def test_grouped_fits_handle_collinear_segments():
+    df = model_generator.clean_df(model_generator.read_in_df(RAW_DATA_PATH))
+    features = FEATURES + ["engineering_department", "finance_department"]
+    by = ["employee_position", "engineering_department"]
+
+    table = fit_groups(df, features, by)
+
+    assert (table[("fit", "rank")] < len(features) + 1).any()
+    for key, model in _fit_each_group(df, features, by).items():
+        assert model.model.rank == table.loc[key, ("fit", "rank")]
+        assert np.allclose(model.params, table.loc[key, "params"])
+        assert np.allclose(model.bse, table.loc[key, "bse"], equal_nan=True)
+        assert np.isclose(model.ssr, table.loc[key, ("fit", "ssr")])
+
+
+def test_grouped_fits_accept_key_arrays():
+    df = _generate_df(300, 4, 0)
+
+    by_column = fit_groups(df, ["a"], "region")
+    by_array = fit_groups(df, ["a"], df["region"].to_numpy())
+
+    assert np.allclose(by_column.to_numpy(), by_array.to_numpy())
+    assert [0, 1, 2, 3] == list(by_column.index)
+
+
+def test_rows_with_missing_keys_join_no_group():
+    df = _generate_df(400, 3, 1)
+    df["region"] = df["region"].astype(float)
+    df.loc[::7, "region"] = np.nan
+    df.loc[::11, "level"] = None
+
+    table = fit_groups(df, list("abc"), ["region", "level"])
+
+    expected = _fit_each_group(df, list("abc"), ["region", "level"])
+    assert list(expected) == list(table.index)
+    for key, model in expected.items():
+        assert np.allclose(model.params, table.loc[key, "params"])
+        assert model.nobs == table.loc[key, ("fit", "nobs")]
@@ -0,0 +1,44 @@
+import subprocess
+import pytest
+import sys
+
+
+def _get_loaded_modules(statement):
+    program = (
+        f"{statement}\n"
+        "import sys\n"
+        "print(' '.join(sorted(sys.modules)))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", program],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize(
+    ["statement", "deferred"],
+    [
+        (
+            "from utilities.error_calculator import ErrorCalculator",
+            ["pandas", "statsmodels", "matplotlib", "seaborn", "scipy"],
+        ),
+        (
+            "from utilities.plotter import Plotter",
+            ["pandas", "statsmodels", "matplotlib", "seaborn"],
+        ),
+        (
+            "from utilities.influence_calculator import InfluenceCalculator",
+            ["statsmodels", "matplotlib", "seaborn"],
+        ),
+        (
+            "from utilities.model_generator import generate_models",
+            ["statsmodels", "matplotlib", "seaborn"],
+        ),
+    ],
+)
+def test_heavy_dependencies_are_deferred(statement, deferred):
+    loaded = _get_loaded_modules(statement)
+    assert not loaded & set(deferred)
@@ -1,4 +1,5 @@
 from utilities.influence_calculator import InfluenceCalculator
+from helpers import generate_data
 import statsmodels.api as sm
 import numpy as np
 import pytest
@@ -45,3 +46,45 @@ def test_leverage(X, y, leverage):
 
     assert all(leverage.round(5) == modelled_leverage.round(5))
 
+
+def _fit_random_model(observations, features, seed):
+    X, y = generate_data(observations, features, seed, degrees_of_freedom=3)
+    return sm.OLS(y, X).fit()
+
+
+@pytest.mark.parametrize(
+    ["observations", "features", "seed"],
+    [(12, 1, 0), (40, 3, 1), (150, 6, 2)],
+)
+def test_closed_form_diagnostics_match_statsmodels(observations, features, seed):
+    model = _fit_random_model(observations, features, seed)
+    expected = model.get_influence()
+
+    calculator = InfluenceCalculator(model)
+
+    assert np.allclose(expected.hat_matrix_diag, calculator.leverage())
+    assert np.allclose(expected.cooks_distance[0], calculator.cooks_distance()[0])
+    assert np.allclose(expected.cooks_distance[1], calculator.cooks_distance()[1])
+    assert np.allclose(expected.resid_studentized_external, calculator.studentized_residuals())
+    assert np.allclose(expected.dffits[0], calculator.dffits()[0])
+    assert np.isclose(expected.dffits[1], calculator.dffits()[1])
+    assert np.allclose(expected.dfbetas, calculator.dfbetas())
+
+
+def test_rank_deficient_designs_match_statsmodels():
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(30, 3))
+    X = np.column_stack([X, X[:, 0] + X[:, 1]])
+    y = rng.normal(size=30)
+    model = sm.OLS(y, X).fit()
+
+    calculator = InfluenceCalculator(model)
+
+    assert np.allclose(model.get_influence().hat_matrix_diag, calculator.leverage())
+    assert np.allclose(model.get_influence().cooks_distance[0], calculator.cooks_distance()[0])
+
+
+def test_diagnostics_are_computed_once():
+    calculator = InfluenceCalculator(_fit_random_model(20, 2, 4))
+    assert calculator.cooks_distance() is calculator.cooks_distance()
+    assert calculator.dfbetas() is calculator.dfbetas()
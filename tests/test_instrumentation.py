@@ -0,0 +1,165 @@
+from concurrent.futures import ThreadPoolExecutor
+from utilities.instrumentation import instrumented
+from utilities.instrumentation import instrument
+from utilities.instrumentation import get_recorder
+from utilities import model_generator
+from helpers import RAW_DATA_PATH
+import numpy as np
+import subprocess
+import tracemalloc
+import threading
+import pickle
+import json
+import sys
+import os
+
+
+FEATURES = [
+    "years_in_field",
+    "executive_position",
+    "market_value",
+    "engineering_department",
+]
+
+
+@instrument(stage="allocate")
+def _allocate(size):
+    return np.ones(size, dtype=np.uint8)
+
+
+@instrument(stage="outer")
+def _allocate_nested(size):
+    data = np.ones(size, dtype=np.uint8)
+    del data
+    return _allocate(size // 4)
+
+
+def test_nothing_is_recorded_when_disabled():
+    assert get_recorder() is None
+
+    _allocate(10)
+
+    assert get_recorder() is None
+
+
+def test_pipeline_stages_are_recorded_with_rows():
+    with instrumented() as recorder:
+        df = model_generator.read_in_df(RAW_DATA_PATH)
+        df = model_generator.normalize_data(model_generator.clean_df(df))
+        model_generator.create_model(df, FEATURES)
+
+    stages = [record["stage"] for record in recorder.records]
+    summary = recorder.get_summary()
+
+    assert get_recorder() is None
+    assert stages[-1] == "create_model"
+    assert {"read_in_df", "clean_df", "remove_outliers", "hot_encode", "normalize_data"} <= set(stages)
+    assert len(df) == summary["clean_df"]["rows"]
+    assert len(df) == summary["create_model"]["rows"]
+    assert summary["create_model"]["peak_bytes"] is None
+
+
+def test_nested_stages_keep_the_outer_peak():
+    size = 4_000_000
+
+    with instrumented(trace_memory=True) as recorder:
+        _allocate_nested(size)
+
+    inner, outer = recorder.records
+
+    assert "allocate" == inner["stage"]
+    assert "outer" == outer["stage"]
+    assert size // 4 <= inner["peak_bytes"] < size
+    assert size <= outer["peak_bytes"]
+
+
+@instrument(stage="overlap")
+def _allocate_together(barrier, size):
+    data = np.ones(size, dtype=np.uint8)
+    barrier.wait()
+    return data
+
+
+def test_overlapping_threads_record_no_shared_peak():
+    size = 4_000_000
+    barrier = threading.Barrier(2)
+
+    with instrumented(trace_memory=True) as recorder:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            list(executor.map(_allocate_together, [barrier] * 2, [size] * 2))
+        _allocate(size)
+
+    *overlapping, alone = recorder.records
+
+    assert not tracemalloc.is_tracing()
+    assert [None, None] == [record["peak_bytes"] for record in overlapping]
+    assert size <= alone["peak_bytes"]
+    assert 2 == recorder.get_summary()["overlap"]["calls"]
+    assert recorder.get_summary()["overlap"]["peak_bytes"] is None
+
+
+def test_threaded_fits_record_every_call():
+    df = model_generator.normalize_data(model_generator.clean_df(model_generator.read_in_df(RAW_DATA_PATH)))
+    feature_sets = {f"Model {index}": FEATURES[:index] for index in range(1, 5)}
+
+    with instrumented(trace_memory=True) as recorder:
+        model_generator.fit_models(df, feature_sets, "thread", max_workers=2)
+
+    summary = recorder.get_summary()
+
+    assert not tracemalloc.is_tracing()
+    assert 4 == summary["create_model"]["calls"]
+    assert 4 * len(df) == summary["create_model"]["rows"]
+
+
+def test_that_instrumented_functions_can_be_pickled():
+    assert model_generator.create_model is pickle.loads(pickle.dumps(model_generator.create_model))
+
+
+def test_records_are_capped_while_the_summary_counts_every_call():
+    with instrumented(max_records=3) as recorder:
+        for size in range(1, 11):
+            _allocate(size)
+
+    assert [8, 9, 10] == [record["rows"] for record in recorder.records]
+    assert 10 == recorder.get_summary()["allocate"]["calls"]
+    assert 55 == recorder.get_summary()["allocate"]["rows"]
+
+
+def test_records_are_written_as_json_lines_and_prometheus(tmp_path):
+    with instrumented() as recorder:
+        _allocate(10)
+        _allocate(20)
+
+    recorder.write(str(tmp_path / "stages.jsonl"))
+    recorder.write(str(tmp_path / "stages.prom"))
+
+    records = [json.loads(line) for line in (tmp_path / "stages.jsonl").read_text().splitlines()]
+    metrics = (tmp_path / "stages.prom").read_text()
+
+    assert [10, 20] == [record["rows"] for record in records]
+    assert 'utilities_stage_calls_total{stage="allocate"} 2' in metrics
+    assert 'utilities_stage_rows_total{stage="allocate"} 30' in metrics
+    assert "utilities_stage_peak_bytes{" not in metrics
+
+
+def test_recording_is_enabled_from_the_environment(tmp_path):
+    path = tmp_path / "stages.prom"
+    program = (
+        "from utilities import model_generator\n"
+        f"model_generator.read_in_df({str(RAW_DATA_PATH)!r})\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", program],
+        check=True,
+        env={
+            **os.environ,
+            "UTILITIES_INSTRUMENTATION": str(path),
+            "UTILITIES_TRACE_MEMORY": "1",
+        },
+    )
+
+    metrics = path.read_text()
+
+    assert 'utilities_stage_calls_total{stage="read_in_df"} 1' in metrics
+    assert 'utilities_stage_peak_bytes{stage="read_in_df"}' in metrics
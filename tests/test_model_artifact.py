@@ -0,0 +1,77 @@
+from utilities.model_artifact import export_models
+from utilities.model_artifact import export_model
+from utilities.model_artifact import load_models
+from utilities.model_artifact import load_model
+from utilities import model_generator
+from helpers import RAW_DATA_PATH
+import statsmodels.api as sm
+import pandas as pd
+import numpy as np
+import pytest
+
+
+FEATURES = ["years_in_field", "executive_position", "market_value", "engineering_department"]
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    pipeline = model_generator.DataPipeline(RAW_DATA_PATH)
+    df = pipeline.normalized()
+    model = model_generator.create_model(df, FEATURES)
+    return df, model, pipeline.statistics()
+
+
+def test_artifact_predictions_match_the_fitted_model(fitted, tmp_path):
+    df, model, statistics = fitted
+    export_model(model, tmp_path, statistics)
+
+    artifact = load_model(tmp_path)
+
+    assert FEATURES == artifact.features
+    expected = model.predict(sm.add_constant(df[FEATURES].astype(float)))
+    assert np.allclose(expected, artifact.predict(df[FEATURES]))
+
+
+def test_artifact_arrays_are_memory_mapped(fitted, tmp_path):
+    _, model, statistics = fitted
+    export_model(model, tmp_path, statistics)
+
+    artifact = load_model(tmp_path)
+
+    assert isinstance(artifact.coefficients, np.memmap)
+    assert not artifact.coefficients.flags.writeable
+
+
+def test_artifact_keeps_normalization_constants(fitted, tmp_path):
+    _, model, statistics = fitted
+    export_model(model, tmp_path, statistics)
+
+    artifact = load_model(tmp_path, mmap_mode=None)
+
+    assert model_generator.LOG_SHIFT == artifact.log_shift
+    assert statistics["salary_median"] == artifact.statistics["salary_median"]
+    for key in ["lower_bound", "upper_bound", "medians"]:
+        pd.testing.assert_series_equal(statistics[key], artifact.statistics[key], check_names=False)
+    assert model_generator.FIELDS_OF_WORK == artifact.categories["field_of_work"]
+    assert model_generator.EMPLOYEE_POSITIONS == artifact.categories["employee_position"]
+
+
+def test_models_round_trip_by_name(fitted, tmp_path):
+    df, model, statistics = fitted
+    models = {"Model 3": model, "Model 4": model_generator.create_model(df, FEATURES[:2])}
+
+    export_models(models, tmp_path, statistics)
+    artifacts = load_models(tmp_path, models)
+
+    assert ["Model 3", "Model 4"] == list(artifacts)
+    assert (tmp_path / "model_4" / "coefficients.npy").exists()
+    assert FEATURES[:2] == artifacts["Model 4"].features
+
+
+def test_that_error_is_raised_for_unknown_format(fitted, tmp_path):
+    _, model, statistics = fitted
+    export_model(model, tmp_path, statistics)
+    np.save(tmp_path / "format_version.npy", np.array(99))
+
+    with pytest.raises(ValueError, match="^expected artifact format 1, got 99$"):
+        load_model(tmp_path)
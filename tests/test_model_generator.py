@@ -0,0 +1,153 @@
+from utilities.model_generator import DataPipeline
+from utilities import model_generator
+from helpers import RAW_DATA_PATH
+import pandas as pd
+import numpy as np
+import shutil
+import pytest
+import os
+
+
+@pytest.fixture
+def raw_data_path(tmp_path):
+    path = tmp_path / "salary_raw.csv"
+    shutil.copy(RAW_DATA_PATH, path)
+    return path
+
+
+@pytest.fixture
+def read_counter(monkeypatch):
+    calls = []
+    read_in_df = model_generator.read_in_df
+
+    def counting_read_in_df(path=None):
+        calls.append(path)
+        return read_in_df(path)
+
+    monkeypatch.setattr(model_generator, "read_in_df", counting_read_in_df)
+    return calls
+
+
+def test_pipeline_matches_the_uncached_chain(raw_data_path):
+    df = model_generator.read_in_df(raw_data_path)
+    expected = model_generator.normalize_data(model_generator.clean_df(df))
+
+    normalized = DataPipeline(raw_data_path).normalized()
+
+    pd.testing.assert_frame_equal(expected, normalized)
+
+
+def test_stages_are_parsed_once_per_content(raw_data_path, read_counter):
+    pipeline = DataPipeline(raw_data_path)
+
+    pipeline.normalized()
+    pipeline.normalized()
+    pipeline.cleaned()
+
+    assert 1 == len(read_counter)
+
+    with open(raw_data_path, "a") as file:
+        file.write("60000,1,1,1,1.0,1,0,1,1,1,0\n")
+
+    assert 515 == len(pipeline.raw())
+    assert 2 == len(read_counter)
+
+
+def test_only_the_current_content_is_cached(raw_data_path):
+    pipeline = DataPipeline(raw_data_path)
+
+    pipeline.normalized()
+    pipeline.statistics()
+    stages = set(pipeline._stages)
+
+    os.utime(raw_data_path, ns=(0, 0))
+    pipeline.normalized()
+
+    assert stages == set(pipeline._stages)
+
+    with open(raw_data_path, "a") as file:
+        file.write("60000,1,1,1,1.0,1,0,1,1,1,0\n")
+    pipeline.raw()
+    content_hash = pipeline.get_content_hash()
+
+    assert 1 == len(pipeline._hashes)
+    assert [(content_hash, "raw")] == list(pipeline._stages)
+    assert {} == pipeline._statistics
+
+
+def test_cached_stages_are_not_mutated_by_callers(raw_data_path):
+    pipeline = DataPipeline(raw_data_path)
+
+    df = pipeline.normalized()
+    df["salary"] = 0
+
+    assert (pipeline.normalized()["salary"] != 0).all()
+
+
+def test_stages_are_persisted_to_the_cache_dir(raw_data_path, read_counter, tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    expected = DataPipeline(raw_data_path, cache_dir).normalized()
+    normalized = DataPipeline(raw_data_path, cache_dir).normalized()
+
+    pd.testing.assert_frame_equal(expected, normalized)
+    assert 1 == len(read_counter)
+    assert 3 == len(list(cache_dir.glob("*.npz")))
+
+
+def test_that_error_is_raised_for_unknown_stage(raw_data_path):
+    with pytest.raises(ValueError, match="^expected a stage from .*$"):
+        DataPipeline(raw_data_path).get_stage("encoded")
+
+
+def _legacy_fill_corrupt_values(df):
+    df = df.copy()
+    for feat in model_generator.DISCRETE:
+        df[feat] = df[feat].apply(
+            lambda x: df[feat].median() if np.isnan(x) else x
+        )
+    return df
+
+
+def _legacy_remove_outliers(df):
+    df = df.copy()
+    discrete = model_generator.DISCRETE
+    q1 = df[discrete].quantile(0.25)
+    q3 = df[discrete].quantile(0.75)
+    iqr_range = (q3 - q1) * 1.5
+    inliers = (df[discrete] > q1 - iqr_range) & (df[discrete] < q3 + iqr_range)
+    df[discrete] = df[discrete][inliers]
+    return _legacy_fill_corrupt_values(df)
+
+
+@pytest.fixture
+def noisy_df():
+    df = model_generator.read_in_df(RAW_DATA_PATH)
+    rng = np.random.default_rng(0)
+    for feat in model_generator.DISCRETE:
+        df[feat] = df[feat].astype(np.float64)
+        df.loc[rng.random(len(df)) < 0.05, feat] = np.nan
+    return df
+
+
+def test_vectorized_fill_matches_per_row_fill(noisy_df):
+    expected = _legacy_fill_corrupt_values(noisy_df)
+    filled = model_generator.fill_corrupt_values(noisy_df)
+    pd.testing.assert_frame_equal(expected, filled)
+
+
+def test_vectorized_outlier_removal_matches_pandas_masking(noisy_df):
+    expected = model_generator.hot_encode(_legacy_remove_outliers(noisy_df))
+    cleaned = model_generator.remove_outliers(noisy_df)
+    pd.testing.assert_frame_equal(expected, cleaned)
+
+
+def test_outlier_bounds_match_pandas_quantiles(noisy_df):
+    discrete = model_generator.DISCRETE
+    q1 = noisy_df[discrete].quantile(0.25)
+    q3 = noisy_df[discrete].quantile(0.75)
+
+    lower_bound, upper_bound = model_generator.get_outlier_bounds(noisy_df)
+
+    pd.testing.assert_series_equal(q1 - (q3 - q1) * 1.5, lower_bound)
+    pd.testing.assert_series_equal(q3 + (q3 - q1) * 1.5, upper_bound)
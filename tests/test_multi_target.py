@@ -0,0 +1,66 @@
+from utilities.error_calculator import ErrorCalculator
+from utilities.multi_target import MultiTargetResults
+from utilities import model_generator
+from helpers import RAW_DATA_PATH
+from helpers import generate_data
+import statsmodels.api as sm
+import numpy as np
+import pytest
+
+
+FEATURES = ["years_in_field", "executive_position", "market_value", "engineering_department"]
+
+
+ATTRIBUTES = [
+    "params", "bse", "tvalues", "pvalues", "rsquared", "rsquared_adj",
+    "ssr", "centered_tss", "df_model", "df_resid", "nobs", "scale",
+    "llf", "aic", "bic", "fvalue", "f_pvalue",
+]
+
+
+@pytest.mark.parametrize(
+    ["observations", "features", "targets", "seed"],
+    [(20, 1, 1, 0), (100, 3, 4, 1), (500, 8, 6, 2)],
+)
+def test_each_target_matches_statsmodels(observations, features, targets, seed):
+    X, Y = generate_data(observations, features, seed, targets)
+    names = ["const"] + [f"x{index}" for index in range(features)]
+    labels = [f"y{index}" for index in range(targets)]
+
+    results = MultiTargetResults(X, Y, names, labels)
+
+    for position, target in enumerate(labels):
+        expected = sm.OLS(Y[:, position], X).fit()
+        single = results.get_results(target)
+        for attribute in ATTRIBUTES:
+            assert np.allclose(getattr(expected, attribute), getattr(single, attribute))
+        assert np.allclose(expected.params, results.params[target])
+        assert np.allclose(expected.resid, results.resid[target])
+        assert np.allclose(expected.fittedvalues, results.fittedvalues[target])
+
+
+def test_salary_targets_share_one_design():
+    pipeline = model_generator.DataPipeline(RAW_DATA_PATH)
+    df = pipeline.normalized().assign(salary_dollars=pipeline.cleaned()["salary"])
+    df["total_compensation"] = df["salary_dollars"] * 1.1 + 2_000 * df["executive_position"]
+
+    targets = ["salary", "salary_dollars", "total_compensation"]
+    results = model_generator.create_multi_target_model(df, FEATURES, targets)
+
+    expected = model_generator.create_model(df, FEATURES)
+    assert np.allclose(expected.params, results.params["salary"])
+    assert np.allclose(expected.bse, results.get_standard_errors()["salary"])
+    assert np.isclose(expected.rsquared, results.summary().loc["salary", "rsquared"])
+    assert targets == list(results.summary().index)
+
+    calculator = results.get_error_calculator("salary")
+    assert isinstance(calculator, ErrorCalculator)
+    assert np.isclose(np.mean(expected.resid ** 2), calculator.get_mse())
+
+
+def test_that_error_is_raised_for_rank_deficient_design():
+    X, Y = generate_data(30, 2, 3, targets=2)
+    X = np.column_stack([X, X[:, 1] * 2])
+
+    with pytest.raises(ValueError):
+        MultiTargetResults(X, Y, ["const", "a", "b", "c"], ["y0", "y1"])
@@ -0,0 +1,104 @@
+from utilities.stream_cleaner import stream_clean_df
+from utilities.ols_accumulator import fit_out_of_core
+from utilities import model_generator
+from utilities.ols_accumulator import OLSAccumulator
+from helpers import RAW_DATA_PATH
+import statsmodels.api as sm
+import pandas as pd
+import numpy as np
+import pytest
+
+
+MODEL_3_FEATURES = [
+    "years_in_field",
+    "executive_position",
+    "market_value",
+    "engineering_department",
+]
+
+
+ATTRIBUTES = [
+    "params", "bse", "tvalues", "pvalues", "rsquared", "rsquared_adj",
+    "ssr", "centered_tss", "df_model", "df_resid", "nobs", "scale",
+    "llf", "aic", "bic", "fvalue", "f_pvalue",
+]
+
+
+def _generate_df(observations, features, seed):
+    rng = np.random.default_rng(seed)
+    columns = [f"feature_{index}" for index in range(features)]
+    df = pd.DataFrame(rng.normal(size=(observations, features)), columns=columns)
+    df["salary"] = df.to_numpy() @ rng.normal(size=features) + rng.normal(size=observations) + 3
+    return df, columns
+
+
+def _chunks(df, count):
+    return [df.iloc[indices] for indices in np.array_split(np.arange(len(df)), count)]
+
+
+@pytest.mark.parametrize(["method"], [["gram"], ["qr"]])
+@pytest.mark.parametrize(["observations", "features", "count"], [(50, 1, 1), (300, 4, 7), (1000, 6, 13)])
+def test_streamed_fit_matches_statsmodels(method, observations, features, count):
+    df, columns = _generate_df(observations, features, count)
+    expected = sm.OLS(df["salary"], sm.add_constant(df[columns])).fit()
+
+    results = fit_out_of_core(_chunks(df, count), columns, method=method)
+
+    for attribute in ATTRIBUTES:
+        assert np.allclose(getattr(expected, attribute), getattr(results, attribute))
+    assert np.allclose(expected.predict(sm.add_constant(df[columns])), results.predict(df))
+
+
+def test_streamed_salary_model_matches_create_model():
+    df = model_generator.read_in_df(RAW_DATA_PATH)
+    df = model_generator.normalize_data(model_generator.clean_df(df))
+    expected = model_generator.create_model(df, MODEL_3_FEATURES)
+
+    chunks = stream_clean_df(RAW_DATA_PATH, chunksize=64)
+    results = fit_out_of_core(chunks, MODEL_3_FEATURES)
+
+    assert np.allclose(expected.params, results.params)
+    assert np.allclose(expected.bse, results.bse)
+    assert np.isclose(expected.rsquared, results.rsquared)
+
+
+@pytest.mark.parametrize(["left_method", "right_method"], [["gram", "qr"], ["qr", "gram"], ["qr", "qr"]])
+def test_merged_accumulators_match_a_single_pass(left_method, right_method):
+    df, columns = _generate_df(200, 3, 5)
+    expected = OLSAccumulator(columns).update(df).fit()
+
+    left = OLSAccumulator(columns, method=left_method).update(df.iloc[:80])
+    right = OLSAccumulator(columns, method=right_method).update(df.iloc[80:])
+    results = left.merge(right).fit()
+
+    assert np.allclose(expected.params, results.params)
+    assert np.allclose(expected.bse, results.bse)
+    assert 200 == results.nobs
+
+
+@pytest.mark.parametrize(["method"], [["gram"], ["qr"]])
+@pytest.mark.parametrize(["observations", "features", "removed"], [(60, 1, 1), (300, 4, 40), (500, 6, 250)])
+def test_removed_rows_match_a_fit_without_them(method, observations, features, removed):
+    df, columns = _generate_df(observations, features, removed)
+    expected = sm.OLS(df["salary"].iloc[removed:], sm.add_constant(df[columns].iloc[removed:])).fit()
+
+    accumulator = OLSAccumulator(columns, method=method).update(df)
+    results = accumulator.remove(df.iloc[:removed]).fit()
+
+    for attribute in ATTRIBUTES:
+        assert np.allclose(getattr(expected, attribute), getattr(results, attribute))
+
+
+def test_that_error_is_raised_for_rows_never_accumulated():
+    df, columns = _generate_df(20, 2, 0)
+    accumulator = OLSAccumulator(columns, method="qr").update(df.iloc[:10])
+
+    with pytest.raises(ValueError, match="^expected a positive-definite downdate"):
+        accumulator.remove(df.iloc[10:] * 100)
+    with pytest.raises(ValueError, match="loses rank"):
+        accumulator.remove(df.iloc[:10])
+
+
+def test_that_error_is_raised_for_unknown_method():
+    with pytest.raises(ValueError, match="^expected a method from .*$"):
+        OLSAccumulator(["feature_0"], method="svd")
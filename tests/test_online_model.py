@@ -0,0 +1,119 @@
+from utilities.online_model import OnlineModel
+from utilities import model_generator
+from helpers import RAW_DATA_PATH
+import statsmodels.api as sm
+import pandas as pd
+import numpy as np
+import pytest
+
+
+CAPACITY = 1_000_000
+FEATURES = [
+    "prior_experience_original",
+    "years_in_field",
+    "years_at_rank",
+    "market_value",
+    "employee_position",
+    "is_male",
+    "engineering_department",
+    "finance_department",
+]
+
+
+@pytest.fixture(scope="module")
+def raw():
+    return model_generator.read_in_df(RAW_DATA_PATH)
+
+
+def _process(df):
+    return model_generator.normalize_data(model_generator.clean_df(df))
+
+
+def _fit(df):
+    return sm.OLS(df["salary"], sm.add_constant(df[FEATURES].astype(float))).fit()
+
+
+def test_online_fit_matches_a_full_rebuild(raw):
+    expected = model_generator.create_model(_process(raw), FEATURES)
+
+    results = OnlineModel.from_df(raw, FEATURES, capacity=CAPACITY).fit()
+
+    assert np.allclose(expected.params, results.params)
+    assert np.allclose(expected.bse, results.bse)
+    assert expected.nobs == results.nobs
+
+
+@pytest.mark.parametrize(["method"], [["gram"], ["qr"]])
+def test_deltas_are_cleaned_with_current_statistics(raw, method):
+    history, delta = raw.iloc[:400], raw.iloc[400:]
+
+    model = OnlineModel.from_df(history, FEATURES, capacity=CAPACITY, method=method)
+    model.add(delta)
+
+    statistics = model_generator.get_cleaning_statistics(raw)
+    expected = _fit(pd.concat([
+        _process(history),
+        model_generator.normalize_data(model_generator.clean_df(delta, statistics)),
+    ]))
+    results = model.fit()
+
+    assert np.allclose(expected.params, results.params)
+    assert np.isclose(expected.rsquared, results.rsquared)
+    for name in ["lower_bound", "upper_bound", "medians"]:
+        assert np.allclose(statistics[name], model.statistics()[name][model_generator.DISCRETE])
+
+
+def test_removed_rows_leave_no_trace(raw):
+    history, delta = raw.iloc[:400], raw.iloc[400:]
+    expected = _fit(_process(history))
+
+    model = OnlineModel.from_df(history, FEATURES, capacity=CAPACITY)
+    model.add(delta).remove(delta.index)
+
+    statistics = model_generator.get_cleaning_statistics(history)
+    assert np.allclose(expected.params, model.fit().params)
+    assert np.isclose(statistics["salary_median"], model.statistics()["salary_median"])
+    assert np.allclose(statistics["medians"], model.statistics()["medians"])
+    assert 400 == len(model)
+
+
+def test_corrections_can_be_reverted(raw):
+    model = OnlineModel.from_df(raw, FEATURES, capacity=CAPACITY)
+    expected = model.fit()
+
+    corrected = raw.iloc[:10].assign(market_value=raw["market_value"].iloc[:10] * 1.5)
+    changed = model.correct(corrected).fit()
+    reverted = model.correct(raw.iloc[:10]).fit()
+
+    assert not np.allclose(expected.params, changed.params)
+    assert np.allclose(expected.params, reverted.params)
+    assert len(raw) == reverted.nobs
+
+
+def test_that_error_is_raised_for_unknown_or_repeated_rows(raw):
+    model = OnlineModel.from_df(raw.iloc[:100], FEATURES)
+
+    with pytest.raises(ValueError):
+        model.add(raw.iloc[50:150])
+    with pytest.raises(ValueError):
+        model.remove([100, 101])
+
+
+def test_removing_no_rows_is_a_no_op(raw):
+    model = OnlineModel.from_df(raw.iloc[:100], FEATURES)
+    expected = model.fit()
+
+    results = model.remove([]).remove(raw.iloc[:0]).fit()
+
+    assert np.array_equal(expected.params, results.params)
+    assert 100 == len(model)
+
+
+def test_rows_can_be_re_added_after_removal(raw):
+    expected = OnlineModel.from_df(raw, FEATURES, capacity=CAPACITY).fit()
+
+    model = OnlineModel.from_df(raw, FEATURES, capacity=CAPACITY)
+    model.remove(raw.index[::3]).add(raw.iloc[::3])
+
+    assert np.allclose(expected.params, model.fit().params)
+    assert len(raw) == len(model)
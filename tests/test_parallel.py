@@ -0,0 +1,83 @@
+from concurrent.futures import ProcessPoolExecutor
+from utilities.parallel import map_with_executor
+from utilities.parallel import read_shared_arrays
+from utilities.parallel import read_shared_frame
+from utilities.parallel import get_shard_sizes
+from utilities.parallel import SharedArrays
+from utilities.model_generator import fit_models
+from utilities.parallel import SharedFrame
+import pandas as pd
+import numpy as np
+import pytest
+
+
+def _generate_df(observations, seed):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(observations, 4)), columns=list("abcd"))
+    df["salary"] = df.to_numpy() @ rng.normal(size=4) + rng.normal(size=observations)
+    return df
+
+
+FEATURE_SETS = {
+    "Model 1": ["a", "b", "c", "d"],
+    "Model 2": ["a", "c"],
+    "Model 3": ["d"],
+}
+
+
+@pytest.mark.parametrize(["executor", "step"], [
+    [None, 1],
+    ["thread", 1],
+    ["process", 1],
+    ["thread", 2],
+    ["process", 2],
+])
+def test_parallel_fits_match_serial_fits(executor, step):
+    df = _generate_df(100, 0).iloc[::step]
+    expected = fit_models(df, FEATURE_SETS)
+
+    models = fit_models(df, FEATURE_SETS, executor, max_workers=2)
+
+    assert list(FEATURE_SETS) == list(models)
+    for name, model in models.items():
+        pd.testing.assert_series_equal(expected[name].params, model.params)
+        pd.testing.assert_series_equal(expected[name].resid, model.resid)
+        pd.testing.assert_index_equal(df.index, model.fittedvalues.index)
+
+
+def test_executor_instances_are_used_as_given():
+    df = _generate_df(50, 1)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        models = fit_models(df, FEATURE_SETS, executor)
+    assert 3 == len(models)
+
+
+def test_shared_frames_round_trip_selected_columns():
+    df = _generate_df(20, 2).iloc[::-2].assign(d=lambda df: df["d"] > 0, a=np.arange(10))
+    with SharedFrame(df) as handle:
+        shared = read_shared_frame(handle, ["d", "a"])
+    pd.testing.assert_frame_equal(df[["d", "a"]], shared)
+
+
+def test_shared_arrays_round_trip_and_plain_arrays_pass_through():
+    arrays = {"X": np.arange(12.0).reshape(6, 2), "y": np.arange(6), "empty": np.empty(0)}
+    with SharedArrays(arrays) as handle:
+        shared = read_shared_arrays(handle)
+        assert shared is read_shared_arrays(handle)
+        for name, values in arrays.items():
+            assert values.dtype == shared[name].dtype
+            assert np.array_equal(values, shared[name])
+    assert arrays is read_shared_arrays(arrays)
+
+
+@pytest.mark.parametrize(
+    ["count", "observations", "sizes"],
+    [(600, 100, [250, 250, 100]), (10, 1_000_000, [1] * 10), (9, 300_000, [3, 3, 3])],
+)
+def test_shards_shrink_as_observations_grow(count, observations, sizes):
+    assert sizes == get_shard_sizes(count, observations, 250, 2 ** 20)
+
+
+def test_that_error_is_raised_for_unknown_executor():
+    with pytest.raises(ValueError, match="^expected an executor from .*$"):
+        map_with_executor(abs, [(-1,)], "cluster")
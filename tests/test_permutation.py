@@ -0,0 +1,75 @@
+from utilities.error_calculator import ErrorCalculator
+from utilities.permutation import _draw_permutations
+from utilities.permutation import permutation_importance
+from utilities.permutation import PermutationTester
+from utilities.permutation import permutation_test
+from helpers import generate_data
+import statsmodels.api as sm
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize(
+    ["observations", "coefficients", "seed"],
+    [(20, [1.0], 0), (50, [0.5, -2.0, 0.0], 1), (120, [3.0, 0.1, 1.0, -1.0], 2)],
+)
+def test_importances_match_predicting_on_permuted_columns(observations, coefficients, seed):
+    X, y = generate_data(observations, len(coefficients), seed, coefficients=np.r_[1.0, coefficients])
+    model = sm.OLS(y, X).fit()
+
+    results = permutation_importance(model, permutations=5, seed=seed)
+
+    shard_seed = np.random.SeedSequence(seed).spawn(1)[0]
+    for position, feature in enumerate(model.model.exog_names[1:], start=1):
+        for permutation, rows in enumerate(_draw_permutations(observations, 5, shard_seed)):
+            permuted = X.copy()
+            permuted[:, position] = X[rows, position]
+            calculator = ErrorCalculator(y, model.predict(permuted))
+            expected = calculator.get_mse() - model.ssr / model.nobs
+            assert np.isclose(expected, results.scores[feature][permutation])
+
+
+@pytest.mark.parametrize(
+    ["observations", "coefficients", "seed"],
+    [(30, [1.0], 0), (80, [0.5, -2.0, 0.0], 1)],
+)
+def test_coefficient_statistics_match_freedman_lane_refits(observations, coefficients, seed):
+    X, y = generate_data(observations, len(coefficients), seed, coefficients=np.r_[1.0, coefficients])
+    model = sm.OLS(y, X).fit()
+
+    results = permutation_test(model, permutations=4, seed=seed)
+
+    assert np.allclose(model.tvalues[1:], results.observed)
+
+    shard_seed = np.random.SeedSequence(seed).spawn(1)[0]
+    for position, feature in enumerate(model.model.exog_names[1:], start=1):
+        reduced = sm.OLS(y, np.delete(X, position, axis=1)).fit()
+        for permutation, rows in enumerate(_draw_permutations(observations, 4, shard_seed)):
+            refit = sm.OLS(reduced.fittedvalues + reduced.resid[rows], X).fit()
+            assert np.isclose(refit.tvalues[position], results.statistics[feature][permutation])
+
+
+@pytest.mark.parametrize(["executor"], [["thread"], ["process"]])
+def test_permutations_are_deterministic_across_executors(executor):
+    X, y = generate_data(60, 2, 0, coefficients=[1.0, 1.0, 0.0])
+    tester = PermutationTester(X, y)
+
+    expected = tester.test_coefficients(permutations=600, seed=7)
+    results = tester.test_coefficients(permutations=600, seed=7, executor=executor, max_workers=2)
+
+    assert np.array_equal(expected.statistics, results.statistics)
+    assert ["x1", "x2"] == list(results.statistics.columns)
+
+
+def test_only_informative_features_are_significant():
+    X, y = generate_data(200, 3, 3, coefficients=[1.0, 1.0, 0.0, -0.5])
+    tester = PermutationTester(X, y, ["const", "signal", "noise", "weak"])
+
+    p_values = tester.test_coefficients(permutations=2000, seed=0).get_p_values()
+    summary = tester.get_importances(["noise", "signal"], permutations=2000, seed=0).get_summary()
+
+    assert 1 / 2001 == p_values["signal"]
+    assert p_values["noise"] > 0.05
+    assert p_values["weak"] < 0.05
+    assert ["signal", "noise"] == list(summary.index)
+    assert abs(summary.loc["noise", "importance"]) < summary.loc["noise", "std"]
@@ -1,6 +1,12 @@
+from utilities.plotter import get_sample_indices
+from utilities.plotter import HistogramPlotter
+from utilities.plotter import ScatterPlotter
+from utilities.plotter import get_histogram
 from utilities.plotter import Plotter
 from collections import OrderedDict
+import matplotlib.pyplot as plt
 import numpy as np
+import matplotlib
 import pytest
 
 
@@ -27,3 +33,65 @@ def test_calculation_of_residuals(y, y_hat, residuals, std_residuals):
     for a, b in zip(expected.values(), result.values()):
         assert all(a == b)
 
+
+def _generate_predictions(observations, seed):
+    rng = np.random.default_rng(seed)
+    y_hat = rng.normal(size=observations)
+    return y_hat + rng.standard_t(2, size=observations), y_hat
+
+
+@pytest.mark.parametrize(
+    ["observations", "threshold", "large_data"],
+    [(100, None, False), (100, 50, True), (100_001, None, True)],
+)
+def test_large_data_mode_switches_on_above_threshold(observations, threshold, large_data):
+    y, y_hat = _generate_predictions(observations, 0)
+    plotter = Plotter(y, y_hat, large_data_threshold=threshold)
+    assert large_data == plotter.large_data
+
+
+def test_histogram_counts_every_residual():
+    y, y_hat = _generate_predictions(10_000, 1)
+    counts, edges = get_histogram(y - y_hat)
+    assert 10_000 == counts.sum()
+    assert 101 == edges.size
+
+
+@pytest.mark.parametrize(["sample_size", "extremes"], [(1_000, 50), (5_000, 0)])
+def test_sample_keeps_extremes_and_spans_predictions(sample_size, extremes):
+    y, y_hat = _generate_predictions(200_000, 2)
+    std_residuals = Plotter(y, y_hat).calculations["Standardized Residuals"]
+
+    indices = get_sample_indices(y_hat, std_residuals, sample_size, extremes, seed=3)
+
+    largest = np.argsort(np.abs(std_residuals))[::-1][:extremes]
+    assert set(largest) <= set(indices)
+    assert indices.size <= sample_size
+    assert y_hat[indices].min() < np.quantile(y_hat, 0.01)
+    assert y_hat[indices].max() > np.quantile(y_hat, 0.99)
+
+
+def test_small_inputs_are_not_sampled():
+    y, y_hat = _generate_predictions(300, 4)
+    assert all(np.arange(300) == get_sample_indices(y_hat, y - y_hat, 1_000))
+
+
+@pytest.mark.parametrize(["Constructor", "kwargs"], [
+    (HistogramPlotter, {}),
+    (ScatterPlotter, {"large_data_mode": "sample"}),
+    (ScatterPlotter, {"large_data_mode": "hexbin"}),
+])
+def test_large_data_plots_render(Constructor, kwargs, monkeypatch):
+    matplotlib.use("Agg")
+    monkeypatch.setattr(plt, "show", lambda: None)
+    y, y_hat = _generate_predictions(5_000, 5)
+
+    Constructor(y, y_hat, large_data_threshold=1_000, **kwargs).plot("Model")
+
+    plt.close("all")
+
+
+def test_that_error_is_raised_for_unknown_large_data_mode():
+    y, y_hat = _generate_predictions(10, 6)
+    with pytest.raises(ValueError, match="^expected a large data mode from .*$"):
+        ScatterPlotter(y, y_hat, large_data_mode="kde")
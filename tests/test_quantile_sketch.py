@@ -0,0 +1,69 @@
+from utilities.quantile_sketch import QuantileSketch
+from utilities.quantile_sketch import TurnstileSketch
+import pandas as pd
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize(["q"], [[0.0], [0.25], [0.5], [0.75], [1.0]])
+def test_small_streams_match_pandas_quantiles(q):
+    values = np.random.default_rng(0).normal(size=500)
+    values[::7] = np.nan
+
+    sketch = QuantileSketch()
+    for chunk in np.array_split(values, 9):
+        sketch.update(chunk)
+
+    assert np.isclose(pd.Series(values).quantile(q), sketch.quantile(q))
+
+
+def test_bounded_median_matches_masked_median():
+    values = np.random.default_rng(1).exponential(size=800)
+    sketch = QuantileSketch()
+    sketch.update(values)
+
+    expected = np.median(values[(values > 0.1) & (values < 2.0)])
+
+    assert np.isclose(expected, sketch.median(0.1, 2.0))
+
+
+@pytest.mark.parametrize(["q"], [[0.01], [0.25], [0.5], [0.75], [0.99]])
+def test_large_streams_stay_within_rank_error(q):
+    values = np.random.default_rng(2).lognormal(size=400_000)
+
+    sketch = QuantileSketch(capacity=1024, seed=3)
+    for chunk in np.array_split(values, 40):
+        sketch.update(chunk)
+
+    rank = np.mean(values <= sketch.quantile(q))
+
+    assert sketch.count == values.size
+    assert sum(level.size for level in sketch.levels) < 20 * 1024
+    assert abs(q - rank) < 0.01
+
+
+def test_merged_sketches_match_a_single_sketch():
+    values = np.random.default_rng(4).uniform(size=600)
+    left, right = QuantileSketch(), QuantileSketch()
+    left.update(values[:250])
+    right.update(values[250:])
+
+    left.merge(right)
+
+    assert 600 == left.count
+    assert np.isclose(np.quantile(values, 0.3), left.quantile(0.3))
+
+
+@pytest.mark.parametrize(["q"], [[0.0], [0.25], [0.5], [0.75], [1.0]])
+def test_turnstile_quantiles_track_live_values(q):
+    values = np.random.default_rng(4).integers(0, 40, size=600).astype(float)
+
+    sketch = TurnstileSketch()
+    sketch.insert(values)
+    sketch.delete(values[100:250])
+    sketch.insert(values[100:150])
+
+    live = np.concatenate([values[:150], values[250:]])
+    assert live.size == sketch.count
+    assert np.isclose(pd.Series(live).quantile(q), sketch.quantile(q))
+    assert np.isclose(np.median(live[live > 5]), sketch.median(lower=5))
@@ -0,0 +1,104 @@
+from utilities.model_artifact import export_model
+from utilities.model_artifact import load_model
+from utilities import model_generator
+from utilities.scorer import Scorer
+from helpers import RAW_DATA_PATH
+import statsmodels.api as sm
+import pandas as pd
+import numpy as np
+import pytest
+
+
+MODEL_3_FEATURES = ["years_in_field", "executive_position", "market_value", "engineering_department"]
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    pipeline = model_generator.DataPipeline(RAW_DATA_PATH)
+    df = pipeline.normalized()
+    model_1_features = df.columns.drop([
+        "salary",
+        "prior_experience",
+        "manager_position",
+        "executive_position",
+    ]).tolist()
+    model_2_features = [
+        feature for feature in model_1_features if feature != "years_at_rank"
+    ]
+    models = {
+        "Model 1": model_generator.create_model(df, model_1_features),
+        "Model 2": model_generator.create_model(df, model_2_features),
+        "Model 3": model_generator.create_model(df, MODEL_3_FEATURES),
+    }
+    return pipeline, models
+
+
+def _get_expected(model, raw, statistics):
+    df = model_generator.normalize_data(model_generator.clean_df(raw, statistics))
+    features = list(model.params.index[1:])
+    return model.predict(sm.add_constant(df[features].astype(float), has_constant="add"))
+
+
+@pytest.mark.parametrize("name", ["Model 1", "Model 2", "Model 3"])
+def test_scorer_replays_the_training_pipeline(fitted, name):
+    pipeline, models = fitted
+    raw = pd.read_csv(RAW_DATA_PATH)
+
+    scorer = Scorer.from_model(models[name], pipeline.statistics())
+
+    expected = _get_expected(models[name], pipeline.raw(), pipeline.statistics())
+    assert np.allclose(expected, scorer.predict(raw))
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 1000])
+def test_scorer_handles_unseen_rows_in_blocks(fitted, block_size):
+    pipeline, models = fitted
+    raw = pd.read_csv(RAW_DATA_PATH).sample(50, random_state=0).reset_index(drop=True)
+    raw.loc[0, "yearsworked"] = 10_000
+    raw.loc[1, "market"] = np.nan
+    raw.loc[2, "Field"] = 3
+
+    scorer = Scorer.from_model(models["Model 1"], pipeline.statistics())
+    predictions = scorer.predict(raw, block_size=block_size)
+
+    renamed = raw.rename(columns=model_generator.COLUMN_NAMES)
+    expected = _get_expected(models["Model 1"], renamed, pipeline.statistics())
+    assert np.allclose(expected, predictions)
+
+
+def test_scorer_accepts_artifacts_and_column_mappings(fitted, tmp_path):
+    pipeline, models = fitted
+    export_model(models["Model 3"], tmp_path, pipeline.statistics())
+    raw = pd.read_csv(RAW_DATA_PATH)
+    columns = {name: raw[name].to_numpy() for name in raw.columns}
+
+    from_artifact = Scorer(load_model(tmp_path)).predict(columns)
+    from_model = Scorer.from_model(models["Model 3"], pipeline.statistics()).predict(raw)
+
+    assert np.allclose(from_model, from_artifact)
+
+
+def test_scorer_predicts_salaries(fitted):
+    pipeline, models = fitted
+    raw = pd.read_csv(RAW_DATA_PATH)
+
+    scorer = Scorer.from_model(models["Model 2"], pipeline.statistics())
+
+    expected = np.exp(scorer.predict(raw)) - model_generator.LOG_SHIFT
+    assert np.allclose(expected, scorer.predict_salary(raw))
+
+
+def test_scorer_rejects_ragged_columns(fitted):
+    pipeline, models = fitted
+    scorer = Scorer.from_model(models["Model 3"], pipeline.statistics())
+
+    with pytest.raises(ValueError):
+        scorer.predict({"yearsworked": np.ones(3), "market": np.ones(4)})
+
+
+def test_scorer_lists_the_raw_columns_it_reads(fitted):
+    pipeline, models = fitted
+    scorer = Scorer.from_model(models["Model 3"], pipeline.statistics())
+
+    expected = ["years_in_field", "employee_position", "market_value", "field_of_work"]
+    assert expected == scorer.columns
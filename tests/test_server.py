@@ -0,0 +1,200 @@
+from utilities.server import handle_connection
+from utilities.server import ServerMetrics
+from utilities.server import MicroBatcher
+from utilities.server import load_scorers
+from utilities import model_generator
+from utilities.scorer import Scorer
+from helpers import RAW_DATA_PATH
+import pandas as pd
+import numpy as np
+import asyncio
+import pytest
+import json
+
+
+FEATURES = ["years_in_field", "executive_position", "market_value", "engineering_department"]
+
+
+@pytest.fixture(scope="module")
+def scorers():
+    pipeline = model_generator.DataPipeline(RAW_DATA_PATH)
+    model = model_generator.create_model(pipeline.normalized(), FEATURES)
+    return {"Model 3": Scorer.from_model(model, pipeline.statistics())}
+
+
+@pytest.fixture(scope="module")
+def raw():
+    return pd.read_csv(RAW_DATA_PATH).head(40)
+
+
+def _get_columns(raw, start, stop):
+    return {name: raw[name].iloc[start:stop].tolist() for name in raw.columns}
+
+
+async def _predict_concurrently(scorers, raw, requests, **options):
+    batcher = MicroBatcher(scorers, **options)
+    await batcher.start()
+    try:
+        predictions = await asyncio.gather(*[
+            batcher.predict("Model 3", _get_columns(raw, index, index + 2))
+            for index in range(0, 2 * requests, 2)
+        ])
+    finally:
+        await batcher.stop()
+    return predictions, batcher.metrics.snapshot()
+
+
+def test_batcher_coalesces_concurrent_requests(scorers, raw):
+    predictions, metrics = asyncio.run(
+        _predict_concurrently(scorers, raw, 10, max_wait=0.05)
+    )
+
+    expected = scorers["Model 3"].predict(raw.head(20))
+    assert np.allclose(expected, np.concatenate(predictions))
+    assert 1 == metrics["batches"]
+    assert 10 == metrics["requests"]
+    assert 20 == metrics["rows"]
+
+
+@pytest.mark.parametrize("max_batch_size, batches", [(2, 10), (4, 5), (20, 1)])
+def test_batcher_respects_max_batch_size(scorers, raw, max_batch_size, batches):
+    _, metrics = asyncio.run(_predict_concurrently(
+        scorers, raw, 10, max_batch_size=max_batch_size, max_wait=0.05
+    ))
+
+    assert batches == metrics["batches"]
+
+
+@pytest.mark.parametrize("model_name, columns", [
+    ("Model 9", {"yearsworked": [1.0]}),
+    ("Model 3", {"yearsworked": [1.0]}),
+])
+def test_batcher_rejects_invalid_requests(scorers, model_name, columns):
+    async def predict():
+        batcher = MicroBatcher(scorers)
+        await batcher.start()
+        try:
+            await batcher.predict(model_name, columns)
+        finally:
+            await batcher.stop()
+
+    with pytest.raises(ValueError):
+        asyncio.run(predict())
+
+
+async def _send(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n"
+        f"Connection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+
+    response = await reader.read()
+    writer.close()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+async def _send_raw(port, data):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(data)
+    await writer.drain()
+
+    response = await reader.read()
+    writer.close()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+async def _exchange(scorers, requests):
+    batcher = MicroBatcher(scorers)
+    await batcher.start()
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(reader, writer, batcher),
+        "127.0.0.1",
+        0,
+    )
+    port = server.sockets[0].getsockname()[1]
+    try:
+        return [
+            await (_send_raw(port, request) if isinstance(request, bytes) else _send(port, *request))
+            for request in requests
+        ]
+    finally:
+        server.close()
+        await server.wait_closed()
+        await batcher.stop()
+
+
+def test_server_answers_predictions_and_metrics(scorers, raw):
+    rows = raw.head(3).to_dict(orient="records")
+    responses = asyncio.run(_exchange(scorers, [
+        ("POST", "/predict", {"model": "Model 3", "rows": rows}),
+        ("POST", "/predict", {"model": "Model 3", "columns": _get_columns(raw, 0, 3)}),
+        ("POST", "/predict", {"model": "Model 9", "rows": rows}),
+        ("GET", "/metrics"),
+        ("GET", "/missing"),
+    ]))
+
+    expected = scorers["Model 3"].predict(raw.head(3))
+    (status_1, by_rows), (status_2, by_columns) = responses[:2]
+    assert (200, 200) == (status_1, status_2)
+    assert np.allclose(expected, by_rows["predictions"])
+    assert np.allclose(expected, by_columns["predictions"])
+    assert np.allclose(np.exp(expected) - 0.001, by_rows["salaries"])
+
+    status, metrics = responses[3]
+    assert 400 == responses[2][0]
+    assert 200 == status
+    assert 2 == metrics["requests"]
+    assert 1 == metrics["errors"]
+    assert 404 == responses[4][0]
+
+
+class _FailingScorer:
+
+    def __init__(self, scorer):
+        self.columns = scorer.columns
+        self.log_shift = scorer.log_shift
+
+    def predict(self, columns):
+        raise RuntimeError("scorer failed")
+
+
+def test_server_reports_failures_once_and_keeps_serving(scorers, raw):
+    failing = {"Model 3": _FailingScorer(scorers["Model 3"])}
+    rows = raw.head(3).to_dict(orient="records")
+    responses = asyncio.run(_exchange(failing, [
+        ("POST", "/predict", {"model": "Model 3", "rows": rows}),
+        b"GARBAGE\r\n\r\n",
+        ("GET", "/metrics"),
+    ]))
+
+    (failed, error), (malformed, _), (_, metrics) = responses
+    assert 500 == failed
+    assert "RuntimeError: scorer failed" == error["error"]
+    assert 400 == malformed
+    assert 2 == metrics["errors"]
+
+
+def test_latencies_are_buffered_until_a_snapshot():
+    metrics = ServerMetrics()
+    for seconds in [0.001, 0.002, 0.003]:
+        metrics.record_latency(seconds)
+
+    assert 0 == metrics.latencies.count
+    assert np.isclose(0.002, metrics.snapshot()["latency_p50_seconds"])
+    assert 3 == metrics.latencies.count
+
+
+def test_loading_scorers_leaves_the_shared_pipeline_alone():
+    path = model_generator.PIPELINE.path
+
+    scorers = load_scorers(RAW_DATA_PATH)
+
+    assert ["Model 1", "Model 2", "Model 3"] == list(scorers)
+    assert path == model_generator.PIPELINE.path
@@ -0,0 +1,41 @@
+from utilities.stream_cleaner import get_streaming_cleaning_statistics
+from utilities.model_generator import get_cleaning_statistics
+from utilities.stream_cleaner import stream_clean_df
+from utilities import model_generator
+from helpers import RAW_DATA_PATH
+import pandas as pd
+import numpy as np
+import pytest
+
+
+def _clean_in_memory(path):
+    df = model_generator.read_in_df(path)
+    return model_generator.normalize_data(model_generator.clean_df(df))
+
+
+@pytest.mark.parametrize(["chunksize"], [[50], [128], [10_000]])
+def test_streamed_chunks_match_in_memory_cleaning(chunksize):
+    expected = _clean_in_memory(RAW_DATA_PATH)
+    streamed = pd.concat(stream_clean_df(RAW_DATA_PATH, chunksize))
+    pd.testing.assert_frame_equal(expected, streamed)
+
+
+def test_streamed_statistics_match_in_memory_statistics():
+    df = model_generator.read_in_df(RAW_DATA_PATH)
+    expected = get_cleaning_statistics(df)
+
+    statistics = get_streaming_cleaning_statistics(RAW_DATA_PATH, 100)
+
+    assert np.isclose(expected["salary_median"], statistics["salary_median"])
+    for key in ["lower_bound", "upper_bound", "medians"]:
+        pd.testing.assert_series_equal(expected[key], statistics[key], check_names=False)
+
+
+def test_chunks_missing_a_category_keep_every_dummy_column(tmp_path):
+    path = tmp_path / "salary_raw.csv"
+    raw = pd.read_csv(RAW_DATA_PATH)
+    raw.sort_values("Field").to_csv(path, index=False)
+
+    chunks = list(stream_clean_df(path, 100))
+
+    assert all(list(chunks[0].columns) == list(chunk.columns) for chunk in chunks)
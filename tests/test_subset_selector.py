@@ -0,0 +1,97 @@
+from utilities.subset_selector import _update_cholesky
+from utilities.subset_selector import SubsetSelector
+from utilities.cross_validator import CrossValidator
+from itertools import combinations
+import statsmodels.api as sm
+import pandas as pd
+import numpy as np
+import pytest
+
+
+def _generate_df(observations, features, informative, seed):
+    rng = np.random.default_rng(seed)
+    values = rng.normal(size=(observations, features))
+    weights = np.zeros(features)
+    weights[:informative] = rng.uniform(1, 2, size=informative)
+    columns = [f"feature_{index}" for index in range(features)]
+    df = pd.DataFrame(values, columns=columns)
+    df["salary"] = values @ weights + rng.normal(size=observations)
+    return df
+
+
+def _fit(df, features):
+    X = sm.add_constant(df[list(features)], has_constant="add")
+    return sm.OLS(df["salary"], X).fit()
+
+
+def _brute_force(df, features, criterion):
+    scores = {}
+    for size in range(len(features) + 1):
+        for subset in combinations(features, size):
+            scores[subset] = criterion(df, subset)
+    return list(min(scores, key=scores.get))
+
+
+def _press(df, features):
+    X = sm.add_constant(df[list(features)], has_constant="add")
+    return CrossValidator(X, df["salary"]).get_press()
+
+
+CRITERIA = {
+    "aic": lambda df, features: _fit(df, features).aic,
+    "bic": lambda df, features: _fit(df, features).bic,
+    "adjusted_r2": lambda df, features: -_fit(df, features).rsquared_adj,
+    "press": _press,
+}
+
+
+@pytest.mark.parametrize(["criterion"], [["aic"], ["bic"], ["adjusted_r2"], ["press"]])
+def test_best_subset_matches_exhaustive_refitting(criterion):
+    df = _generate_df(60, 6, 3, 0)
+    features = list(df.columns.drop("salary"))
+
+    selector = SubsetSelector(df, features, criterion)
+    expected = _brute_force(df, features, CRITERIA[criterion])
+
+    assert expected == selector.best_subset()
+
+
+@pytest.mark.parametrize(["criterion"], [["aic"], ["bic"], ["adjusted_r2"], ["press"]])
+def test_scores_match_statsmodels(criterion):
+    df = _generate_df(40, 4, 2, 1)
+    features = ["feature_0", "feature_2", "feature_3"]
+
+    selector = SubsetSelector(df, df.columns.drop("salary"), criterion)
+    expected = CRITERIA[criterion](df, features)
+
+    assert np.isclose(expected, selector.score(features))
+
+
+@pytest.mark.parametrize(["method"], [["forward"], ["backward"], ["best_subset"]])
+def test_search_recovers_informative_features(method):
+    df = _generate_df(500, 8, 3, 2)
+    selector = SubsetSelector(df, df.columns.drop("salary"), "bic")
+    features = getattr(selector, method)()
+    assert ["feature_0", "feature_1", "feature_2"] == features
+
+
+def test_custom_criterion_is_used_without_pruning():
+    df = _generate_df(50, 4, 2, 3)
+
+    def fewest_parameters(rss, parameters, observations, total_sum_of_squares):
+        return parameters
+
+    selector = SubsetSelector(df, df.columns.drop("salary"), fewest_parameters)
+    assert [] == selector.best_subset()
+
+
+def test_that_error_is_raised_for_unknown_criterion():
+    df = _generate_df(20, 2, 1, 4)
+    with pytest.raises(ValueError, match="^expected a criterion from .*$"):
+        SubsetSelector(df, df.columns.drop("salary"), "mallows")
+
+
+def test_that_error_is_raised_for_a_rank_deficient_factor():
+    lower = np.array([[0.0, 0.0], [1.0, 1.0]])
+    with pytest.raises(ValueError, match="^expected features that are not perfectly collinear$"):
+        _update_cholesky(lower, np.array([1.0, 1.0]))
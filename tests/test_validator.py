@@ -1,4 +1,5 @@
 from utilities.influence_calculator import InfluenceCalculator
+from utilities.error_calculator import BatchErrorCalculator
 from utilities.error_calculator import ErrorCalculator
 from utilities.plotter import Plotter
 import statsmodels.api as sm
@@ -104,3 +105,20 @@ def test_that_fitted_least_squares_models_work(algorithm):
 def test_that_constructor_is_passed_a_fitted_model(arg):
     with pytest.raises(TypeError, match="^.* fitted model .* 'statsmodels'$"):
         InfluenceCalculator(arg)
+
+
+@pytest.mark.parametrize(
+    ["y", "y_hats", "model_names", "match"],
+    [
+        ([1, 2], np.ones((2, 2)), None, "^.* numpy array .* parameter y$"),
+        (np.ones(2), [[1, 2]], None, "^.* numpy array .* parameter y_hats$"),
+        (np.ones((2, 1)), np.ones((2, 2)), None, "^.* 1 dimension .* parameter y$"),
+        (np.ones(2), np.ones(2), None, "^.* 2 dimensions .* parameter y_hats$"),
+        (np.ones(3), np.ones((2, 2)), None, "^.* equal observations .* parameter y & y_hats$"),
+        (np.ones(1), np.ones((2, 1)), None, "^.* more than 2 values .* parameter y & y_hats$"),
+        (np.ones(2), np.ones((2, 2)), ["a"], "^.* a name per model .* parameter model_names$"),
+    ],
+)
+def test_that_error_is_raised_for_invalid_batches(y, y_hats, model_names, match):
+    with pytest.raises(TypeError, match=match):
+        BatchErrorCalculator(y, y_hats, model_names)